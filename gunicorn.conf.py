@@ -0,0 +1,46 @@
+"""
+Gunicorn Configuration
+Production server settings for the AMTD API
+
+Run with: gunicorn -c gunicorn.conf.py src.api.wsgi:app
+"""
+
+import os
+import multiprocessing
+
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('API_PORT', '5000')}"
+
+# Requests mostly wait on PostgreSQL. gevent workers multiplex many requests
+# per process over cooperative sockets; 'gthread' is the fallback
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gevent')
+
+if worker_class == 'gevent':
+    workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+    worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+else:
+    workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+    threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 60))
+keepalive = 5
+
+# Recycle workers periodically to bound memory growth
+max_requests = 1000
+max_requests_jitter = 100
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'info').lower()
+
+
+def worker_exit(server, worker):
+    """Close pooled database connections when a worker shuts down"""
+    from src.api.database import db
+    db.close()
+
+
+def post_fork(server, worker):
+    """Make psycopg2 yield to other greenlets while waiting on the database"""
+    if worker_class == 'gevent':
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
@@ -5,81 +5,215 @@ Creates GitHub issues for scan results
 """
 
 import sys
-import json
+import asyncio
+import hashlib
 import logging
+import sqlite3
 import argparse
+from datetime import datetime
 from pathlib import Path
+from typing import Dict, Any, Iterable, List, Set
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from notification_service import GitHubNotifier
+from results_io import load_results
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_FILE = Path(__file__).parent.parent / 'data' / 'github-issue-cache.db'
 
-def create_issues_from_results(
-    results_file: str,
-    severity_filter: list,
+# Stay well below SQLite's bound-parameter limit
+CACHE_LOOKUP_CHUNK = 500
+
+
+def _issue_key(vuln: Dict[str, Any]) -> str:
+    """Content key identifying the issue raised for a vulnerability"""
+    identity = (
+        f"{vuln.get('name', '')}|{vuln.get('url', '')}|"
+        f"{vuln.get('parameter', '')}|{vuln.get('cwe_id', '')}"
+    )
+    return hashlib.blake2b(identity.encode(), digest_size=16).hexdigest()
+
+
+def open_issue_cache(cache_file: str) -> sqlite3.Connection:
+    """
+    Open the local issue cache, creating it if needed
+
+    Args:
+        cache_file: Path to the SQLite cache file
+
+    Returns:
+        Open SQLite connection
+    """
+    Path(cache_file).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_file)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS issue_cache (
+            key TEXT PRIMARY KEY,
+            issue_number INTEGER,
+            created_at TIMESTAMP
+        )
+        """
+    )
+    return conn
+
+
+def cached_keys(conn: sqlite3.Connection, keys: List[str]) -> Set[str]:
+    """
+    Return the subset of keys that already have an issue
+
+    Args:
+        conn: Issue cache connection
+        keys: Issue keys to look up
+
+    Returns:
+        Set of keys present in the cache
+    """
+    found = set()
+    for start in range(0, len(keys), CACHE_LOOKUP_CHUNK):
+        chunk = keys[start:start + CACHE_LOOKUP_CHUNK]
+        placeholders = ','.join('?' * len(chunk))
+        rows = conn.execute(
+            f"SELECT key FROM issue_cache WHERE key IN ({placeholders})",
+            chunk
+        )
+        found.update(row[0] for row in rows)
+    return found
+
+
+def remember_issues(conn: sqlite3.Connection, created_issues: Iterable[Dict[str, Any]]):
+    """
+    Record newly created issues in the cache
+
+    Args:
+        conn: Issue cache connection
+        created_issues: Entries with 'vulnerability' and 'number' keys
+    """
+    now = datetime.utcnow()
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO issue_cache (key, issue_number, created_at) VALUES (?, ?, ?)",
+            [(_issue_key(entry['vulnerability']), entry['number'], now)
+             for entry in created_issues]
+        )
+
+
+async def create_issues_async(
+    results: Dict[str, Any],
+    severity_filter: Iterable[str],
     dry_run: bool,
-    labels: list
+    labels: list,
+    cache_file: str = str(DEFAULT_CACHE_FILE)
 ) -> bool:
     """
-    Create GitHub issues from scan results
+    Create GitHub issues for already-loaded scan results
 
     Args:
-        results_file: Path to scan results JSON file
-        severity_filter: List of severities to create issues for
+        results: Parsed scan results
+        severity_filter: Severities to create issues for
         dry_run: If True, don't actually create issues
         labels: Additional labels to add
+        cache_file: SQLite cache of issues already created
 
     Returns:
         True if successful
     """
-    try:
-        # Load results
-        with open(results_file, 'r') as f:
-            results = json.load(f)
+    scan_info = results.get('scan_info', {})
+    vulnerabilities = results.get('vulnerabilities', [])
 
-        scan_info = results.get('scan_info', {})
-        vulnerabilities = results.get('vulnerabilities', [])
+    logger.info("Total vulnerabilities: %s", len(vulnerabilities))
+    logger.info("Severity filter: %s", severity_filter)
 
-        logger.info(f"Creating GitHub issues from {results_file}")
-        logger.info(f"Total vulnerabilities: {len(vulnerabilities)}")
-        logger.info(f"Severity filter: {severity_filter}")
+    # Filter once here so only matching vulnerabilities reach the cache and notifier
+    severities = frozenset(s.lower() for s in severity_filter)
+    vulnerabilities = [
+        v for v in vulnerabilities
+        if v.get('severity', 'info').lower() in severities
+    ]
 
-        # Initialize GitHub notifier
-        notifier = GitHubNotifier()
+    # Initialize GitHub notifier
+    notifier = GitHubNotifier()
 
-        # Test connection
-        if not notifier.test_connection():
-            logger.error("Failed to connect to GitHub API")
-            return False
+    # Test connection
+    if not await asyncio.to_thread(notifier.test_connection):
+        logger.error("Failed to connect to GitHub API")
+        return False
 
-        # Create issues
-        result = notifier.create_issues_for_vulnerabilities(
-            vulnerabilities=vulnerabilities,
+    # Skip vulnerabilities that already have an issue without asking GitHub
+    cache = open_issue_cache(cache_file)
+    try:
+        keys = [_issue_key(v) for v in vulnerabilities]
+        known = cached_keys(cache, keys)
+        pending = [v for v, key in zip(vulnerabilities, keys) if key not in known]
+        logger.info("Issue cache hits: %s", len(vulnerabilities) - len(pending))
+
+        # Create issues concurrently
+        result = await notifier.create_issues_for_vulnerabilities_async(
+            vulnerabilities=pending,
             scan_info=scan_info,
-            severity_filter=severity_filter,
+            severity_filter=severities,
             labels=labels,
             dry_run=dry_run
         )
 
-        logger.info("GitHub issue creation complete:")
-        logger.info(f"  - Created: {result['created']}")
-        logger.info(f"  - Skipped: {result['skipped']}")
-        logger.info(f"  - Total processed: {result['total']}")
+        if result.get('created_issues'):
+            remember_issues(cache, result['created_issues'])
+    finally:
+        cache.close()
+
+    logger.info("GitHub issue creation complete:")
+    logger.info("  - Created: %s", result['created'])
+    logger.info("  - Skipped: %s", result['skipped'] + len(known))
+    logger.info("  - Total processed: %s", result['total'])
+
+    if result.get('errors'):
+        logger.warning("  - Errors: %s", len(result['errors']))
+        for error in result['errors'][:5]:  # Show first 5 errors
+            logger.warning("    %s", error)
+
+    return True
 
-        if result.get('errors'):
-            logger.warning(f"  - Errors: {len(result['errors'])}")
-            for error in result['errors'][:5]:  # Show first 5 errors
-                logger.warning(f"    {error}")
 
-        return True
+def create_issues_from_results(
+    results_file: str,
+    severity_filter: list,
+    dry_run: bool,
+    labels: list,
+    cache_file: str = str(DEFAULT_CACHE_FILE)
+) -> bool:
+    """
+    Create GitHub issues from scan results
+
+    Args:
+        results_file: Path to scan results JSON file
+        severity_filter: List of severities to create issues for
+        dry_run: If True, don't actually create issues
+        labels: Additional labels to add
+        cache_file: SQLite cache of issues already created
+
+    Returns:
+        True if successful
+    """
+    try:
+        # Load results
+        results = load_results(results_file)
+
+        logger.info("Creating GitHub issues from %s", results_file)
+
+        return asyncio.run(create_issues_async(
+            results, severity_filter, dry_run, labels, cache_file
+        ))
+
+    except FileNotFoundError:
+        logger.error("Results file not found: %s", results_file)
+        return False
 
     except Exception as e:
-        logger.error(f"Failed to create GitHub issues: {e}")
+        logger.error("Failed to create GitHub issues: %s", e)
         return False
 
 
@@ -107,6 +241,11 @@ def main():
         action='store_true',
         help='Dry run - don\'t actually create issues'
     )
+    parser.add_argument(
+        '--cache-file',
+        default=str(DEFAULT_CACHE_FILE),
+        help='SQLite cache of previously created issues'
+    )
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
 
     args = parser.parse_args()
@@ -114,11 +253,6 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # Verify file exists
-    if not Path(args.results_file).exists():
-        logger.error(f"Results file not found: {args.results_file}")
-        sys.exit(1)
-
     if args.dry_run:
         logger.info("DRY RUN MODE - No issues will be created")
 
@@ -127,7 +261,8 @@ def main():
         args.results_file,
         args.severity,
         args.dry_run,
-        args.labels
+        args.labels,
+        args.cache_file
     )
 
     sys.exit(0 if success else 1)
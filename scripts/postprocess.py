@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Post-process Scan Results
+Stores results, records metrics and creates GitHub issues from one load
+of the results file
+"""
+
+import sys
+import asyncio
+import logging
+import argparse
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Any, List
+
+from results_io import load_results
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SCRIPTS_DIR = Path(__file__).parent
+
+
+def _load_script(name: str) -> ModuleType:
+    """
+    Import one of the hyphenated CLI scripts as a module
+
+    Args:
+        name: Script file name without the .py suffix
+
+    Returns:
+        Loaded module
+    """
+    spec = importlib.util.spec_from_file_location(
+        name.replace('-', '_'),
+        SCRIPTS_DIR / f"{name}.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+async def postprocess(
+    results: Dict[str, Any],
+    application_name: str,
+    severity_filter: List[str],
+    labels: List[str],
+    dry_run: bool = False,
+    create_issues: bool = True,
+    cache_file: str = None
+) -> bool:
+    """
+    Run the post-scan steps concurrently
+
+    Storing results and recording metrics share the database and run in
+    order on a worker thread, since metrics reference the stored scan.
+    GitHub issue creation runs alongside them on the event loop.
+
+    Args:
+        results: Parsed scan results
+        application_name: Application name
+        severity_filter: Severities to create issues for
+        labels: Additional labels to add to issues
+        dry_run: If True, don't actually create issues
+        create_issues: Whether to create GitHub issues at all
+        cache_file: SQLite cache of issues already created
+
+    Returns:
+        True if every step succeeded
+    """
+    store_results = _load_script('store-results')
+    record_metrics = _load_script('record-metrics')
+
+    def store_and_record() -> bool:
+        scan_id = store_results.store_results(
+            results.get('scan_info', {}),
+            results.get('statistics', {}),
+            results.get('vulnerabilities', []),
+            application_name
+        )
+        return record_metrics.record_metrics(results, application_name, scan_id)
+
+    steps = {'database': asyncio.to_thread(store_and_record)}
+
+    if create_issues:
+        github_issues = _load_script('create-github-issues')
+        issue_kwargs = {'cache_file': cache_file} if cache_file else {}
+        steps['github'] = github_issues.create_issues_async(
+            results, severity_filter, dry_run, labels, **issue_kwargs
+        )
+
+    outcomes = await asyncio.gather(*steps.values(), return_exceptions=True)
+
+    success = True
+    for step, outcome in zip(steps, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error("Post-processing step '%s' failed: %s", step, outcome)
+            success = False
+        elif not outcome:
+            logger.error("Post-processing step '%s' did not complete", step)
+            success = False
+
+    return success
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Store results, record metrics and create GitHub issues for a scan'
+    )
+    parser.add_argument('results_file', help='Path to scan results JSON file')
+    parser.add_argument('--application', '-a', required=True, help='Application name')
+    parser.add_argument(
+        '--severity',
+        '-s',
+        nargs='+',
+        default=['critical', 'high'],
+        choices=['critical', 'high', 'medium', 'low', 'info'],
+        help='Severity levels to create issues for (default: critical high)'
+    )
+    parser.add_argument(
+        '--labels',
+        '-l',
+        nargs='+',
+        default=['security', 'automated'],
+        help='Additional labels to add to issues'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Dry run - don\'t actually create issues'
+    )
+    parser.add_argument(
+        '--skip-issues',
+        action='store_true',
+        help='Don\'t create GitHub issues'
+    )
+    parser.add_argument('--cache-file', help='SQLite cache of previously created issues')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    try:
+        results = load_results(args.results_file)
+    except FileNotFoundError:
+        logger.error("Results file not found: %s", args.results_file)
+        sys.exit(1)
+
+    success = asyncio.run(postprocess(
+        results,
+        args.application,
+        args.severity,
+        args.labels,
+        dry_run=args.dry_run,
+        create_issues=not args.skip_issues,
+        cache_file=args.cache_file
+    ))
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,20 +5,100 @@ Records scan metrics to the metrics table for historical tracking
 """
 
 import sys
-import json
 import logging
 import argparse
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, Any, Optional
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from api.database import db
+from results_io import load_results
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Column order of the row tuples passed to insert_many
+METRIC_COLUMNS = ('scan_id', 'application_id', 'metric_name', 'metric_type', 'value', 'recorded_at')
+
+
+def record_metrics(
+    results: Dict[str, Any],
+    application_name: str,
+    scan_id: Optional[str] = None
+) -> bool:
+    """
+    Record metrics for already-loaded scan results
+
+    Args:
+        results: Parsed scan results
+        application_name: Application name
+        scan_id: Scan ID (optional, defaults to the latest scan)
+
+    Returns:
+        True if recorded, False if the application does not exist
+    """
+    scan_info = results.get('scan_info', {})
+    statistics = results.get('statistics', {})
+
+    logger.info("Recording metrics for application: %s", application_name)
+
+    if scan_id:
+        # Only the application is needed
+        row = db.execute_one(
+            "SELECT id AS application_id FROM applications WHERE name = %s",
+            (application_name,)
+        )
+    else:
+        # Application and its latest scan in a single round-trip
+        row = db.execute_one(
+            """
+            SELECT a.id AS application_id, s.id AS scan_id
+            FROM applications a
+            LEFT JOIN LATERAL (
+                SELECT id FROM scans
+                WHERE application_id = a.id
+                ORDER BY started_at DESC
+                LIMIT 1
+            ) s ON true
+            WHERE a.name = %s
+            """,
+            (application_name,)
+        )
+
+    if not row:
+        logger.error("Application not found: %s", application_name)
+        return False
+
+    application_id = row['application_id']
+    if not scan_id:
+        scan_id = row['scan_id']
+
+    # Record metrics
+    metrics = [
+        ('vulnerability_count', 'critical', statistics.get('critical', 0)),
+        ('vulnerability_count', 'high', statistics.get('high', 0)),
+        ('vulnerability_count', 'medium', statistics.get('medium', 0)),
+        ('vulnerability_count', 'low', statistics.get('low', 0)),
+        ('vulnerability_count', 'info', statistics.get('info', 0)),
+        ('vulnerability_count', 'total', statistics.get('total', 0)),
+        ('scan_duration', 'seconds', scan_info.get('duration', 0))
+    ]
+
+    # One timestamp for the whole batch
+    recorded_at = datetime.utcnow()
+
+    rows = [
+        (scan_id, application_id, metric_name, metric_type, float(value), recorded_at)
+        for metric_name, metric_type, value in metrics
+    ]
+    db.insert_many('metrics', METRIC_COLUMNS, rows)
+
+    logger.info("Recorded %s metrics", len(metrics))
+    return True
+
 
 def record_scan_metrics(
     results_file: str,
@@ -38,74 +118,20 @@ def record_scan_metrics(
     """
     try:
         # Load results
-        with open(results_file, 'r') as f:
-            results = json.load(f)
-
-        scan_info = results.get('scan_info', {})
-        statistics = results.get('statistics', {})
-
-        logger.info(f"Recording metrics for application: {application_name}")
+        results = load_results(results_file)
 
-        # Get application
-        application = db.execute_one(
-            "SELECT * FROM applications WHERE name = %s",
-            (application_name,)
-        )
-
-        if not application:
-            logger.error(f"Application not found: {application_name}")
-            return False
+        return record_metrics(results, application_name, scan_id)
 
-        application_id = application['id']
-
-        # Get scan ID if provided
-        if not scan_id:
-            # Get latest scan for this application
-            latest_scan = db.execute_one(
-                """
-                SELECT id FROM scans
-                WHERE application_id = %s
-                ORDER BY started_at DESC
-                LIMIT 1
-                """,
-                (application_id,)
-            )
-            if latest_scan:
-                scan_id = latest_scan['id']
-
-        # Record metrics
-        metrics = [
-            ('vulnerability_count', 'critical', statistics.get('critical', 0)),
-            ('vulnerability_count', 'high', statistics.get('high', 0)),
-            ('vulnerability_count', 'medium', statistics.get('medium', 0)),
-            ('vulnerability_count', 'low', statistics.get('low', 0)),
-            ('vulnerability_count', 'info', statistics.get('info', 0)),
-            ('vulnerability_count', 'total', statistics.get('total', 0)),
-            ('scan_duration', 'seconds', scan_info.get('duration', 0))
-        ]
-
-        for metric_name, metric_type, value in metrics:
-            try:
-                db.insert('metrics', {
-                    'scan_id': scan_id,
-                    'application_id': application_id,
-                    'metric_name': metric_name,
-                    'metric_type': metric_type,
-                    'value': float(value),
-                    'recorded_at': datetime.utcnow()
-                })
-            except Exception as e:
-                logger.warning(f"Failed to record metric {metric_name}: {e}")
-
-        logger.info(f"Recorded {len(metrics)} metrics")
-        return True
+    except FileNotFoundError:
+        logger.error("Results file not found: %s", results_file)
+        return False
 
     except Exception as e:
-        logger.error(f"Failed to record metrics: {e}")
+        logger.error("Failed to record metrics: %s", e)
         return False
 
 
-def main():
+def main(argv=None):
     """Main function"""
     parser = argparse.ArgumentParser(description='Record scan metrics to database')
     parser.add_argument('results_file', help='Path to scan results JSON file')
@@ -113,25 +139,15 @@ def main():
     parser.add_argument('--scan-id', '-s', help='Scan ID (optional)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # Verify file exists
-    if not Path(args.results_file).exists():
-        logger.error(f"Results file not found: {args.results_file}")
-        sys.exit(1)
-
-    # Test database connection
-    if not db.test_connection():
-        logger.error("Failed to connect to database")
-        sys.exit(1)
-
     # Record metrics
     success = record_scan_metrics(
         args.results_file,
-        args.application_name,
+        args.application,
         args.scan_id
     )
 
@@ -0,0 +1,125 @@
+"""
+Scan Results I/O
+Shared helpers for reading and writing scan result JSON files
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Any, Iterator, Sequence
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Sidecar files are optional
+    msgpack = None
+
+try:
+    import ijson
+except ImportError:  # Streaming is optional; fall back to a full load
+    ijson = None
+
+
+def _sidecar_path(results_file: str) -> Path:
+    """Path of the msgpack sidecar written next to a results file"""
+    return Path(results_file).with_suffix('.msgpack')
+
+
+def load_results(results_file: str) -> Dict[str, Any]:
+    """
+    Load scan results from a JSON file
+
+    A msgpack sidecar written by save_results is preferred when it is at
+    least as new as the JSON file, since it decodes considerably faster.
+
+    Args:
+        results_file: Path to scan results JSON file
+
+    Returns:
+        Parsed scan results
+    """
+    if msgpack is not None:
+        sidecar = _sidecar_path(results_file)
+        try:
+            if sidecar.stat().st_mtime_ns >= Path(results_file).stat().st_mtime_ns:
+                return msgpack.unpackb(sidecar.read_bytes())
+        except FileNotFoundError:
+            pass
+
+    if orjson is not None:
+        with open(results_file, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(results_file, 'rb') as f:
+        return json.load(f)
+
+
+def save_results(results: Dict[str, Any], results_file: str):
+    """
+    Write scan results to a JSON file
+
+    When msgpack is available a binary sidecar with the same content is
+    written alongside, so downstream scripts can skip JSON parsing.
+
+    Args:
+        results: Scan results dictionary
+        results_file: Destination path
+    """
+    if orjson is not None:
+        with open(results_file, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(results_file, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if msgpack is not None:
+        _sidecar_path(results_file).write_bytes(msgpack.packb(results))
+
+
+def load_sections(results_file: str, keys: Sequence[str]) -> Dict[str, Any]:
+    """
+    Load selected top-level sections of a results file
+
+    With ijson available only the requested objects are built, so large
+    sections such as ``vulnerabilities`` are never held in memory.
+
+    Args:
+        results_file: Path to scan results JSON file
+        keys: Top-level keys to load
+
+    Returns:
+        Dictionary of the requested sections that are present
+    """
+    if ijson is None:
+        results = load_results(results_file)
+        return {key: results[key] for key in keys if key in results}
+
+    sections = {}
+    for key in keys:
+        with open(results_file, 'rb') as f:
+            for value in ijson.items(f, key, use_float=True):
+                sections[key] = value
+                break
+
+    return sections
+
+
+def iter_vulnerabilities(results_file: str) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the vulnerabilities in a results file one at a time
+
+    Args:
+        results_file: Path to scan results JSON file
+
+    Yields:
+        Vulnerability dictionaries
+    """
+    if ijson is None:
+        yield from load_results(results_file).get('vulnerabilities', [])
+        return
+
+    with open(results_file, 'rb') as f:
+        yield from ijson.items(f, 'vulnerabilities.item', use_float=True)
@@ -7,29 +7,177 @@ Main script to execute security scans on configured applications
 import sys
 import os
 import json
+import hashlib
 import logging
+import logging.handlers
 import argparse
+import subprocess
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, Any, Optional
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library
+    orjson = None
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config_manager import ConfigManager
 from src.scan_manager import ScanExecutor
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('logs/scan-executor.log')
-    ]
-)
+from results_io import load_sections, save_results
 
 logger = logging.getLogger(__name__)
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_FILE = Path('logs') / 'scan-executor.log'
+
+SUMMARY_SEVERITIES = ('critical', 'high', 'medium', 'low', 'info', 'total')
+
+# Severities that can fail the scan via configured thresholds
+THRESHOLD_SEVERITIES = ('critical', 'high', 'medium')
+
+# Index of completed scans by config hash, kept in the output directory
+CACHE_INDEX_FILE = '.scan-cache.json'
+
+
+def setup_logging():
+    """Configure console logging plus a rotating log file under logs/"""
+    handlers = [logging.StreamHandler(sys.stdout)]
+
+    try:
+        LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # delay=True opens the file on the first record rather than here
+        handlers.append(logging.handlers.RotatingFileHandler(
+            LOG_FILE,
+            maxBytes=10_000_000,
+            backupCount=3,
+            delay=True
+        ))
+    except OSError as e:
+        print(f"File logging disabled: {e}", file=sys.stderr)
+
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, handlers=handlers)
+
+
+def _git_head() -> str:
+    """Commit checked out in the working directory, or '' outside a repo"""
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ''
+    return result.stdout.strip() if result.returncode == 0 else ''
+
+
+def compute_config_hash(config: Dict[str, Any]) -> str:
+    """
+    Hash the resolved configuration, target URL and git HEAD
+
+    The scan type is left out, so an incremental run can reuse the
+    results of a full or quick scan of the same configuration.
+
+    Args:
+        config: Resolved application configuration
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    app_config = config.get('application', {})
+    scan_config = {k: v for k, v in app_config.get('scan', {}).items() if k != 'type'}
+    key = {
+        'config': {**config, 'application': {**app_config, 'scan': scan_config}},
+        'target_url': app_config.get('url'),
+        'git_head': _git_head()
+    }
+    if orjson is not None:
+        payload = orjson.dumps(key, option=orjson.OPT_SORT_KEYS, default=str)
+    else:
+        payload = json.dumps(key, sort_keys=True, default=str).encode()
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _load_cache_index(output_dir: Path) -> Dict[str, Any]:
+    """Load the scan cache index, treating a missing or corrupt file as empty"""
+    try:
+        with open(output_dir / CACHE_INDEX_FILE, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def find_cached_scan(output_dir: Path, config_hash: str) -> Optional[Dict[str, Any]]:
+    """
+    Find the last completed scan run with the same configuration hash
+
+    Args:
+        output_dir: Output directory holding the results
+        config_hash: Hash from compute_config_hash
+
+    Returns:
+        Cache entry with 'scan_id' and 'results_file', or None
+    """
+    entry = _load_cache_index(output_dir).get(config_hash)
+    if entry and Path(entry['results_file']).exists():
+        return entry
+    return None
+
+
+def record_cached_scan(output_dir: Path, config_hash: str, scan_id: str, results_file: Path):
+    """
+    Remember a completed scan for later incremental runs
+
+    Args:
+        output_dir: Output directory holding the results
+        config_hash: Hash from compute_config_hash
+        scan_id: Scan identifier
+        results_file: Path of the saved results
+    """
+    index = _load_cache_index(output_dir)
+    index[config_hash] = {
+        'scan_id': scan_id,
+        'results_file': str(results_file.resolve()),
+        'completed_at': datetime.utcnow().isoformat()
+    }
+    tmp_file = output_dir / f"{CACHE_INDEX_FILE}.tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp_file, output_dir / CACHE_INDEX_FILE)
+
+
+def check_thresholds(counts: Dict[str, int], thresholds: Dict[str, Any]) -> bool:
+    """
+    Compare vulnerability counts against the configured thresholds
+
+    Args:
+        counts: Vulnerability count per severity
+        thresholds: Maximum allowed count per severity
+
+    Returns:
+        True if any threshold is exceeded
+    """
+    logger.info("-" * 80)
+    logger.info("Checking vulnerability thresholds...")
+
+    threshold_exceeded = False
+
+    for severity in THRESHOLD_SEVERITIES:
+        threshold = thresholds.get(severity)
+        if threshold is not None and counts.get(severity, 0) > threshold:
+            logger.error("❌ %s vulnerabilities (%s) exceed threshold (%s)",
+                         severity.capitalize(), counts.get(severity, 0), threshold)
+            threshold_exceeded = True
+
+    if not threshold_exceeded:
+        logger.info("✅ All vulnerability thresholds passed")
+
+    return threshold_exceeded
+
 
 def main():
     """Main execution function"""
@@ -82,6 +230,8 @@ def main():
 
     args = parser.parse_args()
 
+    setup_logging()
+
     # Set log level
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -89,9 +239,9 @@ def main():
     logger.info("=" * 80)
     logger.info("AMTD Scan Executor")
     logger.info("=" * 80)
-    logger.info(f"Application: {args.application}")
-    logger.info(f"Scan Type: {args.scan_type}")
-    logger.info(f"Environment: {args.environment or 'default'}")
+    logger.info("Application: %s", args.application)
+    logger.info("Scan Type: %s", args.scan_type)
+    logger.info("Environment: %s", args.environment or 'default')
 
     try:
         # Initialize configuration manager
@@ -104,7 +254,7 @@ def main():
             environment=args.environment
         )
 
-        logger.info(f"Configuration loaded successfully for '{args.application}'")
+        logger.info("Configuration loaded successfully for '%s'", args.application)
 
         # Override scan type if specified
         if 'application' not in config:
@@ -118,20 +268,19 @@ def main():
         app_config = config.get('application', {})
         logger.info("-" * 80)
         logger.info("Configuration Summary:")
-        logger.info(f"  Name: {app_config.get('name', 'N/A')}")
-        logger.info(f"  URL: {app_config.get('url', 'N/A')}")
-        logger.info(f"  Owner: {app_config.get('owner', 'N/A')}")
-        logger.info(f"  Criticality: {app_config.get('criticality', 'N/A')}")
+        logger.info("  Name: %s", app_config.get('name', 'N/A'))
+        logger.info("  URL: %s", app_config.get('url', 'N/A'))
+        logger.info("  Owner: %s", app_config.get('owner', 'N/A'))
+        logger.info("  Criticality: %s", app_config.get('criticality', 'N/A'))
 
         scan_config = app_config.get('scan', {})
-        logger.info(f"  Scan Type: {scan_config.get('type', 'N/A')}")
-        logger.info(f"  Scan Policy: {scan_config.get('policy', 'N/A')}")
-        logger.info(f"  Timeout: {scan_config.get('timeout', 'N/A')}s")
+        logger.info("  Scan Type: %s", scan_config.get('type', 'N/A'))
+        logger.info("  Scan Policy: %s", scan_config.get('policy', 'N/A'))
+        logger.info("  Timeout: %ss", scan_config.get('timeout', 'N/A'))
 
         thresholds = scan_config.get('thresholds', {})
-        logger.info(f"  Thresholds: Critical={thresholds.get('critical')}, "
-                   f"High={thresholds.get('high')}, "
-                   f"Medium={thresholds.get('medium')}")
+        logger.info("  Thresholds: Critical=%s, High=%s, Medium=%s",
+                    thresholds.get('critical'), thresholds.get('high'), thresholds.get('medium'))
         logger.info("-" * 80)
 
         # Validate-only mode
@@ -144,6 +293,26 @@ def main():
         output_dir = Path(args.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Reuse the previous results when nothing has changed since
+        config_hash = compute_config_hash(config)
+        logger.debug("Configuration hash: %s", config_hash)
+
+        if args.scan_type == 'incremental':
+            cached = find_cached_scan(output_dir, config_hash)
+            if cached:
+                timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+                results_file = output_dir / f"{args.application}_{timestamp}_{cached['scan_id']}.json"
+                results_file.symlink_to(cached['results_file'])
+                logger.info("Cache hit: configuration unchanged since scan %s", cached['scan_id'])
+
+                # The cached results must still pass the current thresholds
+                statistics = load_sections(cached['results_file'], ('statistics',)).get('statistics', {})
+                threshold_exceeded = check_thresholds(statistics, thresholds)
+
+                logger.info("-" * 80)
+                logger.info("Results: %s", results_file)
+                return 1 if threshold_exceeded else 0
+
         # Execute scan
         logger.info("Initializing scan executor...")
         executor = ScanExecutor(config=config, output_dir=str(output_dir))
@@ -159,13 +328,10 @@ def main():
 
         # Display results summary
         statistics = results.get('statistics', {})
+        counts = {severity: statistics.get(severity, 0) for severity in SUMMARY_SEVERITIES}
         logger.info("Vulnerability Summary:")
-        logger.info(f"  Critical: {statistics.get('critical', 0)}")
-        logger.info(f"  High: {statistics.get('high', 0)}")
-        logger.info(f"  Medium: {statistics.get('medium', 0)}")
-        logger.info(f"  Low: {statistics.get('low', 0)}")
-        logger.info(f"  Info: {statistics.get('info', 0)}")
-        logger.info(f"  Total: {statistics.get('total', 0)}")
+        for severity in SUMMARY_SEVERITIES:
+            logger.info("  %s: %s", severity.capitalize(), counts[severity])
         logger.info("-" * 80)
 
         # Save results to JSON file
@@ -173,57 +339,37 @@ def main():
         timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
         results_file = output_dir / f"{args.application}_{timestamp}_{scan_id}.json"
 
-        logger.info(f"Saving results to: {results_file}")
-        with open(results_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        results.setdefault('scan_info', {})['config_hash'] = config_hash
 
-        # Check thresholds
-        logger.info("-" * 80)
-        logger.info("Checking vulnerability thresholds...")
-
-        threshold_exceeded = False
+        logger.info("Saving results to: %s", results_file)
+        save_results(results, results_file)
 
-        if thresholds.get('critical') is not None:
-            if statistics.get('critical', 0) > thresholds['critical']:
-                logger.error(f"❌ Critical vulnerabilities ({statistics['critical']}) "
-                           f"exceed threshold ({thresholds['critical']})")
-                threshold_exceeded = True
+        if results.get('scan_info', {}).get('status', 'completed') == 'completed':
+            record_cached_scan(output_dir, config_hash, scan_id, results_file)
 
-        if thresholds.get('high') is not None:
-            if statistics.get('high', 0) > thresholds['high']:
-                logger.error(f"❌ High vulnerabilities ({statistics['high']}) "
-                           f"exceed threshold ({thresholds['high']})")
-                threshold_exceeded = True
-
-        if thresholds.get('medium') is not None:
-            if statistics.get('medium', 0) > thresholds['medium']:
-                logger.error(f"❌ Medium vulnerabilities ({statistics['medium']}) "
-                           f"exceed threshold ({thresholds['medium']})")
-                threshold_exceeded = True
-
-        if not threshold_exceeded:
-            logger.info("✅ All vulnerability thresholds passed")
+        # Check thresholds
+        threshold_exceeded = check_thresholds(counts, thresholds)
 
         logger.info("-" * 80)
-        logger.info(f"Scan ID: {scan_id}")
-        logger.info(f"Duration: {results.get('duration', 0)}s")
-        logger.info(f"Results: {results_file}")
+        logger.info("Scan ID: %s", scan_id)
+        logger.info("Duration: %ss", results.get('duration', 0))
+        logger.info("Results: %s", results_file)
         logger.info("=" * 80)
 
         # Exit with appropriate code
         return 1 if threshold_exceeded else 0
 
     except FileNotFoundError as e:
-        logger.error(f"Configuration file not found: {e}")
-        logger.error(f"Make sure the configuration file exists at: config/applications/{args.application}.yaml")
+        logger.error("Configuration file not found: %s", e)
+        logger.error("Make sure the configuration file exists at: config/applications/%s.yaml", args.application)
         return 2
 
     except ValueError as e:
-        logger.error(f"Configuration validation error: {e}")
+        logger.error("Configuration validation error: %s", e)
         return 3
 
     except Exception as e:
-        logger.error(f"Scan execution failed: {e}", exc_info=True)
+        logger.error("Scan execution failed: %s", e, exc_info=True)
         return 4
 
 
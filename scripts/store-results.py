@@ -5,56 +5,130 @@ Stores scan results from JSON file into PostgreSQL database
 """
 
 import sys
-import json
 import logging
 import argparse
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, Any, Iterable, List
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-from api.database import db
+from api.database import COPY_THRESHOLD, db
+from results_io import load_sections, iter_vulnerabilities
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-
-def store_scan_results(results_file: str, application_name: str) -> bool:
+# Column order used for bulk vulnerability inserts
+VULNERABILITY_COLUMNS = (
+    'scan_id', 'name', 'severity', 'confidence', 'description', 'url',
+    'method', 'parameter', 'evidence', 'solution', 'reference', 'cwe_id',
+    'category', 'status'
+)
+
+# Number of vulnerabilities buffered before each bulk insert; larger than
+# COPY_THRESHOLD so that full batches are loaded with COPY
+BATCH_SIZE = 2 * COPY_THRESHOLD
+
+
+def _vulnerability_row(scan_id: str, vuln: dict) -> tuple:
+    """Build an insert row for a vulnerability, ordered as VULNERABILITY_COLUMNS"""
+    return (
+        scan_id,
+        vuln.get('name'),
+        vuln.get('severity', 'info'),
+        vuln.get('confidence'),
+        vuln.get('description'),
+        vuln.get('url'),
+        vuln.get('method'),
+        vuln.get('parameter'),
+        vuln.get('evidence'),
+        vuln.get('solution'),
+        vuln.get('reference'),
+        vuln.get('cwe_id'),
+        vuln.get('category'),
+        'open'
+    )
+
+
+def _insert_batch(cursor, batch: List[tuple]) -> int:
     """
-    Store scan results in database
+    Insert a batch of vulnerability rows, skipping rows the database rejects
+
+    The batch runs under a savepoint. If it fails, it is retried row by
+    row, each under its own savepoint, so one bad row costs only itself
+    and the surrounding transaction stays usable.
 
     Args:
-        results_file: Path to scan results JSON file
-        application_name: Application name
+        cursor: Cursor of the store transaction
+        batch: Rows ordered as VULNERABILITY_COLUMNS
 
     Returns:
-        True if successful
+        Number of rows stored
     """
+    cursor.execute("SAVEPOINT vuln_batch")
     try:
-        # Load results
-        with open(results_file, 'r') as f:
-            results = json.load(f)
+        count = db.insert_many('vulnerabilities', VULNERABILITY_COLUMNS, batch, cursor=cursor)
+    except Exception as e:
+        cursor.execute("ROLLBACK TO SAVEPOINT vuln_batch")
+        logger.warning("Bulk insert failed, storing %s vulnerabilities one by one: %s", len(batch), e)
 
-        scan_info = results.get('scan_info', {})
-        statistics = results.get('statistics', {})
-        vulnerabilities = results.get('vulnerabilities', [])
+        count = 0
+        for row in batch:
+            cursor.execute("SAVEPOINT vuln_row")
+            try:
+                db.insert_many('vulnerabilities', VULNERABILITY_COLUMNS, [row], cursor=cursor)
+            except Exception as e:
+                cursor.execute("ROLLBACK TO SAVEPOINT vuln_row")
+                logger.warning("Failed to store vulnerability %s: %s", row[1], e)
+            else:
+                count += 1
+            cursor.execute("RELEASE SAVEPOINT vuln_row")
+
+    cursor.execute("RELEASE SAVEPOINT vuln_batch")
+    return count
+
+
+def store_results(
+    scan_info: Dict[str, Any],
+    statistics: Dict[str, Any],
+    vulnerabilities: Iterable[Dict[str, Any]],
+    application_name: str
+) -> str:
+    """
+    Store already-loaded scan results in database
 
-        logger.info(f"Storing results for application: {application_name}")
+    Everything is written in one transaction on one connection, so a
+    failure leaves no scan row behind. Individual vulnerabilities the
+    database rejects are skipped with a warning.
 
+    Args:
+        scan_info: Scan information section of the results
+        statistics: Statistics section of the results
+        vulnerabilities: Vulnerabilities, consumed once in batches
+        application_name: Application name
+
+    Returns:
+        ID of the created scan record
+    """
+    logger.info("Storing results for application: %s", application_name)
+
+    with db.get_cursor() as cursor:
         # Get or create application
         application = db.execute_one(
             "SELECT * FROM applications WHERE name = %s",
-            (application_name,)
+            (application_name,),
+            cursor=cursor
         )
 
         if not application:
-            logger.info(f"Creating new application: {application_name}")
+            logger.info("Creating new application: %s", application_name)
             application = db.insert('applications', {
                 'name': application_name,
                 'target_url': scan_info.get('target_url', 'Unknown'),
                 'status': 'active'
-            })
+            }, cursor=cursor)
 
         application_id = application['id']
 
@@ -72,50 +146,74 @@ def store_scan_results(results_file: str, application_name: str) -> bool:
             'medium_count': statistics.get('medium', 0),
             'low_count': statistics.get('low', 0),
             'info_count': statistics.get('info', 0),
-            'total_count': statistics.get('total', 0)
-        })
+            'total_count': statistics.get('total', 0),
+            'config_hash': scan_info.get('config_hash')
+        }, cursor=cursor)
 
         scan_id = scan['id']
-        logger.info(f"Created scan record: {scan_id}")
+        logger.info("Created scan record: %s", scan_id)
 
-        # Store vulnerabilities
+        # Insert vulnerabilities in bounded bulk batches
         vuln_count = 0
+        batch = []
         for vuln in vulnerabilities:
-            try:
-                db.insert('vulnerabilities', {
-                    'scan_id': scan_id,
-                    'name': vuln.get('name'),
-                    'severity': vuln.get('severity', 'info'),
-                    'confidence': vuln.get('confidence'),
-                    'description': vuln.get('description'),
-                    'url': vuln.get('url'),
-                    'method': vuln.get('method'),
-                    'parameter': vuln.get('parameter'),
-                    'evidence': vuln.get('evidence'),
-                    'solution': vuln.get('solution'),
-                    'reference': vuln.get('reference'),
-                    'cwe_id': vuln.get('cwe_id'),
-                    'category': vuln.get('category'),
-                    'status': 'open'
-                })
-                vuln_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to store vulnerability: {e}")
+            batch.append(_vulnerability_row(scan_id, vuln))
+            if len(batch) >= BATCH_SIZE:
+                vuln_count += _insert_batch(cursor, batch)
+                batch = []
+
+        if batch:
+            vuln_count += _insert_batch(cursor, batch)
+
+    logger.info("Stored %s vulnerabilities", vuln_count)
 
-        logger.info(f"Stored {vuln_count} vulnerabilities")
+    # The portfolio statistics view only changes when it is refreshed
+    try:
+        db.refresh_materialized_view('mv_application_portfolio')
+    except Exception as e:
+        # The scan is stored; statistics catch up on the next refresh
+        logger.warning("Failed to refresh application portfolio: %s", e)
+
+    # Update statistics
+    logger.info("Scan stored successfully:")
+    logger.info("  - Application: %s", application_name)
+    logger.info("  - Scan ID: %s", scan_id)
+    logger.info("  - Total vulnerabilities: %s", vuln_count)
+    logger.info("  - Critical: %s", statistics.get('critical', 0))
+    logger.info("  - High: %s", statistics.get('high', 0))
 
-        # Update statistics
-        logger.info(f"Scan stored successfully:")
-        logger.info(f"  - Application: {application_name}")
-        logger.info(f"  - Scan ID: {scan_id}")
-        logger.info(f"  - Total vulnerabilities: {vuln_count}")
-        logger.info(f"  - Critical: {statistics.get('critical', 0)}")
-        logger.info(f"  - High: {statistics.get('high', 0)}")
+    return scan_id
 
+
+def store_scan_results(results_file: str, application_name: str) -> bool:
+    """
+    Store scan results in database
+
+    Args:
+        results_file: Path to scan results JSON file
+        application_name: Application name
+
+    Returns:
+        True if successful
+    """
+    try:
+        # Load everything except the vulnerabilities, which are streamed
+        sections = load_sections(results_file, ('scan_info', 'statistics'))
+
+        store_results(
+            sections.get('scan_info') or {},
+            sections.get('statistics') or {},
+            iter_vulnerabilities(results_file),
+            application_name
+        )
         return True
 
+    except FileNotFoundError:
+        logger.error("Results file not found: %s", results_file)
+        return False
+
     except Exception as e:
-        logger.error(f"Failed to store scan results: {e}")
+        logger.error("Failed to store scan results: %s", e)
         return False
 
 
@@ -131,16 +229,6 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # Verify file exists
-    if not Path(args.results_file).exists():
-        logger.error(f"Results file not found: {args.results_file}")
-        sys.exit(1)
-
-    # Test database connection
-    if not db.test_connection():
-        logger.error("Failed to connect to database")
-        sys.exit(1)
-
     # Store results
     success = store_scan_results(args.results_file, args.application)
 
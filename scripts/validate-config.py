@@ -7,7 +7,16 @@ Validates AMTD configuration files
 import sys
 import logging
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
@@ -17,98 +26,147 @@ from config_manager import ConfigManager, ConfigValidator
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# One validator per process, reused for every file checked there
+_validator = ConfigValidator()
 
-def validate_configuration(config_type: str, config_file: str, verbose: bool = False) -> bool:
+
+def _load_yaml(config_file: str):
+    """Parse a YAML file with the libyaml-backed loader when available"""
+    with open(config_file, 'rb') as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+def _check_configuration(
+    config_type: str,
+    config_file: str
+) -> Tuple[Dict[str, Any], List[str], List[str]]:
     """
-    Validate configuration file
+    Run validation for a configuration file without reporting
 
     Args:
         config_type: Type of configuration (application, policy, global)
         config_file: Path to configuration file
-        verbose: Verbose output
 
     Returns:
-        True if valid
+        Tuple of (parsed configuration, errors, warnings)
+
+    Raises:
+        ValueError: If config_type is unknown
     """
-    try:
-        validator = ConfigValidator()
+    if config_type not in ('application', 'policy', 'global'):
+        raise ValueError(f"Unknown configuration type: {config_type}")
+
+    # Parse once; the result is reused for the verbose dump
+    config = _load_yaml(config_file) or {}
 
-        logger.info(f"Validating {config_type} configuration: {config_file}")
+    if config_type == 'application':
+        # Validate application configuration
+        _, errors, warnings = _validator.validate_application_config(config)
 
-        if config_type == 'application':
-            # Validate application configuration
-            errors, warnings = validator.validate_application_config(config_file)
+    elif config_type == 'policy':
+        errors = []
+        warnings = []
 
-        elif config_type == 'policy':
-            # Load and basic validate scan policy
-            import yaml
-            with open(config_file, 'r') as f:
-                policy_config = yaml.safe_load(f)
+        # Basic validation
+        required_fields = ['spider', 'active_scan']
+        for field in required_fields:
+            if field not in config:
+                errors.append(f"Missing required section: {field}")
 
-            errors = []
-            warnings = []
+    else:
+        errors = []
+        warnings = []
 
-            # Basic validation
-            required_fields = ['spider', 'active_scan']
-            for field in required_fields:
-                if field not in policy_config:
-                    errors.append(f"Missing required section: {field}")
+        # Basic validation
+        required_sections = ['logging', 'database', 'scanning']
+        for section in required_sections:
+            if section not in config:
+                errors.append(f"Missing required section: {section}")
 
-            logger.info(f"Policy configuration validated (basic check)")
+    return config, errors, warnings
 
-        elif config_type == 'global':
-            # Load and validate global configuration
-            import yaml
-            with open(config_file, 'r') as f:
-                global_config = yaml.safe_load(f)
 
-            errors = []
-            warnings = []
+def _report_results(errors: List[str], warnings: List[str]):
+    """Log validation errors and warnings"""
+    if errors:
+        logger.error("Validation FAILED with %s errors:", len(errors))
+        for error in errors:
+            logger.error("  ERROR: %s", error)
 
-            # Basic validation
-            required_sections = ['logging', 'database', 'scanning']
-            for section in required_sections:
-                if section not in global_config:
-                    errors.append(f"Missing required section: {section}")
+    if warnings:
+        logger.warning("Found %s warnings:", len(warnings))
+        for warning in warnings:
+            logger.warning("  WARNING: %s", warning)
 
-            logger.info(f"Global configuration validated (basic check)")
+    if not errors and not warnings:
+        logger.info("Configuration is VALID - no errors or warnings")
 
-        else:
-            logger.error(f"Unknown configuration type: {config_type}")
-            return False
 
-        # Report results
-        if errors:
-            logger.error(f"Validation FAILED with {len(errors)} errors:")
-            for error in errors:
-                logger.error(f"  ERROR: {error}")
+def validate_configuration(config_type: str, config_file: str, verbose: bool = False) -> bool:
+    """
+    Validate configuration file
+
+    Args:
+        config_type: Type of configuration (application, policy, global)
+        config_file: Path to configuration file
+        verbose: Verbose output
 
-        if warnings:
-            logger.warning(f"Found {len(warnings)} warnings:")
-            for warning in warnings:
-                logger.warning(f"  WARNING: {warning}")
+    Returns:
+        True if valid
+    """
+    try:
+        logger.info("Validating %s configuration: %s", config_type, config_file)
+
+        try:
+            config, errors, warnings = _check_configuration(config_type, config_file)
+        except ValueError as e:
+            logger.error(str(e))
+            return False
 
-        if not errors and not warnings:
-            logger.info("Configuration is VALID - no errors or warnings")
+        if config_type in ('policy', 'global'):
+            logger.info("%s configuration validated (basic check)", config_type.capitalize())
+
+        # Report results
+        _report_results(errors, warnings)
 
         if verbose:
             # Show full configuration
-            import yaml
-            with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
             logger.info("Configuration content:")
             logger.info(yaml.dump(config, default_flow_style=False))
 
         return len(errors) == 0
 
     except FileNotFoundError:
-        logger.error(f"Configuration file not found: {config_file}")
+        logger.error("Configuration file not found: %s", config_file)
         return False
     except Exception as e:
-        logger.error(f"Validation failed: {e}")
+        logger.error("Validation failed: %s", e)
         return False
 
 
+def _validate_one(config_file: str) -> Tuple[str, List[str], List[str]]:
+    """
+    Validate one application file in a worker process
+
+    Results are returned rather than logged so the parent can report
+    them in order without interleaving output from several workers.
+
+    Args:
+        config_file: Path to application configuration file
+
+    Returns:
+        Tuple of (config_file, errors, warnings)
+    """
+    try:
+        _, errors, warnings = _check_configuration('application', config_file)
+    except FileNotFoundError:
+        errors, warnings = [f"Configuration file not found: {config_file}"], []
+    except Exception as e:
+        errors, warnings = [f"Validation failed: {e}"], []
+
+    return config_file, errors, warnings
+
+
 def validate_all_applications(config_dir: str) -> bool:
     """
     Validate all application configurations
@@ -123,38 +181,41 @@ def validate_all_applications(config_dir: str) -> bool:
         config_path = Path(config_dir) / 'applications'
 
         if not config_path.exists():
-            logger.error(f"Applications directory not found: {config_path}")
+            logger.error("Applications directory not found: %s", config_path)
             return False
 
         # Get all YAML files
         yaml_files = list(config_path.glob('*.yaml')) + list(config_path.glob('*.yml'))
 
-        logger.info(f"Found {len(yaml_files)} application configuration files")
+        logger.info("Found %s application configuration files", len(yaml_files))
 
-        all_valid = True
-        for yaml_file in yaml_files:
-            if yaml_file.name == 'template.yaml':
-                continue  # Skip template
-
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Validating: {yaml_file.name}")
-            logger.info(f"{'='*60}")
+        # Validate files in parallel, skipping the template
+        config_files = [str(p) for p in yaml_files if p.name != 'template.yaml']
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_validate_one, config_files))
 
-            valid = validate_configuration('application', str(yaml_file))
-            if not valid:
+        all_valid = True
+        for config_file, errors, warnings in results:
+            logger.info("\n" + "=" * 60)
+            logger.info("Validating: %s", Path(config_file).name)
+            logger.info("=" * 60)
+
+            logger.info("Validating application configuration: %s", config_file)
+            _report_results(errors, warnings)
+            if errors:
                 all_valid = False
 
-        logger.info(f"\n{'='*60}")
+        logger.info("\n" + "=" * 60)
         if all_valid:
             logger.info("ALL configurations are VALID")
         else:
             logger.error("Some configurations have ERRORS")
-        logger.info(f"{'='*60}")
+        logger.info("=" * 60)
 
         return all_valid
 
     except Exception as e:
-        logger.error(f"Failed to validate all applications: {e}")
+        logger.error("Failed to validate all applications: %s", e)
         return False
 
 
@@ -4,13 +4,37 @@ Creates and configures the Flask application
 """
 
 import os
+import hashlib
 import logging
-from flask import Flask, jsonify
+from flask import Flask, jsonify, request
 from flask_cors import CORS
 from werkzeug.exceptions import HTTPException
 
+from .caching import cache, cache_config
+from .json_provider import init_json_provider
+
 logger = logging.getLogger(__name__)
 
+# Static response bodies, built once rather than per request
+HEALTH_BODY = {
+    'status': 'healthy',
+    'version': '1.0.0',
+    'service': 'AMTD API'
+}
+
+INDEX_BODY = {
+    'name': 'AMTD REST API',
+    'version': '1.0.0',
+    'documentation': '/api/v1/docs',
+    'endpoints': {
+        'applications': '/api/v1/applications',
+        'scans': '/api/v1/scans',
+        'vulnerabilities': '/api/v1/vulnerabilities',
+        'reports': '/api/v1/reports',
+        'health': '/health'
+    }
+}
+
 
 def create_app(config=None):
     """
@@ -40,9 +64,15 @@ def create_app(config=None):
     if config:
         app.config.update(config)
 
+    # Serialize responses with orjson when available
+    init_json_provider(app)
+
     # Setup CORS
     CORS(app, origins=app.config['CORS_ORIGINS'])
 
+    # Setup response cache
+    cache.init_app(app, config=cache_config())
+
     # Setup logging
     setup_logging(app)
 
@@ -53,36 +83,43 @@ def create_app(config=None):
     register_blueprints(app)
 
     # Health check endpoint
-    @app.route('/health')
-    def health_check():
-        """Health check endpoint"""
-        return jsonify({
-            'status': 'healthy',
-            'version': '1.0.0',
-            'service': 'AMTD API'
-        })
+    app.add_url_rule('/health', 'health_check', static_json_view(app, HEALTH_BODY))
 
     # Root endpoint
-    @app.route('/')
-    def index():
-        """API root endpoint"""
-        return jsonify({
-            'name': 'AMTD REST API',
-            'version': '1.0.0',
-            'documentation': '/api/v1/docs',
-            'endpoints': {
-                'applications': '/api/v1/applications',
-                'scans': '/api/v1/scans',
-                'vulnerabilities': '/api/v1/vulnerabilities',
-                'reports': '/api/v1/reports',
-                'health': '/health'
-            }
-        })
+    app.add_url_rule('/', 'index', static_json_view(app, INDEX_BODY))
 
     logger.info("Flask application created successfully")
     return app
 
 
+def static_json_view(app, body):
+    """
+    Build a view that serves a fixed JSON body
+
+    The body is encoded and its ETag computed once; each request only wraps
+    the bytes in a fresh Response (responses are mutated by after-request
+    handlers such as CORS, so a single instance can't be shared).
+
+    Args:
+        app: Flask application
+        body: JSON-serializable response body
+
+    Returns:
+        View function
+    """
+    data = app.json.dumps(body).encode()
+    etag = hashlib.sha1(data).hexdigest()
+
+    def view():
+        response = app.response_class(data, mimetype='application/json')
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = 5
+        return response.make_conditional(request)
+
+    return view
+
+
 def setup_logging(app):
     """Setup application logging"""
     log_level = os.getenv('LOG_LEVEL', 'INFO')
@@ -111,7 +148,7 @@ def register_error_handlers(app):
     @app.errorhandler(Exception)
     def handle_exception(e):
         """Handle general exceptions"""
-        logger.error(f"Unhandled exception: {e}", exc_info=True)
+        logger.error("Unhandled exception: %s", e, exc_info=True)
         response = {
             'error': 'Internal Server Error',
             'message': str(e),
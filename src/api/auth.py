@@ -4,38 +4,67 @@ Simple API key authentication for REST endpoints
 """
 
 import os
+import hmac
+import time
+import base64
+import hashlib
 import logging
+import secrets
 from functools import wraps
 from flask import request, jsonify
 from typing import Optional, Callable
 
 logger = logging.getLogger(__name__)
 
+# Seconds a validation result is reused before checking the key store again
+VALID_KEY_TTL = 60.0
+INVALID_KEY_TTL = 1.0
+
+# Cached results are dropped wholesale past this many entries
+MAX_CACHED_KEYS = 10000
+
 
 class APIKeyAuth:
     """API Key authentication manager"""
 
-    def __init__(self, api_keys: Optional[list] = None):
+    def __init__(self, api_keys: Optional[list] = None, signing_secret: Optional[str] = None):
         """
         Initialize API key authentication
 
         Args:
             api_keys: List of valid API keys
+            signing_secret: Secret for self-verifying keys (default: API_KEY_SECRET env)
         """
         # Load API keys from environment or use provided list
         if api_keys is None:
             env_keys = os.getenv('API_KEYS', '')
-            self.api_keys = set([k.strip() for k in env_keys.split(',') if k.strip()])
+            keys = [k.strip() for k in env_keys.split(',') if k.strip()]
         else:
-            self.api_keys = set(api_keys)
+            keys = list(api_keys)
 
         # Add default key for development
-        if not self.api_keys and os.getenv('FLASK_ENV') == 'development':
-            self.api_keys.add('dev-key-change-in-production')
+        if not keys and os.getenv('FLASK_ENV') == 'development':
+            keys.append('dev-key-change-in-production')
             logger.warning("Using default development API key")
 
-        self.enabled = len(self.api_keys) > 0
-        logger.info(f"API Key authentication {'enabled' if self.enabled else 'disabled'}")
+        # Only digests are kept, never the keys themselves
+        self.api_hashes = frozenset(self._hash_key(k) for k in keys)
+
+        # blake2b key digest -> (is_valid, expiry on the monotonic clock, version)
+        self._validation_cache = {}
+
+        # Bumped when keys change; entries from older versions are ignored, so
+        # a validation racing with a revocation can't re-cache a stale result
+        self._cache_version = 0
+
+        # Signed keys ("prefix.signature") are verified locally with HMAC;
+        # only revoked prefixes need to be stored
+        secret = signing_secret or os.getenv('API_KEY_SECRET')
+        self._signing_key = secret.encode() if secret else None
+        self.revoked_prefixes = frozenset()
+
+        self.enabled = len(self.api_hashes) > 0 or self._signing_key is not None
+        logger.info("API Key authentication %s", 'enabled' if self.enabled else 'disabled')
 
     def require_api_key(self, f: Callable) -> Callable:
         """
@@ -69,7 +98,7 @@ class APIKeyAuth:
                 }), 401
 
             if not self.validate_api_key(api_key):
-                logger.warning(f"Invalid API key attempt: {api_key[:8]}...")
+                logger.warning("Invalid API key attempt: %s...", api_key[:8])
                 return jsonify({
                     'error': 'Forbidden',
                     'message': 'Invalid API key',
@@ -81,6 +110,21 @@ class APIKeyAuth:
 
         return decorated_function
 
+    @staticmethod
+    def _hash_key(api_key: str) -> str:
+        """SHA-256 digest under which an API key is stored and looked up"""
+        return hashlib.sha256(api_key.encode()).hexdigest()
+
+    @staticmethod
+    def _cache_key(api_key: str) -> bytes:
+        """Short blake2b digest keying the validation cache (keys are never cached)"""
+        return hashlib.blake2b(api_key.encode(), digest_size=16).digest()
+
+    def _invalidate_cache(self):
+        """Drop all cached validation results"""
+        self._cache_version += 1
+        self._validation_cache.clear()
+
     def validate_api_key(self, api_key: str) -> bool:
         """
         Validate API key
@@ -91,7 +135,34 @@ class APIKeyAuth:
         Returns:
             True if valid
         """
-        return api_key in self.api_keys
+        cache_key = self._cache_key(api_key)
+        version = self._cache_version
+        now = time.monotonic()
+
+        cached = self._validation_cache.get(cache_key)
+        if cached and cached[1] > now and cached[2] == version:
+            return cached[0]
+
+        is_valid = False
+        if self._signing_key is not None and '.' in api_key:
+            # Signed keys verify locally; only revocations need a lookup
+            prefix, _, signature = api_key.partition('.')
+            # Compared as bytes: compare_digest rejects non-ASCII str
+            is_valid = (
+                hmac.compare_digest(signature.encode(), self._sign(prefix).encode()) and
+                prefix not in self.revoked_prefixes
+            )
+
+        if not is_valid:
+            # Set membership on the digest: no early-exit comparison of the key
+            is_valid = self._hash_key(api_key) in self.api_hashes
+
+        if len(self._validation_cache) >= MAX_CACHED_KEYS:
+            self._validation_cache.clear()
+        ttl = VALID_KEY_TTL if is_valid else INVALID_KEY_TTL
+        self._validation_cache[cache_key] = (is_valid, now + ttl, version)
+
+        return is_valid
 
     def add_api_key(self, api_key: str):
         """
@@ -100,7 +171,8 @@ class APIKeyAuth:
         Args:
             api_key: API key to add
         """
-        self.api_keys.add(api_key)
+        self.api_hashes = self.api_hashes | {self._hash_key(api_key)}
+        self._invalidate_cache()
         self.enabled = True
         logger.info("API key added")
 
@@ -111,17 +183,32 @@ class APIKeyAuth:
         Args:
             api_key: API key to remove
         """
-        self.api_keys.discard(api_key)
+        self.api_hashes = self.api_hashes - {self._hash_key(api_key)}
+        if self._signing_key is not None and '.' in api_key:
+            self.revoked_prefixes = self.revoked_prefixes | {api_key.partition('.')[0]}
+        self._invalidate_cache()
         logger.info("API key removed")
 
+    def _sign(self, prefix: str) -> str:
+        """HMAC-SHA256 signature of a key prefix, URL-safe base64 encoded"""
+        digest = hmac.new(self._signing_key, prefix.encode(), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest).rstrip(b'=').decode()
+
     def generate_api_key(self) -> str:
         """
         Generate a new random API key
 
+        With a signing secret configured the key has the form
+        ``prefix.signature`` and is valid without being added to the key
+        list; otherwise it is a plain random token.
+
         Returns:
             Generated API key
         """
-        import secrets
+        if self._signing_key is not None:
+            prefix = secrets.token_urlsafe(12)
+            return f"{prefix}.{self._sign(prefix)}"
+
         api_key = secrets.token_urlsafe(32)
         return api_key
 
@@ -0,0 +1,143 @@
+"""
+API Response Caching
+Shared Flask-Caching instance and cache key helpers
+"""
+
+import os
+import hashlib
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+from flask import jsonify, request
+from flask_caching import Cache
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached response is served before it is recomputed
+DEFAULT_TIMEOUT = int(os.getenv('CACHE_DEFAULT_TIMEOUT', 30))
+
+# Seconds aggregate statistics are reused (server side and by clients)
+STATS_TIMEOUT = int(os.getenv('CACHE_STATS_TIMEOUT', 30))
+
+# Global cache instance, bound to the app in create_app
+cache = Cache()
+
+
+def cache_config() -> Dict[str, Any]:
+    """
+    Build the cache configuration from the environment
+
+    Redis is used when REDIS_URL (or REDIS_HOST) is set, so all workers
+    share one cache; otherwise each process keeps its own in-memory cache.
+
+    Returns:
+        Flask-Caching configuration
+    """
+    redis_url = os.getenv('REDIS_URL')
+    if not redis_url and os.getenv('REDIS_HOST'):
+        redis_url = f"redis://{os.getenv('REDIS_HOST')}:{os.getenv('REDIS_PORT', '6379')}/0"
+
+    if redis_url:
+        return {
+            'CACHE_TYPE': 'RedisCache',
+            'CACHE_REDIS_URL': redis_url,
+            'CACHE_DEFAULT_TIMEOUT': DEFAULT_TIMEOUT
+        }
+
+    return {
+        'CACHE_TYPE': 'SimpleCache',
+        'CACHE_DEFAULT_TIMEOUT': DEFAULT_TIMEOUT
+    }
+
+
+def only_ok(response) -> bool:
+    """Response filter that keeps errors (returned as (body, status)) out of the cache"""
+    return not isinstance(response, tuple) or response[1] == 200
+
+
+def application_key(kind: str, application_id: str) -> str:
+    """
+    Cache key for a per-application response
+
+    Args:
+        kind: Response kind (e.g. 'detail', 'stats')
+        application_id: Application UUID
+
+    Returns:
+        Cache key
+    """
+    return f"app{kind}:{application_id}"
+
+
+def invalidate_application(application_id: str):
+    """
+    Drop cached responses for an application
+
+    Args:
+        application_id: Application UUID
+    """
+    try:
+        cache.delete_many(
+            application_key('detail', application_id),
+            application_key('stats', application_id)
+        )
+    except Exception as e:
+        # A stale entry expires on its own; don't fail the write over it
+        logger.warning("Failed to invalidate cache for application %s: %s", application_id, e)
+
+
+def generation(name: str) -> int:
+    """
+    Current generation of a data set
+
+    Cached aggregates include the generation in their key, so bumping it
+    retires every entry computed from older data at once.
+
+    Args:
+        name: Data set name (e.g. 'scans')
+
+    Returns:
+        Generation counter
+    """
+    try:
+        return cache.get(f"gen:{name}") or 0
+    except Exception as e:
+        logger.warning("Failed to read cache generation %s: %s", name, e)
+        return 0
+
+
+def bump_generation(name: str):
+    """
+    Invalidate cached aggregates over a data set
+
+    Args:
+        name: Data set name (e.g. 'scans')
+    """
+    try:
+        # inc is atomic on Redis, so concurrent writers can't lose a bump
+        cache.cache.inc(f"gen:{name}")
+    except Exception as e:
+        # Entries still expire after STATS_TIMEOUT
+        logger.warning("Failed to bump cache generation %s: %s", name, e)
+
+
+def conditional_json(body: Any, last_modified: Optional[datetime] = None):
+    """
+    Build a JSON response carrying an ETag of its encoded body
+
+    A client revalidating with a matching If-None-Match gets an empty 304
+    instead of the full payload. The tag is taken from the bytes sent, so
+    it changes with anything in the body, joined or aggregated data included.
+
+    Args:
+        body: JSON-serializable response body
+        last_modified: Time the resource last changed, for If-Modified-Since
+
+    Returns:
+        Response (304 when the client's copy is current)
+    """
+    response = jsonify(body)
+    response.set_etag(hashlib.blake2b(response.get_data(), digest_size=16).hexdigest())
+    if last_modified is not None:
+        response.last_modified = last_modified
+    return response.make_conditional(request)
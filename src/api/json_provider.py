@@ -0,0 +1,87 @@
+"""
+JSON Provider
+orjson-backed JSON serialization for API responses
+"""
+
+import logging
+from decimal import Decimal
+from typing import Any, Callable
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # Fall back to Flask's stdlib-based provider
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+ORJSON_OPTIONS = (orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes with orjson
+
+    Datetimes are written as ISO 8601 (naive values are treated as UTC).
+    Types orjson doesn't know, such as Decimal, go through ``default``.
+    """
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        """Convert values orjson can't serialize natively"""
+        if isinstance(o, Decimal):
+            return float(o)
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string"""
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize a JSON string or bytes"""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Build a JSON response, passing the encoded bytes straight through"""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS),
+            mimetype=self.mimetype
+        )
+
+
+def ndjson_encoder(app) -> Callable[[Any], bytes]:
+    """
+    Get a function that encodes one object as a newline-terminated JSON line
+
+    With orjson the line is produced as bytes in one call, skipping the
+    str round trip a streamed response would otherwise make per row.
+
+    Args:
+        app: Flask application
+
+    Returns:
+        Encoder returning UTF-8 bytes
+    """
+    if isinstance(app.json, ORJSONProvider):
+        default = app.json.default
+        option = ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+        return lambda obj: orjson.dumps(obj, default=default, option=option)
+
+    dumps = app.json.dumps
+    return lambda obj: (dumps(obj) + '\n').encode()
+
+
+def init_json_provider(app):
+    """
+    Use the orjson provider for an app when orjson is installed
+
+    Args:
+        app: Flask application
+    """
+    if orjson is None:
+        logger.info("orjson not installed, using default JSON provider")
+        return
+
+    app.json = ORJSONProvider(app)
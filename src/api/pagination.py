@@ -0,0 +1,292 @@
+"""
+Pagination Helpers
+Shared "fetch N+1" paging and keyset cursors for list endpoints
+"""
+
+import base64
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .database import db
+from .params import IntParam
+
+# Query string values that switch on a boolean flag such as include_total
+TRUE_VALUES = frozenset({'1', 'true', 'yes', 'on'})
+
+# Page size and offset accepted by the list endpoints
+PAGE_PARAMS = {
+    'limit': IntParam(50, minimum=1, maximum=100),
+    'offset': IntParam(0)
+}
+
+# Select-list addition that returns the total match count on every row
+WINDOW_TOTAL = ', COUNT(*) OVER () AS _total'
+
+
+def wants_total(args: Mapping[str, str]) -> bool:
+    """
+    Check whether the client asked for a total row count
+
+    Counting every matching row is expensive on large tables, so list
+    endpoints only do it for ``?include_total=true``.
+
+    Args:
+        args: Request query arguments
+
+    Returns:
+        True if include_total was requested
+    """
+    return args.get('include_total', '').lower() in TRUE_VALUES
+
+
+def split_page(rows: List[Any], limit: int) -> Tuple[List[Any], bool]:
+    """
+    Trim a page fetched with LIMIT limit + 1
+
+    Args:
+        rows: Rows returned by the query
+        limit: Requested page size
+
+    Returns:
+        Tuple of (page rows, whether more rows follow)
+    """
+    return rows[:limit], len(rows) > limit
+
+
+def pop_window_total(rows: List[Dict[str, Any]]) -> Optional[int]:
+    """
+    Strip the ``_total`` window column from page rows
+
+    Args:
+        rows: Rows selected with ``COUNT(*) OVER () AS _total``
+
+    Returns:
+        Total match count, or None if there were no rows
+    """
+    if not rows:
+        return None
+
+    total = rows[0]['_total']
+    for row in rows:
+        del row['_total']
+    return total
+
+
+def encode_cursor(row: Mapping[str, Any], column: str) -> str:
+    """
+    Encode the (timestamp, id) position of a row as an opaque cursor
+
+    A NULL timestamp is encoded as an empty string.
+
+    Args:
+        row: Last row on a page
+        column: Timestamp column the list is ordered by
+
+    Returns:
+        Cursor string
+    """
+    timestamp = row[column].isoformat() if row[column] is not None else ''
+    position = f"{timestamp},{row['id']}"
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], str]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (timestamp, id) to continue after; the timestamp is None
+        for a row whose sort column is NULL
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        timestamp, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(',', 1)
+        return (datetime.fromisoformat(timestamp) if timestamp else None), row_id
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def cursor_position(args: Mapping[str, str]) -> Optional[Tuple[Optional[datetime], str]]:
+    """
+    Read the keyset position a list request continues from
+
+    Accepts either ``cursor`` (a previous page's next_cursor) or the
+    explicit ``after_ts``/``after_id`` pair.
+
+    Args:
+        args: Request query arguments
+
+    Returns:
+        Tuple of (timestamp, id), or None for the first page
+
+    Raises:
+        ValueError: If the position is malformed or incomplete
+    """
+    cursor = args.get('cursor')
+    if cursor:
+        return decode_cursor(cursor)
+
+    after_ts = args.get('after_ts')
+    after_id = args.get('after_id')
+    if not after_ts and not after_id:
+        return None
+    if not (after_ts and after_id):
+        raise ValueError('after_ts and after_id must be given together')
+
+    try:
+        return datetime.fromisoformat(after_ts), after_id
+    except ValueError as e:
+        raise ValueError(f"Invalid after_ts: {after_ts}") from e
+
+
+def next_cursor(page: List[Mapping[str, Any]], has_more: bool, column: str) -> Optional[str]:
+    """
+    Build the cursor for the page after this one
+
+    Args:
+        page: Rows on this page
+        has_more: Whether more rows follow
+        column: Timestamp column the list is ordered by
+
+    Returns:
+        Cursor string, or None on the last page
+    """
+    if not has_more or not page:
+        return None
+    return encode_cursor(page[-1], column)
+
+
+class ListQuery:
+    """
+    Prepared statements for a filtered, paginated list endpoint
+
+    Every combination of present filters (as a bitmask), with and without
+    the window total or a keyset position, is rendered and registered with
+    db.prepare() once at import. Requests pick a statement by mask, so the
+    server plans each shape once per connection instead of per request.
+
+    Rows whose sort column is NULL come first (the DESC default) and are
+    ordered by id among themselves; keyset positions account for them.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        select: str,
+        from_clause: str,
+        filters: Sequence[Tuple[str, str]],
+        sort_column: str,
+        id_column: str,
+        count_from: Optional[str] = None
+    ):
+        """
+        Build and register the statements
+
+        Args:
+            name: Prefix for the prepared statement names
+            select: Select list
+            from_clause: FROM clause including joins
+            filters: (query argument, column) pairs, each an equality filter
+            sort_column: Timestamp column the list is ordered by (descending)
+            id_column: Row id column, the keyset tie-breaker
+            count_from: FROM clause for the count query (default: from_clause)
+        """
+        self.args = tuple(arg for arg, _ in filters)
+        self._page = {}
+        self._after_null = {}
+        self._count = {}
+
+        for mask in range(1 << len(filters)):
+            where = 'WHERE TRUE' + ''.join(
+                f" AND {column} = %s"
+                for bit, (_, column) in enumerate(filters)
+                if mask & (1 << bit)
+            )
+            order = f"ORDER BY {sort_column} DESC, {id_column} DESC"
+
+            self._page[mask, False, False] = db.prepare(
+                f"{name}_{mask}",
+                f"SELECT {select} FROM {from_clause} {where} {order} LIMIT %s OFFSET %s"
+            )
+            self._page[mask, True, False] = db.prepare(
+                f"{name}_{mask}_total",
+                f"SELECT {select}{WINDOW_TOTAL} FROM {from_clause} {where} {order} LIMIT %s OFFSET %s"
+            )
+            # Row comparison seeks straight into the (sort_column, id) index
+            self._page[mask, False, True] = db.prepare(
+                f"{name}_{mask}_after",
+                f"SELECT {select} FROM {from_clause} {where} "
+                f"AND ({sort_column}, {id_column}) < (%s, %s) {order} LIMIT %s"
+            )
+            # After a NULL-keyed row: the remaining NULL rows, then every
+            # non-NULL row (the row comparison above never matches NULLs)
+            self._after_null[mask] = db.prepare(
+                f"{name}_{mask}_after_null",
+                f"SELECT {select} FROM {from_clause} {where} "
+                f"AND ({sort_column} IS NOT NULL OR {id_column} < %s) {order} LIMIT %s"
+            )
+            self._count[mask] = db.prepare(
+                f"{name}_{mask}_count",
+                f"SELECT COUNT(*) AS total FROM {count_from or from_clause} {where}"
+            )
+
+    def _filter(self, args: Mapping[str, str]) -> Tuple[int, tuple]:
+        """Filter mask and values, in statement order, for a request"""
+        mask = 0
+        values = []
+        for bit, arg in enumerate(self.args):
+            value = args.get(arg)
+            if value:
+                mask |= 1 << bit
+                values.append(value)
+        return mask, tuple(values)
+
+    def page(
+        self,
+        args: Mapping[str, str],
+        fetch: int,
+        offset: int = 0,
+        position: Optional[Tuple[Optional[datetime], str]] = None,
+        window_total: bool = False
+    ) -> List[Dict]:
+        """
+        Fetch one page of rows
+
+        Args:
+            args: Request query arguments holding the filters
+            fetch: Number of rows to fetch
+            offset: Rows to skip (ignored with a keyset position)
+            position: Keyset position to continue after
+            window_total: Add the _total window column (not with a position)
+
+        Returns:
+            Page rows
+        """
+        mask, values = self._filter(args)
+
+        if position:
+            timestamp, row_id = position
+            if timestamp is None:
+                return db.execute_prepared(self._after_null[mask], values + (row_id, fetch))
+            return db.execute_prepared(self._page[mask, False, True], values + (timestamp, row_id, fetch))
+
+        return db.execute_prepared(self._page[mask, window_total, False], values + (fetch, offset))
+
+    def count(self, args: Mapping[str, str]) -> int:
+        """
+        Count every row matching the request's filters
+
+        Args:
+            args: Request query arguments holding the filters
+
+        Returns:
+            Total match count
+        """
+        mask, values = self._filter(args)
+        row = db.execute_prepared_one(self._count[mask], values)
+        return row['total'] if row else 0
@@ -0,0 +1,80 @@
+"""
+Query Parameter Parsing
+Declarative parsing and validation of request query strings
+"""
+
+from typing import Any, Dict, FrozenSet, Mapping, NamedTuple, Optional
+
+
+class ParamError(ValueError):
+    """Raised when a query parameter is malformed or out of range"""
+
+
+class IntParam(NamedTuple):
+    """Integer parameter; values above ``maximum`` are capped"""
+    default: int
+    minimum: int = 0
+    maximum: Optional[int] = None
+
+
+class ChoiceParam(NamedTuple):
+    """String parameter restricted to a fixed set of values"""
+    choices: FrozenSet[str]
+    default: Optional[str] = None
+
+
+class StrParam(NamedTuple):
+    """Free-form string parameter; empty values count as missing"""
+    default: Optional[str] = None
+
+
+def parse_args(args: Mapping[str, str], schema: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Parse query parameters against a schema
+
+    Args:
+        args: Request query arguments (e.g. request.args)
+        schema: Mapping of parameter name to IntParam/ChoiceParam/StrParam
+
+    Returns:
+        Parsed parameter values, defaults filled in
+
+    Raises:
+        ParamError: If a parameter is invalid
+    """
+    params = {}
+
+    for name, spec in schema.items():
+        raw = args.get(name)
+
+        if not raw:
+            params[name] = spec.default
+            continue
+
+        if isinstance(spec, IntParam):
+            # Plain ASCII digit strings (the common case) skip int()'s
+            # error path; isdigit() alone also accepts e.g. '²'
+            if raw.isascii() and raw.isdigit():
+                value = int(raw)
+            else:
+                try:
+                    value = int(raw)
+                except ValueError:
+                    raise ParamError(f"'{name}' must be an integer")
+
+            if value < spec.minimum:
+                raise ParamError(f"'{name}' must be at least {spec.minimum}")
+            if spec.maximum is not None and value > spec.maximum:
+                value = spec.maximum
+
+            params[name] = value
+
+        elif isinstance(spec, ChoiceParam):
+            if raw not in spec.choices:
+                raise ParamError(f"'{name}' must be one of: {', '.join(sorted(spec.choices))}")
+            params[name] = raw
+
+        else:
+            params[name] = raw
+
+    return params
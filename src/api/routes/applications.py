@@ -7,11 +7,85 @@ import logging
 from flask import Blueprint, request, jsonify
 from ..database import db
 from ..auth import auth
+from ..caching import cache, only_ok, application_key, invalidate_application
+from ..pagination import PAGE_PARAMS, decode_cursor, next_cursor
+from ..params import ParamError, ChoiceParam, StrParam, parse_args
+from .reports import refresh_latest_reports
+from .scans import refresh_portfolio
 
 logger = logging.getLogger(__name__)
 
 applications_bp = Blueprint('applications', __name__)
 
+REQUIRED_APPLICATION_FIELDS = frozenset({'name', 'target_url'})
+
+LIST_APPLICATIONS_PARAMS = {
+    **PAGE_PARAMS,
+    'status': ChoiceParam(frozenset({'active', 'inactive'})),
+    'cursor': StrParam()
+}
+
+# Columns returned by the list endpoint, in SELECT order (the applications
+# table in src/db/schema.sql, minus the bulky configuration and metadata)
+APPLICATION_COLUMNS = (
+    'id', 'name', 'description', 'url', 'owner', 'team', 'criticality',
+    'tags', 'is_active', 'created_at', 'updated_at'
+)
+
+# Hot queries, run as server-side prepared statements
+LIST_APPLICATIONS = db.prepare('list_applications', f"""
+    SELECT {', '.join(APPLICATION_COLUMNS)}, COUNT(*) OVER () AS _total
+    FROM applications
+    WHERE (%s::boolean IS NULL OR is_active = %s)
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s OFFSET %s
+""")
+
+LIST_APPLICATIONS_AFTER = db.prepare('list_applications_after', f"""
+    SELECT {', '.join(APPLICATION_COLUMNS)}
+    FROM applications
+    WHERE (%s::boolean IS NULL OR is_active = %s)
+      AND (created_at, id) < (%s::timestamp, %s::uuid)
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s
+""")
+
+# Continues after a row with a NULL created_at; those sort first under DESC
+LIST_APPLICATIONS_AFTER_NULL = db.prepare('list_applications_after_null', f"""
+    SELECT {', '.join(APPLICATION_COLUMNS)}
+    FROM applications
+    WHERE (%s::boolean IS NULL OR is_active = %s)
+      AND (created_at IS NOT NULL OR id < %s::uuid)
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s
+""")
+
+# Application row with its ten most recent scans aggregated as JSON
+GET_APPLICATION = db.prepare('get_application', """
+    WITH a AS (
+        SELECT * FROM applications WHERE id = %s
+    )
+    SELECT a.*,
+           COALESCE((
+               SELECT json_agg(s ORDER BY s.started_at DESC)
+               FROM (
+                   SELECT id, scan_type, status, started_at, completed_at,
+                          critical_count, high_count, medium_count, low_count, info_count
+                   FROM scans
+                   WHERE application_id = a.id
+                   ORDER BY started_at DESC
+                   LIMIT 10
+               ) s
+           ), '[]'::json) AS recent_scans
+    FROM a
+""")
+
+APPLICATION_STATISTICS = db.prepare('application_statistics', """
+    SELECT *
+    FROM mv_application_portfolio
+    WHERE application_id = %s
+""")
+
 
 @applications_bp.route('', methods=['GET'])
 @auth.require_api_key
@@ -22,78 +96,99 @@ def list_applications():
     Query Parameters:
         - limit: Maximum number of results (default: 50)
         - offset: Offset for pagination (default: 0)
+        - cursor: Keyset cursor from a previous page's next_cursor; replaces offset
         - status: Filter by status (active, inactive)
     """
     try:
-        limit = min(int(request.args.get('limit', 50)), 100)
-        offset = int(request.args.get('offset', 0))
-        status = request.args.get('status')
-
-        query = "SELECT * FROM applications WHERE 1=1"
-        params = []
-
-        if status:
-            query += " AND status = %s"
-            params.append(status)
+        params = parse_args(request.args, LIST_APPLICATIONS_PARAMS)
+    except ParamError as e:
+        return jsonify({'error': str(e)}), 400
 
-        query += " ORDER BY created_at DESC LIMIT %s OFFSET %s"
-        params.extend([limit, offset])
+    limit = params['limit']
+    offset = params['offset']
+    # The status filter maps onto the is_active flag; None matches every row
+    is_active = None if params['status'] is None else params['status'] == 'active'
+    cursor = params['cursor']
 
-        applications = db.execute_query(query, tuple(params))
+    try:
+        if cursor:
+            try:
+                cursor_ts, cursor_id = decode_cursor(cursor)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+
+            # Seek past the cursor instead of scanning and discarding rows
+            if cursor_ts is None:
+                rows = db.execute_prepared_tuples(
+                    LIST_APPLICATIONS_AFTER_NULL,
+                    (is_active, is_active, cursor_id, limit)
+                )
+            else:
+                rows = db.execute_prepared_tuples(
+                    LIST_APPLICATIONS_AFTER,
+                    (is_active, is_active, cursor_ts, cursor_id, limit)
+                )
+            applications = [dict(zip(APPLICATION_COLUMNS, row)) for row in rows]
 
-        # Get total count
-        count_query = "SELECT COUNT(*) as total FROM applications WHERE 1=1"
-        count_params = []
-        if status:
-            count_query += " AND status = %s"
-            count_params.append(status)
+            return jsonify({
+                'applications': applications,
+                'limit': limit,
+                'next_cursor': next_cursor(applications, len(applications) == limit, 'created_at')
+            })
 
-        total = db.execute_one(count_query, tuple(count_params) if count_params else None)
+        # Total comes back as a window column, so one query serves the page
+        # and the count
+        rows = db.execute_prepared_tuples(
+            LIST_APPLICATIONS,
+            (is_active, is_active, limit, offset)
+        )
+        # zip stops at the last column name, dropping the trailing _total
+        applications = [dict(zip(APPLICATION_COLUMNS, row)) for row in rows]
+
+        if rows:
+            total = rows[0][-1]
+        elif offset:
+            # Page past the end: the window count is unavailable
+            row = db.execute_one(
+                "SELECT COUNT(*) AS total FROM applications WHERE (%s::boolean IS NULL OR is_active = %s)",
+                (is_active, is_active)
+            )
+            total = row['total'] if row else 0
+        else:
+            total = 0
 
         return jsonify({
             'applications': applications or [],
-            'total': total['total'] if total else 0,
+            'total': total,
             'limit': limit,
-            'offset': offset
+            'offset': offset,
+            'next_cursor': next_cursor(applications, len(applications) == limit, 'created_at')
         })
 
     except Exception as e:
-        logger.error(f"Failed to list applications: {e}")
+        logger.error("Failed to list applications: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
 @applications_bp.route('/<application_id>', methods=['GET'])
 @auth.require_api_key
+@cache.cached(
+    key_prefix=lambda: application_key('detail', request.view_args['application_id']),
+    response_filter=only_ok
+)
 def get_application(application_id):
     """Get application by ID"""
     try:
-        application = db.execute_one(
-            "SELECT * FROM applications WHERE id = %s",
-            (application_id,)
-        )
+        # One round-trip; recent_scans arrives as a decoded JSON list
+        application = db.execute_prepared_one(GET_APPLICATION, (application_id,))
 
         if not application:
             return jsonify({'error': 'Application not found'}), 404
 
-        # Get recent scans for this application
-        scans = db.execute_query(
-            """
-            SELECT id, scan_type, status, started_at, completed_at,
-                   critical_count, high_count, medium_count, low_count, info_count
-            FROM scans
-            WHERE application_id = %s
-            ORDER BY started_at DESC
-            LIMIT 10
-            """,
-            (application_id,)
-        )
-
-        application['recent_scans'] = scans or []
-
         return jsonify(application)
 
     except Exception as e:
-        logger.error(f"Failed to get application: {e}")
+        logger.error("Failed to get application: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -104,10 +199,9 @@ def create_application():
     try:
         data = request.get_json()
 
-        required_fields = ['name', 'target_url']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({'error': f'Missing required field: {field}'}), 400
+        missing = REQUIRED_APPLICATION_FIELDS - data.keys()
+        if missing:
+            return jsonify({'error': f"Missing required fields: {', '.join(sorted(missing))}"}), 400
 
         application = db.insert('applications', {
             'name': data['name'],
@@ -122,7 +216,7 @@ def create_application():
         return jsonify(application), 201
 
     except Exception as e:
-        logger.error(f"Failed to create application: {e}")
+        logger.error("Failed to create application: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -150,10 +244,12 @@ def update_application(application_id):
         if not application:
             return jsonify({'error': 'Application not found'}), 404
 
+        invalidate_application(application_id)
+
         return jsonify(application)
 
     except Exception as e:
-        logger.error(f"Failed to update application: {e}")
+        logger.error("Failed to update application: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -162,30 +258,33 @@ def update_application(application_id):
 def delete_application(application_id):
     """Delete application"""
     try:
-        # Check if application exists
-        application = db.execute_one(
-            "SELECT * FROM applications WHERE id = %s",
+        # Delete application (cascades to scans due to FK constraint);
+        # no row back means it didn't exist
+        deleted = db.execute_one(
+            "DELETE FROM applications WHERE id = %s RETURNING id",
             (application_id,)
         )
 
-        if not application:
+        if not deleted:
             return jsonify({'error': 'Application not found'}), 404
 
-        # Delete application (cascades to scans due to FK constraint)
-        deleted_count = db.delete('applications', 'id = %s', (application_id,))
-
-        if deleted_count > 0:
-            return jsonify({'message': 'Application deleted successfully'})
-        else:
-            return jsonify({'error': 'Failed to delete application'}), 500
+        # The cascade also removed the application's scans and reports
+        refresh_portfolio()
+        refresh_latest_reports()
+        invalidate_application(application_id)
+        return jsonify({'message': 'Application deleted successfully'})
 
     except Exception as e:
-        logger.error(f"Failed to delete application: {e}")
+        logger.error("Failed to delete application: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
 @applications_bp.route('/<application_id>/statistics', methods=['GET'])
 @auth.require_api_key
+@cache.cached(
+    key_prefix=lambda: application_key('stats', request.view_args['application_id']),
+    response_filter=only_ok
+)
 def get_application_statistics(application_id):
     """Get vulnerability statistics for application"""
     try:
@@ -198,15 +297,8 @@ def get_application_statistics(application_id):
         if not application:
             return jsonify({'error': 'Application not found'}), 404
 
-        # Get statistics from view
-        stats = db.execute_one(
-            """
-            SELECT *
-            FROM vw_application_portfolio
-            WHERE application_id = %s
-            """,
-            (application_id,)
-        )
+        # Get statistics from the materialized view (refreshed as scans finish)
+        stats = db.execute_prepared_one(APPLICATION_STATISTICS, (application_id,))
 
         if not stats:
             return jsonify({
@@ -223,5 +315,5 @@ def get_application_statistics(application_id):
         return jsonify(stats)
 
     except Exception as e:
-        logger.error(f"Failed to get application statistics: {e}")
+        logger.error("Failed to get application statistics: %s", e)
         return jsonify({'error': str(e)}), 500
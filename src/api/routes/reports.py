@@ -3,16 +3,61 @@ Reports API Routes
 Endpoints for managing scan reports
 """
 
+import os
+import hashlib
 import logging
-from flask import Blueprint, request, jsonify, send_file
+from flask import Blueprint, Response, current_app, request, jsonify, send_file
 from pathlib import Path
 from ..database import db
 from ..auth import auth
+from ..caching import conditional_json
+from ..pagination import (
+    PAGE_PARAMS, ListQuery, wants_total, split_page, pop_window_total, cursor_position, next_cursor
+)
+from ..params import parse_args
 
 logger = logging.getLogger(__name__)
 
 reports_bp = Blueprint('reports', __name__)
 
+# Directory report files are written under
+REPORTS_ROOT = Path(os.getenv('REPORTS_ROOT', 'reports')).resolve()
+
+# nginx internal location serving REPORTS_ROOT (e.g. /internal/reports/); when
+# set, downloads are handed to nginx with X-Accel-Redirect instead of being
+# read by the worker
+ACCEL_REDIRECT_PREFIX = os.getenv('REPORTS_ACCEL_REDIRECT_PREFIX')
+
+# Content type served for each report format
+MIME_TYPES = {
+    'html': 'text/html',
+    'json': 'application/json',
+    'pdf': 'application/pdf',
+    'sarif': 'application/json'
+}
+
+
+def refresh_latest_reports():
+    """Refresh the latest-report-per-application view after reports change"""
+    try:
+        db.refresh_materialized_view('mv_latest_reports')
+    except Exception as e:
+        # The view catches up on the next report change; don't fail the write
+        logger.warning("Failed to refresh latest reports: %s", e)
+
+
+LIST_REPORTS = ListQuery(
+    'list_reports',
+    select='r.*, s.scan_type, a.name as application_name',
+    from_clause="""reports r
+        LEFT JOIN scans s ON r.scan_id = s.id
+        LEFT JOIN applications a ON s.application_id = a.id""",
+    filters=[('scan_id', 'r.scan_id'), ('application_id', 's.application_id'), ('format', 'r.format')],
+    sort_column='r.generated_at',
+    id_column='r.id',
+    count_from='reports r LEFT JOIN scans s ON r.scan_id = s.id'
+)
+
 
 @reports_bp.route('', methods=['GET'])
 @auth.require_api_key
@@ -26,73 +71,80 @@ def list_reports():
         - format: Filter by format (html, json, pdf, sarif)
         - limit: Maximum number of results (default: 50)
         - offset: Offset for pagination (default: 0)
+        - cursor: next_cursor from the previous page; replaces offset
+        - after_ts, after_id: Explicit keyset position; alternative to cursor
+        - include_total: Also return the total match count (slower)
     """
     try:
-        limit = min(int(request.args.get('limit', 50)), 100)
-        offset = int(request.args.get('offset', 0))
-        scan_id = request.args.get('scan_id')
-        application_id = request.args.get('application_id')
-        format_type = request.args.get('format')
-
-        query = """
-            SELECT r.*, s.scan_type, a.name as application_name
-            FROM reports r
-            LEFT JOIN scans s ON r.scan_id = s.id
-            LEFT JOIN applications a ON s.application_id = a.id
-            WHERE 1=1
-        """
-        params = []
-
-        if scan_id:
-            query += " AND r.scan_id = %s"
-            params.append(scan_id)
-
-        if application_id:
-            query += " AND s.application_id = %s"
-            params.append(application_id)
-
-        if format_type:
-            query += " AND r.format = %s"
-            params.append(format_type)
-
-        query += " ORDER BY r.generated_at DESC LIMIT %s OFFSET %s"
-        params.extend([limit, offset])
-
-        reports = db.execute_query(query, tuple(params))
-
-        # Get total count
-        count_query = "SELECT COUNT(*) as total FROM reports r LEFT JOIN scans s ON r.scan_id = s.id WHERE 1=1"
-        count_params = []
-
-        if scan_id:
-            count_query += " AND r.scan_id = %s"
-            count_params.append(scan_id)
-        if application_id:
-            count_query += " AND s.application_id = %s"
-            count_params.append(application_id)
-        if format_type:
-            count_query += " AND r.format = %s"
-            count_params.append(format_type)
+        try:
+            page_params = parse_args(request.args, PAGE_PARAMS)
+            position = cursor_position(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        limit = page_params['limit']
+        offset = page_params['offset']
+
+        if position:
+            offset = 0
+
+        # The window count sees every filtered row, but not the rows a
+        # keyset position skips, so with a cursor the total is counted apart
+        include_total = wants_total(request.args)
+        window_total = include_total and not position
+
+        # One extra row tells us whether another page exists, without a COUNT
+        rows = LIST_REPORTS.page(request.args, limit + 1, offset, position, window_total)
+        total = pop_window_total(rows) if window_total else None
+        reports, has_more = split_page(rows, limit)
+
+        response = {
+            'reports': reports,
+            'limit': limit,
+            'offset': offset,
+            'has_more': has_more,
+            'next_cursor': next_cursor(reports, has_more, 'generated_at')
+        }
 
-        total = db.execute_one(count_query, tuple(count_params) if count_params else None)
+        if include_total:
+            if total is None:
+                # Cursor page, or a page past the end with no row to carry the count
+                total = LIST_REPORTS.count(request.args)
+            response['total'] = total
 
-        return jsonify({
-            'reports': reports or [],
-            'total': total['total'] if total else 0,
-            'limit': limit,
-            'offset': offset
-        })
+        return jsonify(response)
 
     except Exception as e:
-        logger.error(f"Failed to list reports: {e}")
+        logger.error("Failed to list reports: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
-@reports_bp.route('/<report_id>', methods=['GET'])
+@reports_bp.route('/<report_id>', methods=['GET', 'HEAD'])
 @auth.require_api_key
 def get_report(report_id):
-    """Get report metadata by ID"""
+    """
+    Get report metadata by ID
+
+    HEAD returns only Last-Modified (the report's generated_at), and GET
+    honours If-Modified-Since, so pollers can check for changes cheaply.
+    """
     try:
+        if request.method == 'HEAD' or request.if_modified_since:
+            # Answer polls from the timestamp alone, before the joins
+            stamp = db.execute_one(
+                "SELECT generated_at FROM reports WHERE id = %s",
+                (report_id,)
+            )
+
+            if not stamp:
+                return jsonify({'error': 'Report not found'}), 404
+
+            response = current_app.response_class()
+            response.last_modified = stamp['generated_at']
+            response = response.make_conditional(request)
+            if request.method == 'HEAD' or response.status_code == 304:
+                return response
+
         report = db.execute_one(
             """
             SELECT r.*, s.scan_type, a.name as application_name, a.id as application_id
@@ -107,10 +159,10 @@ def get_report(report_id):
         if not report:
             return jsonify({'error': 'Report not found'}), 404
 
-        return jsonify(report)
+        return conditional_json(report, last_modified=report['generated_at'])
 
     except Exception as e:
-        logger.error(f"Failed to get report: {e}")
+        logger.error("Failed to get report: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -127,30 +179,45 @@ def download_report(report_id):
         if not report:
             return jsonify({'error': 'Report not found'}), 404
 
-        # Check if file exists
+        mime_type = MIME_TYPES.get(report['format'], 'application/octet-stream')
+        download_name = f"report_{report_id}.{report['format']}"
         file_path = Path(report['file_path'])
-        if not file_path.exists():
+        # Rows with a digest were resolved and checked against REPORTS_ROOT
+        # by create_report; older rows are checked here
+        checksum = report.get('file_sha256')
+
+        if not checksum:
+            file_path = file_path.resolve()
+            if not file_path.is_relative_to(REPORTS_ROOT):
+                return jsonify({'error': 'Report file is outside the reports directory'}), 404
+
+        if ACCEL_REDIRECT_PREFIX:
+            # nginx sends the file itself; the worker only returns headers
+            response = Response(mimetype=mime_type)
+            response.headers['X-Accel-Redirect'] = (
+                ACCEL_REDIRECT_PREFIX.rstrip('/') + '/' +
+                file_path.relative_to(REPORTS_ROOT).as_posix()
+            )
+            response.headers['Content-Disposition'] = f'attachment; filename="{download_name}"'
+            if checksum:
+                response.set_etag(checksum)
+                return response.make_conditional(request)
+            return response
+
+        # send_file streams through wsgi.file_wrapper (sendfile under gunicorn)
+        try:
+            return send_file(
+                str(file_path),
+                mimetype=mime_type,
+                as_attachment=True,
+                download_name=download_name,
+                etag=checksum or True
+            )
+        except FileNotFoundError:
             return jsonify({'error': 'Report file not found on disk'}), 404
 
-        # Determine MIME type
-        mime_types = {
-            'html': 'text/html',
-            'json': 'application/json',
-            'pdf': 'application/pdf',
-            'sarif': 'application/json'
-        }
-
-        mime_type = mime_types.get(report['format'], 'application/octet-stream')
-
-        return send_file(
-            str(file_path),
-            mimetype=mime_type,
-            as_attachment=True,
-            download_name=f"report_{report_id}.{report['format']}"
-        )
-
     except Exception as e:
-        logger.error(f"Failed to download report: {e}")
+        logger.error("Failed to download report: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -166,6 +233,17 @@ def create_report():
             if field not in data:
                 return jsonify({'error': f'Missing required field: {field}'}), 400
 
+        file_path = Path(data['file_path']).resolve()
+        if not file_path.is_relative_to(REPORTS_ROOT):
+            return jsonify({'error': 'file_path must be inside the reports directory'}), 400
+
+        try:
+            with open(file_path, 'rb') as f:
+                checksum = hashlib.file_digest(f, 'sha256').hexdigest()
+                file_size = os.fstat(f.fileno()).st_size
+        except OSError:
+            return jsonify({'error': 'Report file not found'}), 400
+
         # Verify scan exists
         scan = db.execute_one(
             "SELECT * FROM scans WHERE id = %s",
@@ -177,17 +255,21 @@ def create_report():
 
         report = db.insert('reports', {
             'scan_id': data['scan_id'],
+            'application_id': scan['application_id'],
             'format': data['format'],
-            'file_path': data['file_path'],
-            'file_size': data.get('file_size'),
+            'file_path': str(file_path),
+            'file_size': file_size,
+            'file_sha256': checksum,
             's3_bucket': data.get('s3_bucket'),
             's3_key': data.get('s3_key')
         })
 
+        refresh_latest_reports()
+
         return jsonify(report), 201
 
     except Exception as e:
-        logger.error(f"Failed to create report: {e}")
+        logger.error("Failed to create report: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -199,12 +281,13 @@ def delete_report(report_id):
         deleted_count = db.delete('reports', 'id = %s', (report_id,))
 
         if deleted_count > 0:
+            refresh_latest_reports()
             return jsonify({'message': 'Report deleted successfully'})
         else:
             return jsonify({'error': 'Report not found'}), 404
 
     except Exception as e:
-        logger.error(f"Failed to delete report: {e}")
+        logger.error("Failed to delete report: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -220,13 +303,9 @@ def get_latest_reports():
             # Latest report for specific application
             report = db.execute_one(
                 """
-                SELECT r.*, s.scan_type, a.name as application_name
-                FROM reports r
-                LEFT JOIN scans s ON r.scan_id = s.id
-                LEFT JOIN applications a ON s.application_id = a.id
-                WHERE s.application_id = %s AND r.format = %s
-                ORDER BY r.generated_at DESC
-                LIMIT 1
+                SELECT *
+                FROM mv_latest_reports
+                WHERE application_id = %s AND format = %s
                 """,
                 (application_id, format_type)
             )
@@ -240,15 +319,9 @@ def get_latest_reports():
             # Latest report for each application
             reports = db.execute_query(
                 """
-                WITH ranked_reports AS (
-                    SELECT r.*, s.scan_type, a.name as application_name, a.id as application_id,
-                           ROW_NUMBER() OVER (PARTITION BY s.application_id ORDER BY r.generated_at DESC) as rn
-                    FROM reports r
-                    LEFT JOIN scans s ON r.scan_id = s.id
-                    LEFT JOIN applications a ON s.application_id = a.id
-                    WHERE r.format = %s
-                )
-                SELECT * FROM ranked_reports WHERE rn = 1
+                SELECT *
+                FROM mv_latest_reports
+                WHERE format = %s
                 ORDER BY generated_at DESC
                 """,
                 (format_type,)
@@ -260,5 +333,5 @@ def get_latest_reports():
             })
 
     except Exception as e:
-        logger.error(f"Failed to get latest reports: {e}")
+        logger.error("Failed to get latest reports: %s", e)
         return jsonify({'error': str(e)}), 500
@@ -5,14 +5,60 @@ Endpoints for managing security scans
 
 import logging
 from flask import Blueprint, request, jsonify
-from datetime import datetime
-from ..database import db
+from ..database import db, RawSQL
 from ..auth import auth
+from ..caching import (
+    cache, STATS_TIMEOUT, generation, bump_generation, conditional_json, invalidate_application
+)
+from ..pagination import (
+    PAGE_PARAMS, ListQuery, wants_total, split_page, pop_window_total, cursor_position, next_cursor
+)
+from ..params import IntParam, parse_args
+from .reports import refresh_latest_reports
 
 logger = logging.getLogger(__name__)
 
 scans_bp = Blueprint('scans', __name__)
 
+# Scan statuses after which the portfolio statistics change
+FINISHED_STATUSES = frozenset({'completed', 'failed'})
+
+# The recent-scans feed is a short dashboard list, capped lower than paged lists
+RECENT_SCANS_PARAMS = {'limit': IntParam(10, minimum=1, maximum=50)}
+
+LIST_SCANS = ListQuery(
+    'list_scans',
+    select='s.*, a.name as application_name',
+    from_clause='scans s LEFT JOIN applications a ON s.application_id = a.id',
+    filters=[('application_id', 's.application_id'), ('status', 's.status'), ('scan_type', 's.scan_type')],
+    sort_column='s.started_at',
+    id_column='s.id',
+    count_from='scans s'
+)
+
+# Removes a scan and its dependent rows in one statement, so the delete is
+# all-or-nothing whether or not the foreign keys cascade
+DELETE_SCAN = db.prepare('delete_scan', """
+    WITH deleted_vulnerabilities AS (
+        DELETE FROM vulnerabilities WHERE scan_id = %s
+    ), deleted_reports AS (
+        DELETE FROM reports WHERE scan_id = %s
+    ), deleted_notifications AS (
+        DELETE FROM notifications WHERE scan_id = %s
+    )
+    DELETE FROM scans WHERE id = %s
+    RETURNING id, application_id
+""")
+
+
+def refresh_portfolio():
+    """Refresh the application portfolio statistics after scans finish or are deleted"""
+    try:
+        db.refresh_materialized_view('mv_application_portfolio')
+    except Exception as e:
+        # Statistics catch up on the next scan change; don't fail the write
+        logger.warning("Failed to refresh application portfolio: %s", e)
+
 
 @scans_bp.route('', methods=['GET'])
 @auth.require_api_key
@@ -26,64 +72,51 @@ def list_scans():
         - scan_type: Filter by scan type (full, quick, incremental)
         - limit: Maximum number of results (default: 50)
         - offset: Offset for pagination (default: 0)
+        - cursor: next_cursor from the previous page; replaces offset
+        - after_ts, after_id: Explicit keyset position; alternative to cursor
+        - include_total: Also return the total match count (slower)
     """
     try:
-        limit = min(int(request.args.get('limit', 50)), 100)
-        offset = int(request.args.get('offset', 0))
-        application_id = request.args.get('application_id')
-        status = request.args.get('status')
-        scan_type = request.args.get('scan_type')
-
-        query = """
-            SELECT s.*, a.name as application_name
-            FROM scans s
-            LEFT JOIN applications a ON s.application_id = a.id
-            WHERE 1=1
-        """
-        params = []
-
-        if application_id:
-            query += " AND s.application_id = %s"
-            params.append(application_id)
-
-        if status:
-            query += " AND s.status = %s"
-            params.append(status)
-
-        if scan_type:
-            query += " AND s.scan_type = %s"
-            params.append(scan_type)
-
-        query += " ORDER BY s.started_at DESC LIMIT %s OFFSET %s"
-        params.extend([limit, offset])
-
-        scans = db.execute_query(query, tuple(params))
-
-        # Get total count
-        count_query = "SELECT COUNT(*) as total FROM scans WHERE 1=1"
-        count_params = []
-
-        if application_id:
-            count_query += " AND application_id = %s"
-            count_params.append(application_id)
-        if status:
-            count_query += " AND status = %s"
-            count_params.append(status)
-        if scan_type:
-            count_query += " AND scan_type = %s"
-            count_params.append(scan_type)
+        try:
+            page_params = parse_args(request.args, PAGE_PARAMS)
+            position = cursor_position(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        limit = page_params['limit']
+        offset = page_params['offset']
+
+        if position:
+            offset = 0
+
+        # The window count sees every filtered row, but not the rows a
+        # keyset position skips, so with a cursor the total is counted apart
+        include_total = wants_total(request.args)
+        window_total = include_total and not position
+
+        # One extra row tells us whether another page exists, without a COUNT
+        rows = LIST_SCANS.page(request.args, limit + 1, offset, position, window_total)
+        total = pop_window_total(rows) if window_total else None
+        scans, has_more = split_page(rows, limit)
+
+        response = {
+            'scans': scans,
+            'limit': limit,
+            'offset': offset,
+            'has_more': has_more,
+            'next_cursor': next_cursor(scans, has_more, 'started_at')
+        }
 
-        total = db.execute_one(count_query, tuple(count_params) if count_params else None)
+        if include_total:
+            if total is None:
+                # Cursor page, or a page past the end with no row to carry the count
+                total = LIST_SCANS.count(request.args)
+            response['total'] = total
 
-        return jsonify({
-            'scans': scans or [],
-            'total': total['total'] if total else 0,
-            'limit': limit,
-            'offset': offset
-        })
+        return jsonify(response)
 
     except Exception as e:
-        logger.error(f"Failed to list scans: {e}")
+        logger.error("Failed to list scans: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -105,8 +138,8 @@ def get_scan(scan_id):
         if not scan:
             return jsonify({'error': 'Scan not found'}), 404
 
-        # Get vulnerability summary
-        vulnerabilities = db.execute_query(
+        # Get vulnerability summary; (key, value) tuples build the dict directly
+        scan['vulnerability_summary'] = dict(db.execute_query_tuples(
             """
             SELECT severity, COUNT(*) as count
             FROM vulnerabilities
@@ -114,16 +147,12 @@ def get_scan(scan_id):
             GROUP BY severity
             """,
             (scan_id,)
-        )
-
-        scan['vulnerability_summary'] = {
-            v['severity']: v['count'] for v in vulnerabilities
-        } if vulnerabilities else {}
+        ))
 
-        return jsonify(scan)
+        return conditional_json(scan)
 
     except Exception as e:
-        logger.error(f"Failed to get scan: {e}")
+        logger.error("Failed to get scan: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -144,27 +173,27 @@ def create_scan():
         if 'application_id' not in data:
             return jsonify({'error': 'Missing required field: application_id'}), 400
 
-        # Verify application exists
-        application = db.execute_one(
-            "SELECT * FROM applications WHERE id = %s",
-            (data['application_id'],)
+        # Insert only if the application exists; no row back means it doesn't
+        scan = db.execute_one(
+            """
+            INSERT INTO scans (application_id, scan_type, target_url, status)
+            SELECT a.id, %s, COALESCE(%s, a.target_url), 'pending'
+            FROM applications a
+            WHERE a.id = %s
+            RETURNING *
+            """,
+            (data.get('scan_type', 'full'), data.get('target_url'), data['application_id'])
         )
 
-        if not application:
+        if not scan:
             return jsonify({'error': 'Application not found'}), 404
 
-        scan = db.insert('scans', {
-            'application_id': data['application_id'],
-            'scan_type': data.get('scan_type', 'full'),
-            'target_url': data.get('target_url', application['target_url']),
-            'status': 'pending',
-            'started_at': datetime.utcnow()
-        })
+        bump_generation('scans')
 
         return jsonify(scan), 201
 
     except Exception as e:
-        logger.error(f"Failed to create scan: {e}")
+        logger.error("Failed to create scan: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -185,7 +214,7 @@ def update_scan(scan_id):
 
         # Set completed_at if status is completed or failed
         if data.get('status') in ['completed', 'failed'] and 'completed_at' not in data:
-            data['completed_at'] = datetime.utcnow()
+            data['completed_at'] = RawSQL('NOW()')
 
         scan = db.update(
             'scans',
@@ -197,10 +226,17 @@ def update_scan(scan_id):
         if not scan:
             return jsonify({'error': 'Scan not found'}), 404
 
+        if scan['status'] in FINISHED_STATUSES:
+            refresh_portfolio()
+
+        # Scan progress and results feed the application's cached views
+        invalidate_application(scan['application_id'])
+        bump_generation('scans')
+
         return jsonify(scan)
 
     except Exception as e:
-        logger.error(f"Failed to update scan: {e}")
+        logger.error("Failed to update scan: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -209,15 +245,21 @@ def update_scan(scan_id):
 def delete_scan(scan_id):
     """Delete scan and associated data"""
     try:
-        deleted_count = db.delete('scans', 'id = %s', (scan_id,))
-
-        if deleted_count > 0:
+        deleted = db.execute_prepared_one(DELETE_SCAN, (scan_id,) * 4)
+
+        if deleted:
+            # The delete also removed the scan's reports
+            refresh_portfolio()
+            refresh_latest_reports()
+            invalidate_application(deleted['application_id'])
+            bump_generation('scans')
+            bump_generation('vulnerabilities')
             return jsonify({'message': 'Scan deleted successfully'})
         else:
             return jsonify({'error': 'Scan not found'}), 404
 
     except Exception as e:
-        logger.error(f"Failed to delete scan: {e}")
+        logger.error("Failed to delete scan: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -226,7 +268,10 @@ def delete_scan(scan_id):
 def get_recent_scans():
     """Get recent scans across all applications"""
     try:
-        limit = min(int(request.args.get('limit', 10)), 50)
+        try:
+            limit = parse_args(request.args, RECENT_SCANS_PARAMS)['limit']
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
 
         scans = db.execute_query(
             """
@@ -243,50 +288,58 @@ def get_recent_scans():
         })
 
     except Exception as e:
-        logger.error(f"Failed to get recent scans: {e}")
+        logger.error("Failed to get recent scans: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
-@scans_bp.route('/statistics', methods=['GET'])
-@auth.require_api_key
-def get_scan_statistics():
-    """Get overall scan statistics"""
-    try:
-        # Get various statistics
-        stats = {}
+@cache.memoize(timeout=STATS_TIMEOUT)
+def _scan_statistics(scans_generation: int) -> dict:
+    """
+    Compute overall scan statistics
 
-        # Total scans
-        total = db.execute_one("SELECT COUNT(*) as total FROM scans")
-        stats['total_scans'] = total['total'] if total else 0
+    Args:
+        scans_generation: Scans generation, part of the cache key
 
-        # Scans by status
-        by_status = db.execute_query(
-            "SELECT status, COUNT(*) as count FROM scans GROUP BY status"
-        )
-        stats['by_status'] = {
-            s['status']: s['count'] for s in by_status
-        } if by_status else {}
+    Returns:
+        Statistics dictionary
+    """
+    stats = {}
+
+    # Total scans
+    total = db.execute_one("SELECT COUNT(*) as total FROM scans")
+    stats['total_scans'] = total['total'] if total else 0
+
+    # Scans by status and by type, as (key, count) tuples
+    stats['by_status'] = dict(db.execute_query_tuples(
+        "SELECT status, COUNT(*) as count FROM scans GROUP BY status"
+    ))
+    stats['by_type'] = dict(db.execute_query_tuples(
+        "SELECT scan_type, COUNT(*) as count FROM scans GROUP BY scan_type"
+    ))
+
+    # Recent scans (last 7 days)
+    recent = db.execute_one(
+        """
+        SELECT COUNT(*) as count
+        FROM scans
+        WHERE started_at >= NOW() - INTERVAL '7 days'
+        """
+    )
+    stats['last_7_days'] = recent['count'] if recent else 0
 
-        # Scans by type
-        by_type = db.execute_query(
-            "SELECT scan_type, COUNT(*) as count FROM scans GROUP BY scan_type"
-        )
-        stats['by_type'] = {
-            s['scan_type']: s['count'] for s in by_type
-        } if by_type else {}
+    return stats
 
-        # Recent scans (last 7 days)
-        recent = db.execute_one(
-            """
-            SELECT COUNT(*) as count
-            FROM scans
-            WHERE started_at >= NOW() - INTERVAL '7 days'
-            """
-        )
-        stats['last_7_days'] = recent['count'] if recent else 0
 
-        return jsonify(stats)
+@scans_bp.route('/statistics', methods=['GET'])
+@auth.require_api_key
+def get_scan_statistics():
+    """Get overall scan statistics"""
+    try:
+        response = conditional_json(_scan_statistics(generation('scans')))
+        response.cache_control.private = True
+        response.cache_control.max_age = STATS_TIMEOUT
+        return response
 
     except Exception as e:
-        logger.error(f"Failed to get scan statistics: {e}")
+        logger.error("Failed to get scan statistics: %s", e)
         return jsonify({'error': str(e)}), 500
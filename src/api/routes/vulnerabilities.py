@@ -4,14 +4,75 @@ Endpoints for managing vulnerabilities
 """
 
 import logging
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, current_app, request, jsonify
 from ..database import db
+from ..json_provider import ndjson_encoder
 from ..auth import auth
+from ..caching import cache, STATS_TIMEOUT, generation, bump_generation, conditional_json
+from ..pagination import (
+    PAGE_PARAMS, ListQuery, wants_total, split_page, pop_window_total, cursor_position, next_cursor
+)
+from ..params import parse_args
 
 logger = logging.getLogger(__name__)
 
 vulnerabilities_bp = Blueprint('vulnerabilities', __name__)
 
+# Fields every vulnerability needs besides its scan_id
+REQUIRED_ITEM_FIELDS = ('name', 'severity')
+REQUIRED_VULNERABILITY_FIELDS = ('scan_id',) + REQUIRED_ITEM_FIELDS
+
+# Columns of a new vulnerability taken from the request body
+ITEM_COLUMNS = (
+    'name', 'severity', 'confidence', 'description', 'url', 'method', 'parameter',
+    'evidence', 'solution', 'reference', 'cwe_id', 'category', 'status'
+)
+
+# Columns written for each new vulnerability; the first two come from its scan
+VULNERABILITY_COLUMNS = ('scan_id', 'application_id') + ITEM_COLUMNS
+
+# Inserts one vulnerability only if its scan exists, in a single round trip
+CREATE_VULNERABILITY = f"""
+    INSERT INTO vulnerabilities ({', '.join(VULNERABILITY_COLUMNS)})
+    SELECT s.id, s.application_id, {', '.join(['%s'] * len(ITEM_COLUMNS))}
+    FROM scans s
+    WHERE s.id = %s
+    RETURNING *
+"""
+
+# Largest batch accepted by POST /vulnerabilities/bulk
+MAX_BULK_VULNERABILITIES = 5000
+
+LIST_VULNERABILITIES = ListQuery(
+    'list_vulnerabilities',
+    select='v.*, s.scan_type, a.name as application_name',
+    from_clause="""vulnerabilities v
+        LEFT JOIN scans s ON v.scan_id = s.id
+        LEFT JOIN applications a ON s.application_id = a.id""",
+    filters=[
+        ('scan_id', 'v.scan_id'), ('application_id', 's.application_id'),
+        ('severity', 'v.severity'), ('status', 'v.status')
+    ],
+    sort_column='v.discovered_at',
+    id_column='v.id',
+    count_from='vulnerabilities v LEFT JOIN scans s ON v.scan_id = s.id'
+)
+
+SUMMARY_SEVERITIES = frozenset({'critical', 'high', 'medium', 'low', 'info'})
+
+# Fields of the overall vulnerability summary, in response order
+SUMMARY_FIELDS = (
+    'total_vulnerabilities', 'critical', 'high', 'medium', 'low', 'info',
+    'open_count', 'fixed_count'
+)
+
+
+def _item_values(data: dict) -> tuple:
+    """ITEM_COLUMNS values for a new vulnerability from a request body"""
+    values = {column: data.get(column) for column in ITEM_COLUMNS}
+    values['status'] = data.get('status', 'open')
+    return tuple(values.values())
+
 
 @vulnerabilities_bp.route('', methods=['GET'])
 @auth.require_api_key
@@ -26,76 +87,105 @@ def list_vulnerabilities():
         - status: Filter by status (open, fixed, false_positive, accepted)
         - limit: Maximum number of results (default: 50)
         - offset: Offset for pagination (default: 0)
+        - cursor: next_cursor from the previous page; replaces offset
+        - after_ts, after_id: Explicit keyset position; alternative to cursor
+        - include_total: Also return the total match count (slower)
     """
     try:
-        limit = min(int(request.args.get('limit', 50)), 100)
-        offset = int(request.args.get('offset', 0))
-        scan_id = request.args.get('scan_id')
-        application_id = request.args.get('application_id')
-        severity = request.args.get('severity')
-        status = request.args.get('status')
-
-        query = """
-            SELECT v.*, s.scan_type, a.name as application_name
-            FROM vulnerabilities v
-            LEFT JOIN scans s ON v.scan_id = s.id
-            LEFT JOIN applications a ON s.application_id = a.id
-            WHERE 1=1
-        """
-        params = []
-
-        if scan_id:
-            query += " AND v.scan_id = %s"
-            params.append(scan_id)
-
-        if application_id:
-            query += " AND s.application_id = %s"
-            params.append(application_id)
-
-        if severity:
-            query += " AND v.severity = %s"
-            params.append(severity)
-
-        if status:
-            query += " AND v.status = %s"
-            params.append(status)
-
-        query += " ORDER BY v.discovered_at DESC LIMIT %s OFFSET %s"
-        params.extend([limit, offset])
-
-        vulnerabilities = db.execute_query(query, tuple(params))
-
-        # Get total count
-        count_query = "SELECT COUNT(*) as total FROM vulnerabilities v LEFT JOIN scans s ON v.scan_id = s.id WHERE 1=1"
-        count_params = []
-
-        if scan_id:
-            count_query += " AND v.scan_id = %s"
-            count_params.append(scan_id)
-        if application_id:
-            count_query += " AND s.application_id = %s"
-            count_params.append(application_id)
-        if severity:
-            count_query += " AND v.severity = %s"
-            count_params.append(severity)
-        if status:
-            count_query += " AND v.status = %s"
-            count_params.append(status)
-
-        total = db.execute_one(count_query, tuple(count_params) if count_params else None)
-
-        return jsonify({
-            'vulnerabilities': vulnerabilities or [],
-            'total': total['total'] if total else 0,
+        try:
+            page_params = parse_args(request.args, PAGE_PARAMS)
+            position = cursor_position(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        limit = page_params['limit']
+        offset = page_params['offset']
+
+        if position:
+            offset = 0
+
+        # The window count sees every filtered row, but not the rows a
+        # keyset position skips, so with a cursor the total is counted apart
+        include_total = wants_total(request.args)
+        window_total = include_total and not position
+
+        # One extra row tells us whether another page exists, without a COUNT
+        rows = LIST_VULNERABILITIES.page(request.args, limit + 1, offset, position, window_total)
+        total = pop_window_total(rows) if window_total else None
+        vulnerabilities, has_more = split_page(rows, limit)
+
+        response = {
+            'vulnerabilities': vulnerabilities,
             'limit': limit,
-            'offset': offset
-        })
+            'offset': offset,
+            'has_more': has_more,
+            'next_cursor': next_cursor(vulnerabilities, has_more, 'discovered_at')
+        }
+
+        if include_total:
+            if total is None:
+                # Cursor page, or a page past the end with no row to carry the count
+                total = LIST_VULNERABILITIES.count(request.args)
+            response['total'] = total
+
+        return jsonify(response)
 
     except Exception as e:
-        logger.error(f"Failed to list vulnerabilities: {e}")
+        logger.error("Failed to list vulnerabilities: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
+@vulnerabilities_bp.route('/export', methods=['GET'])
+@auth.require_api_key
+def export_vulnerabilities():
+    """
+    Stream all matching vulnerabilities as newline-delimited JSON
+
+    Rows are read through a server-side cursor and written one per line,
+    so memory use stays flat however many vulnerabilities match.
+
+    Query Parameters:
+        - scan_id: Filter by scan ID
+        - application_id: Filter by application ID
+        - severity: Filter by severity (critical, high, medium, low, info)
+        - status: Filter by status (open, fixed, false_positive, accepted)
+    """
+    query = """
+        SELECT v.*, s.scan_type, a.name as application_name
+        FROM vulnerabilities v
+        LEFT JOIN scans s ON v.scan_id = s.id
+        LEFT JOIN applications a ON s.application_id = a.id
+        WHERE 1=1
+    """
+    params = []
+
+    for arg, column in (
+        ('scan_id', 'v.scan_id'),
+        ('application_id', 's.application_id'),
+        ('severity', 'v.severity'),
+        ('status', 'v.status')
+    ):
+        value = request.args.get(arg)
+        if value:
+            query += f" AND {column} = %s"
+            params.append(value)
+
+    query += " ORDER BY v.discovered_at DESC"
+
+    # Bound here: the generator runs after the request context is gone
+    encode = ndjson_encoder(current_app)
+
+    def generate():
+        try:
+            for row in db.stream_query(query, tuple(params)):
+                yield encode(row)
+        except Exception as e:
+            logger.error("Failed to export vulnerabilities: %s", e)
+            raise
+
+    return Response(generate(), mimetype='application/x-ndjson')
+
+
 @vulnerabilities_bp.route('/<vulnerability_id>', methods=['GET'])
 @auth.require_api_key
 def get_vulnerability(vulnerability_id):
@@ -115,10 +205,10 @@ def get_vulnerability(vulnerability_id):
         if not vulnerability:
             return jsonify({'error': 'Vulnerability not found'}), 404
 
-        return jsonify(vulnerability)
+        return conditional_json(vulnerability)
 
     except Exception as e:
-        logger.error(f"Failed to get vulnerability: {e}")
+        logger.error("Failed to get vulnerability: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -129,41 +219,86 @@ def create_vulnerability():
     try:
         data = request.get_json()
 
-        required_fields = ['scan_id', 'name', 'severity']
-        for field in required_fields:
+        for field in REQUIRED_VULNERABILITY_FIELDS:
             if field not in data:
                 return jsonify({'error': f'Missing required field: {field}'}), 400
 
+        # No row back means the scan doesn't exist
+        vulnerability = db.execute_one(
+            CREATE_VULNERABILITY,
+            _item_values(data) + (data['scan_id'],)
+        )
+
+        if not vulnerability:
+            return jsonify({'error': 'Scan not found'}), 404
+
+        bump_generation('vulnerabilities')
+
+        return jsonify(vulnerability), 201
+
+    except Exception as e:
+        logger.error("Failed to create vulnerability: %s", e)
+        return jsonify({'error': str(e)}), 500
+
+
+@vulnerabilities_bp.route('/bulk', methods=['POST'])
+@auth.require_api_key
+def bulk_create_vulnerabilities():
+    """
+    Create many vulnerabilities for one scan in a single request
+
+    Request Body:
+        - scan_id: Scan UUID (required)
+        - items: List of vulnerabilities, each with at least name and severity
+    """
+    try:
+        data = request.get_json()
+
+        scan_id = data.get('scan_id')
+        items = data.get('items')
+
+        if not scan_id:
+            return jsonify({'error': 'Missing required field: scan_id'}), 400
+
+        if not isinstance(items, list) or not items:
+            return jsonify({'error': 'items must be a non-empty list'}), 400
+
+        if len(items) > MAX_BULK_VULNERABILITIES:
+            return jsonify({'error': f'At most {MAX_BULK_VULNERABILITIES} items per request'}), 400
+
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                return jsonify({'error': f'Item {index} must be an object'}), 400
+            for field in REQUIRED_ITEM_FIELDS:
+                if field not in item:
+                    return jsonify({'error': f'Missing required field: {field} (item {index})'}), 400
+
         # Verify scan exists
         scan = db.execute_one(
-            "SELECT * FROM scans WHERE id = %s",
-            (data['scan_id'],)
+            "SELECT id, application_id FROM scans WHERE id = %s",
+            (scan_id,)
         )
 
         if not scan:
             return jsonify({'error': 'Scan not found'}), 404
 
-        vulnerability = db.insert('vulnerabilities', {
-            'scan_id': data['scan_id'],
-            'name': data['name'],
-            'severity': data['severity'],
-            'confidence': data.get('confidence'),
-            'description': data.get('description'),
-            'url': data.get('url'),
-            'method': data.get('method'),
-            'parameter': data.get('parameter'),
-            'evidence': data.get('evidence'),
-            'solution': data.get('solution'),
-            'reference': data.get('reference'),
-            'cwe_id': data.get('cwe_id'),
-            'category': data.get('category'),
-            'status': data.get('status', 'open')
-        })
+        created = db.insert_many(
+            'vulnerabilities',
+            VULNERABILITY_COLUMNS,
+            [(scan['id'], scan['application_id']) + _item_values(item) for item in items],
+            returning='id',
+            page_size=500
+        )
 
-        return jsonify(vulnerability), 201
+        bump_generation('vulnerabilities')
+
+        return jsonify({
+            'created': len(created),
+            'ids': [row['id'] for row in created]
+        }), 201
 
     except Exception as e:
-        logger.error(f"Failed to create vulnerability: {e}")
+        logger.error("Failed to bulk create vulnerabilities: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -192,10 +327,12 @@ def update_vulnerability(vulnerability_id):
         if not vulnerability:
             return jsonify({'error': 'Vulnerability not found'}), 404
 
+        bump_generation('vulnerabilities')
+
         return jsonify(vulnerability)
 
     except Exception as e:
-        logger.error(f"Failed to update vulnerability: {e}")
+        logger.error("Failed to update vulnerability: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -207,63 +344,77 @@ def delete_vulnerability(vulnerability_id):
         deleted_count = db.delete('vulnerabilities', 'id = %s', (vulnerability_id,))
 
         if deleted_count > 0:
+            bump_generation('vulnerabilities')
             return jsonify({'message': 'Vulnerability deleted successfully'})
         else:
             return jsonify({'error': 'Vulnerability not found'}), 404
 
     except Exception as e:
-        logger.error(f"Failed to delete vulnerability: {e}")
+        logger.error("Failed to delete vulnerability: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
+@cache.memoize(timeout=STATS_TIMEOUT)
+def _vulnerability_summary(application_id: str, vulnerabilities_generation: int) -> dict:
+    """
+    Compute vulnerability summary statistics
+
+    Args:
+        application_id: Application to summarize, or '' for all
+        vulnerabilities_generation: Vulnerabilities generation, part of the cache key
+
+    Returns:
+        Summary dictionary
+    """
+    # Counters are kept per (application, severity, status) by triggers,
+    # so this reads a few rows however many vulnerabilities exist
+    if application_id:
+        rows = db.execute_query(
+            """
+            SELECT severity, status, n as count
+            FROM vulnerability_counters
+            WHERE application_id = %s
+            """,
+            (application_id,)
+        )
+    else:
+        rows = db.execute_query(
+            """
+            SELECT severity, status, SUM(n) as count
+            FROM vulnerability_counters
+            GROUP BY severity, status
+            """
+        )
+
+    summary = dict.fromkeys(SUMMARY_FIELDS, 0)
+    for row in rows:
+        count = int(row['count'])
+        summary['total_vulnerabilities'] += count
+        if row['severity'] in SUMMARY_SEVERITIES:
+            summary[row['severity']] += count
+        if row['status'] == 'open':
+            summary['open_count'] += count
+        elif row['status'] == 'fixed':
+            summary['fixed_count'] += count
+
+    return summary
+
+
 @vulnerabilities_bp.route('/summary', methods=['GET'])
 @auth.require_api_key
 def get_vulnerability_summary():
     """Get vulnerability summary statistics"""
     try:
-        application_id = request.args.get('application_id')
-
-        if application_id:
-            # Summary for specific application
-            summary = db.execute_one(
-                """
-                SELECT *
-                FROM vw_vulnerability_summary
-                WHERE application_id = %s
-                """,
-                (application_id,)
-            )
-        else:
-            # Overall summary
-            summary = db.execute_one(
-                """
-                SELECT
-                    COUNT(*) as total_vulnerabilities,
-                    SUM(CASE WHEN severity = 'critical' THEN 1 ELSE 0 END) as critical,
-                    SUM(CASE WHEN severity = 'high' THEN 1 ELSE 0 END) as high,
-                    SUM(CASE WHEN severity = 'medium' THEN 1 ELSE 0 END) as medium,
-                    SUM(CASE WHEN severity = 'low' THEN 1 ELSE 0 END) as low,
-                    SUM(CASE WHEN severity = 'info' THEN 1 ELSE 0 END) as info,
-                    SUM(CASE WHEN status = 'open' THEN 1 ELSE 0 END) as open_count,
-                    SUM(CASE WHEN status = 'fixed' THEN 1 ELSE 0 END) as fixed_count
-                FROM vulnerabilities
-                """
-            )
-
-        if not summary:
-            return jsonify({
-                'total_vulnerabilities': 0,
-                'critical': 0,
-                'high': 0,
-                'medium': 0,
-                'low': 0,
-                'info': 0,
-                'open_count': 0,
-                'fixed_count': 0
-            })
-
-        return jsonify(summary)
+        summary = _vulnerability_summary(
+            request.args.get('application_id', ''),
+            generation('vulnerabilities')
+        )
+
+        response = conditional_json(summary)
+        response.cache_control.private = True
+        response.cache_control.max_age = STATS_TIMEOUT
+        return response
 
     except Exception as e:
-        logger.error(f"Failed to get vulnerability summary: {e}")
+        logger.error("Failed to get vulnerability summary: %s", e)
         return jsonify({'error': str(e)}), 500
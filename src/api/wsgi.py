@@ -0,0 +1,8 @@
+"""
+WSGI Entry Point
+Application object for production WSGI servers (gunicorn)
+"""
+
+from .app import create_app
+
+app = create_app()
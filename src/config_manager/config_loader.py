@@ -6,16 +6,28 @@ Loads and merges YAML configuration files with environment variable substitution
 import os
 import re
 import yaml
+import pickle
 import logging
+import functools
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
 logger = logging.getLogger(__name__)
 
+# ${VAR_NAME} or ${VAR_NAME:-default} placeholders
+_ENV_VAR_RE = re.compile(r'\$\{([^}^{]+)\}')
+
 
 class ConfigLoader:
     """Loads and processes YAML configuration files"""
 
+    __slots__ = ('config_dir',)
+
     def __init__(self, config_dir: str = "config"):
         """
         Initialize the ConfigLoader
@@ -24,7 +36,9 @@ class ConfigLoader:
             config_dir: Base directory for configuration files
         """
         self.config_dir = Path(config_dir)
-        self.env_var_pattern = re.compile(r'\$\{([^}^{]+)\}')
+
+        if _SafeLoader is yaml.SafeLoader:
+            logger.warning("PyYAML was built without libyaml; configuration parsing will be slow")
 
     def load_yaml(self, file_path: str) -> Dict[str, Any]:
         """
@@ -41,13 +55,10 @@ class ConfigLoader:
             yaml.YAMLError: If YAML is invalid
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Substitute environment variables
-                content = self._substitute_env_vars(content)
-                config = yaml.safe_load(content)
-                logger.info(f"Loaded configuration from {file_path}")
-                return config or {}
+            stat = os.stat(file_path)
+            blob = self._load_yaml_cached(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+            # Each caller gets its own copy, so merging into it can't touch the cache
+            return pickle.loads(blob)
         except FileNotFoundError:
             logger.error(f"Configuration file not found: {file_path}")
             raise
@@ -55,7 +66,39 @@ class ConfigLoader:
             logger.error(f"Invalid YAML in {file_path}: {e}")
             raise
 
-    def _substitute_env_vars(self, content: str) -> str:
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _load_yaml_cached(cls, path: str, mtime_ns: int, size: int) -> bytes:
+        """
+        Read, substitute and parse a YAML file, memoized per file version
+
+        The modification time and size are part of the cache key, so an
+        edited file is parsed again on its next load. Environment variables
+        are substituted when the file is first parsed; clear the cache
+        (ConfigManager.clear_cache) to pick up changes to them.
+
+        Args:
+            path: Absolute path to the YAML file
+            mtime_ns: File modification time in nanoseconds
+            size: File size in bytes
+
+        Returns:
+            Pickled configuration dictionary
+        """
+        with open(path, 'rb') as f:
+            content = f.read()
+
+        # Substitute environment variables; most files have none, and those
+        # go to the parser as bytes for libyaml to decode itself
+        if b'${' in content:
+            content = cls._substitute_env_vars(content.decode('utf-8'))
+
+        config = yaml.load(content, Loader=_SafeLoader)
+        logger.info(f"Loaded configuration from {path}")
+        return pickle.dumps(config or {}, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _substitute_env_vars(content: str) -> str:
         """
         Substitute environment variables in the format ${VAR_NAME} or ${VAR_NAME:-default}
 
@@ -65,22 +108,33 @@ class ConfigLoader:
         Returns:
             Content with environment variables substituted
         """
+        if '${' not in content:
+            return content
+
+        environ = os.environ
+        # A placeholder repeated in the file is resolved once
+        resolved = {}
+
         def replacer(match):
             var_spec = match.group(1)
+            value = resolved.get(var_spec)
+            if value is not None:
+                return value
 
             # Check for default value syntax: ${VAR:-default}
-            if ':-' in var_spec:
-                var_name, default_value = var_spec.split(':-', 1)
-                return os.getenv(var_name.strip(), default_value.strip())
-            else:
-                var_name = var_spec.strip()
-                value = os.getenv(var_name)
-                if value is None:
-                    logger.warning(f"Environment variable '{var_name}' not set, keeping placeholder")
-                    return match.group(0)
-                return value
+            var_name, has_default, default_value = var_spec.partition(':-')
+            value = environ.get(var_name.strip())
+            if value is None:
+                if has_default:
+                    value = default_value.strip()
+                else:
+                    logger.warning(f"Environment variable '{var_name.strip()}' not set, keeping placeholder")
+                    value = match.group(0)
+
+            resolved[var_spec] = value
+            return value
 
-        return self.env_var_pattern.sub(replacer, content)
+        return _ENV_VAR_RE.sub(replacer, content)
 
     def load_global_config(self) -> Dict[str, Any]:
         """
@@ -149,34 +203,98 @@ class ConfigLoader:
 
         return self.load_yaml(str(policy_path))
 
+    def source_files(
+        self,
+        app_name: str,
+        environment: Optional[str] = None,
+        policy_name: Optional[str] = None
+    ) -> List[Path]:
+        """
+        List the files load_complete_config reads for an application
+
+        Args:
+            app_name: Application name
+            environment: Environment name (defaults to ENVIRONMENT env var or 'development')
+            policy_name: Scan policy the configuration names, if any
+
+        Returns:
+            Paths of the global, environment and application files, followed
+            by the policy file and the default policy it falls back to
+        """
+        if environment is None:
+            environment = os.getenv('ENVIRONMENT', 'development')
+
+        files = [
+            self.config_dir / "global.yaml",
+            self.config_dir / "environments" / f"{environment}.yaml",
+            self.config_dir / "applications" / f"{app_name}.yaml"
+        ]
+        if policy_name is not None:
+            files.append(self.config_dir / "scan-policies" / f"{policy_name}.yaml")
+            if policy_name != "default":
+                files.append(self.config_dir / "scan-policies" / "default.yaml")
+
+        return files
+
     def merge_configs(self, *configs: Dict[str, Any]) -> Dict[str, Any]:
         """
         Deep merge multiple configuration dictionaries
         Later configs override earlier ones
 
+        The input configs are never modified, but the merged dictionary
+        shares any subtree that only one of them defines, so changes made
+        to the result can show up in the inputs.
+
         Args:
             *configs: Variable number of configuration dictionaries
 
         Returns:
             Merged configuration dictionary
         """
-        def deep_merge(base: Dict, override: Dict) -> Dict:
-            """Recursively merge two dictionaries"""
-            result = base.copy()
-            for key, value in override.items():
-                if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                    result[key] = deep_merge(result[key], value)
-                else:
-                    result[key] = value
-            return result
-
         merged = {}
+        # Dictionaries created by this merge, and so safe to write into
+        owned = {id(merged)}
         for config in configs:
-            if config:
-                merged = deep_merge(merged, config)
+            self._deep_merge_into(merged, config, owned)
 
         return merged
 
+    @staticmethod
+    def _deep_merge_into(target: Dict[str, Any], override: Dict[str, Any], owned: Set[int]):
+        """
+        Merge a dictionary into target in place, without recursion
+
+        Subtrees are shared rather than copied until both sides define the
+        same key; a shared dictionary is copied the first time it has to be
+        written to.
+
+        Args:
+            target: Dictionary to merge into
+            override: Dictionary whose values take precedence
+            owned: ids of the dictionaries in target that may be modified
+        """
+        if not override:
+            return
+
+        stack = [(target, override)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                existing = dst.get(key)
+                if type(value) is not dict or type(existing) is not dict:
+                    dst[key] = value
+                    continue
+
+                if id(existing) not in owned:
+                    existing = dst[key] = {**existing}
+                    owned.add(id(existing))
+
+                if existing.keys() & value.keys():
+                    stack.append((existing, value))
+                else:
+                    # Disjoint keys: take the override's subtrees as they are
+                    existing.update(value)
+
     def load_complete_config(self, app_name: str, environment: Optional[str] = None) -> Dict[str, Any]:
         """
         Load complete configuration by merging global, environment, and application configs
@@ -202,12 +320,12 @@ class ConfigLoader:
         merged_config = self.merge_configs(global_config, env_config, app_config)
 
         # Load and merge scan policy if specified
-        if 'scan' in merged_config.get('application', {}) and 'policy' in merged_config['application']['scan']:
-            policy_name = merged_config['application']['scan']['policy']
-            scan_policy = self.load_scan_policy(policy_name)
+        app = merged_config.get('application')
+        scan = app.get('scan') if app else None
+        if scan and 'policy' in scan:
+            scan_policy = self.load_scan_policy(scan['policy'])
             # Merge scan policy into the scan configuration
-            if 'application' in merged_config and 'scan' in merged_config['application']:
-                merged_config['application']['scan']['policy_config'] = scan_policy.get('policy', {})
+            scan['policy_config'] = scan_policy.get('policy', {})
 
         logger.info(f"Configuration loaded successfully for '{app_name}'")
         return merged_config
@@ -219,16 +337,8 @@ class ConfigLoader:
         Returns:
             List of application names
         """
-        app_dir = self.config_dir / "applications"
-        if not app_dir.exists():
-            return []
-
-        apps = []
-        for file_path in app_dir.glob("*.yaml"):
-            if file_path.name != "template.yaml":
-                apps.append(file_path.stem)
-
-        return sorted(apps)
+        apps = self._list_config_names(self.config_dir / "applications")
+        return [app for app in apps if app != "template"]
 
     def list_policies(self) -> list:
         """
@@ -237,12 +347,43 @@ class ConfigLoader:
         Returns:
             List of policy names
         """
-        policy_dir = self.config_dir / "scan-policies"
-        if not policy_dir.exists():
+        return self._list_config_names(self.config_dir / "scan-policies")
+
+    def _list_config_names(self, directory: Path) -> list:
+        """
+        List the YAML files in a directory, reusing the last scan while the
+        directory is unchanged
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Sorted file names without the .yaml suffix
+        """
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
 
-        policies = []
-        for file_path in policy_dir.glob("*.yaml"):
-            policies.append(file_path.stem)
+        return list(self._scan_config_names(str(directory), mtime_ns))
 
-        return sorted(policies)
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _scan_config_names(directory: str, mtime_ns: int) -> Tuple[str, ...]:
+        """
+        Scan a directory for YAML files, memoized per directory version
+
+        Adding, removing or renaming a file updates the directory's
+        modification time, so the cached listing is replaced.
+
+        Args:
+            directory: Directory to scan
+            mtime_ns: Directory modification time in nanoseconds
+
+        Returns:
+            Sorted file names without the .yaml suffix
+        """
+        with os.scandir(directory) as entries:
+            names = [entry.name[:-5] for entry in entries if entry.name.endswith('.yaml')]
+        names.sort()
+        return tuple(names)
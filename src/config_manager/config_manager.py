@@ -3,13 +3,50 @@ Configuration Manager
 Main class for configuration management
 """
 
+import os
+import pickle
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple
 from .config_loader import ConfigLoader
 from .config_validator import ConfigValidator
 
 logger = logging.getLogger(__name__)
 
+# Read-only default for walking into optional config sections
+_EMPTY = MappingProxyType({})
+
+# Thresholds used when an application configures none
+_DEFAULT_THRESHOLDS = MappingProxyType({
+    'critical': 0,
+    'high': 5,
+    'medium': 20,
+    'low': None,
+    'info': None
+})
+
+
+def _files_signature(files: List[Path]) -> Tuple[Optional[Tuple[int, int]], ...]:
+    """
+    Snapshot the modification time and size of each file
+
+    Args:
+        files: Paths to check
+
+    Returns:
+        (st_mtime_ns, st_size) per file, None for a missing file
+    """
+    signature = []
+    for path in files:
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+    return tuple(signature)
+
 
 class ConfigManager:
     """
@@ -17,6 +54,8 @@ class ConfigManager:
     Provides high-level interface for configuration operations
     """
 
+    __slots__ = ('loader', 'validator', '_config_cache')
+
     def __init__(self, config_dir: str = "config"):
         """
         Initialize the ConfigManager
@@ -26,6 +65,7 @@ class ConfigManager:
         """
         self.loader = ConfigLoader(config_dir)
         self.validator = ConfigValidator()
+        # (app_name, environment) -> (source files, their signature, pickled config)
         self._config_cache = {}
 
     def get_application_config(
@@ -49,15 +89,23 @@ class ConfigManager:
             ValueError: If configuration is invalid
             FileNotFoundError: If configuration file doesn't exist
         """
-        # Check cache
-        cache_key = f"{app_name}_{environment or 'default'}"
-        if cache_key in self._config_cache:
-            logger.debug(f"Using cached configuration for {cache_key}")
-            return self._config_cache[cache_key]
+        # Check cache; the entry holds while none of its source files changed
+        cache_key = (app_name, environment)
+        cached = self._config_cache.get(cache_key)
+        if cached is not None:
+            files, signature, blob = cached
+            if _files_signature(files) == signature:
+                logger.debug(f"Using cached configuration for {app_name}_{environment or 'default'}")
+                return pickle.loads(blob)
 
         # Load configuration
         config = self.loader.load_complete_config(app_name, environment)
 
+        # Files whose changes retire the cached entry
+        policy_name = config.get('application', _EMPTY).get('scan', _EMPTY).get('policy')
+        files = self.loader.source_files(app_name, environment, policy_name)
+        signature = _files_signature(files)
+
         # Validate if requested
         if validate:
             is_valid, errors, warnings = self.validator.validate_application_config(config)
@@ -72,10 +120,11 @@ class ConfigManager:
                 logger.error(error_msg)
                 raise ValueError(error_msg)
 
-        # Cache the configuration
-        self._config_cache[cache_key] = config
+        # Cache the configuration; each caller gets its own copy of it
+        blob = pickle.dumps(config, pickle.HIGHEST_PROTOCOL)
+        self._config_cache[cache_key] = (files, signature, blob)
 
-        return config
+        return pickle.loads(blob)
 
     def get_scan_policy(self, policy_name: str, validate: bool = True) -> Dict[str, Any]:
         """
@@ -149,18 +198,24 @@ class ConfigManager:
         Returns:
             Dictionary mapping application names to validation results
         """
-        results = {}
         applications = self.list_applications()
+        if not applications:
+            return {}
 
-        for app_name in applications:
+        def validate(app_name: str) -> Tuple[bool, List[str], List[str]]:
             logger.info(f"Validating configuration for '{app_name}'")
-            results[app_name] = self.validate_application(app_name)
+            return self.validate_application(app_name)
 
-        return results
+        # Workers overlap their file reads; files shared between applications
+        # (global and environment config) are parsed once via the loader's cache
+        with ThreadPoolExecutor(max_workers=min(32, len(applications))) as executor:
+            return dict(zip(applications, executor.map(validate, applications)))
 
     def clear_cache(self):
         """Clear the configuration cache"""
         self._config_cache = {}
+        # Parsed files are cached process-wide by ConfigLoader
+        ConfigLoader._load_yaml_cached.cache_clear()
         logger.info("Configuration cache cleared")
 
     def get_scan_config(self, app_name: str, environment: Optional[str] = None) -> Dict[str, Any]:
@@ -175,7 +230,7 @@ class ConfigManager:
             Scan configuration dictionary
         """
         config = self.get_application_config(app_name, environment)
-        return config.get('application', {}).get('scan', {})
+        return config.get('application', _EMPTY).get('scan', {})
 
     def get_notification_config(self, app_name: str, environment: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -189,7 +244,7 @@ class ConfigManager:
             Notification configuration dictionary
         """
         config = self.get_application_config(app_name, environment)
-        return config.get('application', {}).get('notifications', {})
+        return config.get('application', _EMPTY).get('notifications', {})
 
     def get_target_url(self, app_name: str, environment: Optional[str] = None) -> str:
         """
@@ -203,9 +258,9 @@ class ConfigManager:
             Target URL string
         """
         config = self.get_application_config(app_name, environment)
-        return config.get('application', {}).get('url', '')
+        return config.get('application', _EMPTY).get('url', '')
 
-    def get_thresholds(self, app_name: str, environment: Optional[str] = None) -> Dict[str, Optional[int]]:
+    def get_thresholds(self, app_name: str, environment: Optional[str] = None) -> Mapping[str, Optional[int]]:
         """
         Get vulnerability thresholds for an application
 
@@ -214,13 +269,7 @@ class ConfigManager:
             environment: Environment name (optional)
 
         Returns:
-            Dictionary of severity thresholds
+            Mapping of severity thresholds (read-only when the defaults apply)
         """
         scan_config = self.get_scan_config(app_name, environment)
-        return scan_config.get('thresholds', {
-            'critical': 0,
-            'high': 5,
-            'medium': 20,
-            'low': None,
-            'info': None
-        })
+        return scan_config.get('thresholds', _DEFAULT_THRESHOLDS)
@@ -3,22 +3,183 @@ Configuration Validator
 Validates configuration against JSON schemas and business rules
 """
 
+import re
 import logging
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, FrozenSet, List, Tuple
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# local@domain.tld, no whitespace and a single @
+_EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+# Allowed values for enumerated settings
+_CRITICALITIES = frozenset({'critical', 'high', 'medium', 'low'})
+_SCAN_TYPES = frozenset({'full', 'quick', 'incremental'})
+_AUTH_TYPES = frozenset({'form', 'oauth', 'api_key', 'basic', 'session'})
+_SEVERITIES = frozenset({'critical', 'high', 'medium', 'low', 'info'})
+_INTENSITIES = frozenset({'low', 'medium', 'high'})
+_URL_SCHEMES = frozenset({'http', 'https'})
+
+# Five whitespace-separated cron fields
+_CRON_RE = re.compile(r'\s*' + r'\s+'.join([r'\S+'] * 5) + r'\s*')
+
+# Five cron fields, each *, a number, or a list, range or step
+_CRON_FIELD = r'(?:\*|\d+|\S*[,/-]\S*)'
+_PLAIN_CRON_RE = re.compile(r'\s*' + r'\s+'.join([_CRON_FIELD] * 5) + r'\s*')
+
+
+def _validate_required_field(config: Dict, field: str, expected_type: type, errors: List[str]) -> bool:
+    """Validate that a required field exists and has the correct type"""
+    if field not in config:
+        errors.append(f"Required field '{field}' is missing")
+        return False
+
+    if not isinstance(config[field], expected_type):
+        errors.append(f"Field '{field}' must be of type {expected_type.__name__}")
+        return False
+
+    return True
+
+
+def _validate_url(url: str, errors: List[str]) -> bool:
+    """Validate URL format"""
+    try:
+        result = urlparse(url)
+        if not all([result.scheme, result.netloc]):
+            errors.append(f"Invalid URL format: {url}")
+            return False
+
+        if result.scheme not in _URL_SCHEMES:
+            errors.append(f"URL scheme must be http or https: {url}")
+            return False
+
+        return True
+    except Exception as e:
+        errors.append(f"Invalid URL: {url} - {str(e)}")
+        return False
+
+
+def _validate_email(email: str, errors: List[str]) -> bool:
+    """Basic email validation"""
+    if not _EMAIL_RE.fullmatch(email):
+        errors.append(f"Invalid email format: {email}")
+        return False
+    return True
+
+
+def _validate_enum(value: str, allowed_values: FrozenSet[str], errors: List[str]) -> bool:
+    """Validate that value is in allowed set"""
+    # Lists and mappings from YAML are unhashable; reject them before the set lookup
+    if not isinstance(value, (str, bool, int)) or value not in allowed_values:
+        errors.append(f"Value '{value}' must be one of: {', '.join(sorted(allowed_values))}")
+        return False
+    return True
+
+
+def _validate_scan_config(scan_config: Dict[str, Any], errors: List[str], warnings: List[str]) -> bool:
+    """Validate scan configuration"""
+    # Validate scan type
+    if 'type' in scan_config:
+        _validate_enum(scan_config['type'], _SCAN_TYPES, errors)
+
+    # Validate timeout
+    if 'timeout' in scan_config:
+        if not isinstance(scan_config['timeout'], int) or scan_config['timeout'] <= 0:
+            errors.append("Scan timeout must be a positive integer")
+
+    # Validate schedule (cron format)
+    if 'schedule' in scan_config:
+        _validate_cron_schedule(scan_config['schedule'], errors, warnings)
+
+    # Validate thresholds
+    if 'thresholds' in scan_config:
+        _validate_thresholds(scan_config['thresholds'], errors, warnings)
+
+    # Validate authentication
+    if 'authentication' in scan_config:
+        auth_config = scan_config['authentication']
+        if auth_config.get('enabled'):
+            if 'type' in auth_config:
+                _validate_enum(auth_config['type'], _AUTH_TYPES, errors)
+
+    return len(errors) == 0
+
+
+def _validate_cron_schedule(schedule: str, errors: List[str], warnings: List[str]) -> bool:
+    """Validate cron schedule format"""
+    # Common case: five well-formed fields, checked in one match
+    if _PLAIN_CRON_RE.fullmatch(schedule):
+        return True
+
+    if not _CRON_RE.fullmatch(schedule):
+        errors.append(f"Invalid cron schedule format: {schedule}. Expected 5 fields.")
+        return False
+
+    # Basic validation (could be more thorough)
+    warnings.append(f"Potentially invalid cron schedule: {schedule}")
+    return True
+
+
+def _validate_thresholds(thresholds: Dict[str, Any], errors: List[str], warnings: List[str]) -> bool:
+    """Validate vulnerability thresholds"""
+    for severity, value in thresholds.items():
+        if severity not in _SEVERITIES:
+            warnings.append(f"Unknown severity level in thresholds: {severity}")
+
+        if value is not None and (not isinstance(value, int) or value < 0):
+            errors.append(f"Threshold for '{severity}' must be null or a non-negative integer")
+
+    return len(errors) == 0
+
+
+def _validate_notifications_config(
+    notifications_config: Dict[str, Any],
+    errors: List[str],
+    warnings: List[str]
+) -> bool:
+    """Validate notifications configuration"""
+    # Validate email
+    if 'email' in notifications_config:
+        email_config = notifications_config['email']
+        if isinstance(email_config, dict) and 'recipients' in email_config:
+            recipients = email_config['recipients']
+            if not isinstance(recipients, list):
+                errors.append("Email recipients must be a list")
+            else:
+                for recipient in recipients:
+                    _validate_email(recipient, errors)
+
+    # Validate Slack
+    if 'slack' in notifications_config:
+        slack_config = notifications_config['slack']
+        if isinstance(slack_config, dict) and slack_config.get('enabled'):
+            if 'channel' not in slack_config:
+                warnings.append("Slack enabled but no channel specified")
+
+    # Validate GitHub
+    if 'github' in notifications_config:
+        github_config = notifications_config['github']
+        if isinstance(github_config, dict) and github_config.get('enabled'):
+            if 'issue_severity' in github_config:
+                for severity in github_config['issue_severity']:
+                    _validate_enum(severity, _SEVERITIES, errors)
+
+    return len(errors) == 0
+
 
 class ConfigValidator:
-    """Validates configuration files"""
+    """
+    Validates configuration files
 
-    def __init__(self):
-        """Initialize the ConfigValidator"""
-        self.errors = []
-        self.warnings = []
+    Validators keep no state: each call collects its own errors and
+    warnings, so one instance can be shared between threads.
+    """
 
-    def validate_application_config(self, config: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
+    __slots__ = ()
+
+    @staticmethod
+    def validate_application_config(config: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
         """
         Validate application configuration
 
@@ -28,181 +189,45 @@ class ConfigValidator:
         Returns:
             Tuple of (is_valid, errors, warnings)
         """
-        self.errors = []
-        self.warnings = []
+        errors = []
+        warnings = []
 
         if 'application' not in config:
-            self.errors.append("Missing 'application' section in configuration")
-            return False, self.errors, self.warnings
+            errors.append("Missing 'application' section in configuration")
+            return False, errors, warnings
 
         app_config = config['application']
 
         # Required fields
-        self._validate_required_field(app_config, 'name', str)
-        self._validate_required_field(app_config, 'url', str)
-        self._validate_required_field(app_config, 'owner', str)
+        _validate_required_field(app_config, 'name', str, errors)
+        _validate_required_field(app_config, 'url', str, errors)
+        _validate_required_field(app_config, 'owner', str, errors)
 
         # Validate URL
         if 'url' in app_config:
-            self._validate_url(app_config['url'])
+            _validate_url(app_config['url'], errors)
 
         # Validate email
         if 'owner' in app_config:
-            self._validate_email(app_config['owner'])
+            _validate_email(app_config['owner'], errors)
 
         # Validate criticality
         if 'criticality' in app_config:
-            self._validate_enum(app_config['criticality'], ['critical', 'high', 'medium', 'low'])
+            _validate_enum(app_config['criticality'], _CRITICALITIES, errors)
 
         # Validate scan configuration
         if 'scan' in app_config:
-            self._validate_scan_config(app_config['scan'])
+            _validate_scan_config(app_config['scan'], errors, warnings)
 
         # Validate notifications
         if 'notifications' in app_config:
-            self._validate_notifications_config(app_config['notifications'])
-
-        is_valid = len(self.errors) == 0
-        return is_valid, self.errors, self.warnings
-
-    def _validate_required_field(self, config: Dict, field: str, expected_type: type) -> bool:
-        """Validate that a required field exists and has the correct type"""
-        if field not in config:
-            self.errors.append(f"Required field '{field}' is missing")
-            return False
-
-        if not isinstance(config[field], expected_type):
-            self.errors.append(f"Field '{field}' must be of type {expected_type.__name__}")
-            return False
-
-        return True
+            _validate_notifications_config(app_config['notifications'], errors, warnings)
 
-    def _validate_url(self, url: str) -> bool:
-        """Validate URL format"""
-        try:
-            result = urlparse(url)
-            if not all([result.scheme, result.netloc]):
-                self.errors.append(f"Invalid URL format: {url}")
-                return False
-
-            if result.scheme not in ['http', 'https']:
-                self.errors.append(f"URL scheme must be http or https: {url}")
-                return False
-
-            return True
-        except Exception as e:
-            self.errors.append(f"Invalid URL: {url} - {str(e)}")
-            return False
-
-    def _validate_email(self, email: str) -> bool:
-        """Basic email validation"""
-        if '@' not in email or '.' not in email.split('@')[1]:
-            self.errors.append(f"Invalid email format: {email}")
-            return False
-        return True
+        is_valid = len(errors) == 0
+        return is_valid, errors, warnings
 
-    def _validate_enum(self, value: str, allowed_values: List[str]) -> bool:
-        """Validate that value is in allowed list"""
-        if value not in allowed_values:
-            self.errors.append(f"Value '{value}' must be one of: {', '.join(allowed_values)}")
-            return False
-        return True
-
-    def _validate_scan_config(self, scan_config: Dict[str, Any]) -> bool:
-        """Validate scan configuration"""
-        # Validate scan type
-        if 'type' in scan_config:
-            self._validate_enum(scan_config['type'], ['full', 'quick', 'incremental'])
-
-        # Validate timeout
-        if 'timeout' in scan_config:
-            if not isinstance(scan_config['timeout'], int) or scan_config['timeout'] <= 0:
-                self.errors.append("Scan timeout must be a positive integer")
-
-        # Validate schedule (cron format)
-        if 'schedule' in scan_config:
-            self._validate_cron_schedule(scan_config['schedule'])
-
-        # Validate thresholds
-        if 'thresholds' in scan_config:
-            self._validate_thresholds(scan_config['thresholds'])
-
-        # Validate authentication
-        if 'authentication' in scan_config:
-            auth_config = scan_config['authentication']
-            if auth_config.get('enabled'):
-                if 'type' in auth_config:
-                    self._validate_enum(
-                        auth_config['type'],
-                        ['form', 'oauth', 'api_key', 'basic', 'session']
-                    )
-
-        return len(self.errors) == 0
-
-    def _validate_cron_schedule(self, schedule: str) -> bool:
-        """Validate cron schedule format"""
-        parts = schedule.split()
-        if len(parts) != 5:
-            self.errors.append(f"Invalid cron schedule format: {schedule}. Expected 5 fields.")
-            return False
-
-        # Basic validation (could be more thorough)
-        for i, part in enumerate(parts):
-            if part not in ['*', '*/']:
-                # Check if it's a number or range
-                if not any(c in part for c in [',', '-', '/']) and not part.isdigit():
-                    self.warnings.append(f"Potentially invalid cron schedule: {schedule}")
-                    break
-
-        return True
-
-    def _validate_thresholds(self, thresholds: Dict[str, Any]) -> bool:
-        """Validate vulnerability thresholds"""
-        valid_severities = ['critical', 'high', 'medium', 'low', 'info']
-
-        for severity, value in thresholds.items():
-            if severity not in valid_severities:
-                self.warnings.append(f"Unknown severity level in thresholds: {severity}")
-
-            if value is not None and (not isinstance(value, int) or value < 0):
-                self.errors.append(f"Threshold for '{severity}' must be null or a non-negative integer")
-
-        return len(self.errors) == 0
-
-    def _validate_notifications_config(self, notifications_config: Dict[str, Any]) -> bool:
-        """Validate notifications configuration"""
-        # Validate email
-        if 'email' in notifications_config:
-            email_config = notifications_config['email']
-            if isinstance(email_config, dict) and 'recipients' in email_config:
-                recipients = email_config['recipients']
-                if not isinstance(recipients, list):
-                    self.errors.append("Email recipients must be a list")
-                else:
-                    for recipient in recipients:
-                        self._validate_email(recipient)
-
-        # Validate Slack
-        if 'slack' in notifications_config:
-            slack_config = notifications_config['slack']
-            if isinstance(slack_config, dict) and slack_config.get('enabled'):
-                if 'channel' not in slack_config:
-                    self.warnings.append("Slack enabled but no channel specified")
-
-        # Validate GitHub
-        if 'github' in notifications_config:
-            github_config = notifications_config['github']
-            if isinstance(github_config, dict) and github_config.get('enabled'):
-                if 'issue_severity' in github_config:
-                    for severity in github_config['issue_severity']:
-                        self._validate_enum(
-                            severity,
-                            ['critical', 'high', 'medium', 'low', 'info']
-                        )
-
-        return len(self.errors) == 0
-
-    def validate_scan_policy(self, policy: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
+    @staticmethod
+    def validate_scan_policy(policy: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
         """
         Validate scan policy configuration
 
@@ -212,32 +237,32 @@ class ConfigValidator:
         Returns:
             Tuple of (is_valid, errors, warnings)
         """
-        self.errors = []
-        self.warnings = []
+        errors = []
+        warnings = []
 
         if 'policy' not in policy:
-            self.errors.append("Missing 'policy' section in scan policy")
-            return False, self.errors, self.warnings
+            errors.append("Missing 'policy' section in scan policy")
+            return False, errors, warnings
 
         policy_config = policy['policy']
 
         # Validate required fields
-        self._validate_required_field(policy_config, 'name', str)
+        _validate_required_field(policy_config, 'name', str, errors)
 
         # Validate spider config
         if 'spider' in policy_config:
             spider = policy_config['spider']
             if not isinstance(spider.get('enabled'), bool):
-                self.errors.append("spider.enabled must be a boolean")
+                errors.append("spider.enabled must be a boolean")
 
         # Validate active scan config
         if 'active_scan' in policy_config:
             active_scan = policy_config['active_scan']
             if not isinstance(active_scan.get('enabled'), bool):
-                self.errors.append("active_scan.enabled must be a boolean")
+                errors.append("active_scan.enabled must be a boolean")
 
             if 'intensity' in active_scan:
-                self._validate_enum(active_scan['intensity'], ['low', 'medium', 'high'])
+                _validate_enum(active_scan['intensity'], _INTENSITIES, errors)
 
-        is_valid = len(self.errors) == 0
-        return is_valid, self.errors, self.warnings
+        is_valid = len(errors) == 0
+        return is_valid, errors, warnings
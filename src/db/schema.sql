@@ -27,6 +27,7 @@ CREATE INDEX idx_applications_owner ON applications(owner);
 CREATE INDEX idx_applications_criticality ON applications(criticality);
 CREATE INDEX idx_applications_is_active ON applications(is_active);
 CREATE INDEX idx_applications_tags ON applications USING gin(tags);
+CREATE INDEX idx_applications_created_at_id ON applications(created_at DESC, id DESC);
 
 -- ============================================
 -- Scans Table
@@ -38,7 +39,7 @@ CREATE TABLE IF NOT EXISTS scans (
     status VARCHAR(20) NOT NULL CHECK (status IN ('pending', 'running', 'completed', 'failed', 'cancelled')),
     trigger VARCHAR(50) CHECK (trigger IN ('manual', 'scheduled', 'git_commit', 'api', 'webhook')),
     triggered_by VARCHAR(255),
-    started_at TIMESTAMP,
+    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     completed_at TIMESTAMP,
     duration INTEGER, -- seconds
     progress INTEGER DEFAULT 0 CHECK (progress >= 0 AND progress <= 100),
@@ -64,6 +65,9 @@ CREATE TABLE IF NOT EXISTS scans (
     git_commit VARCHAR(40),
     git_branch VARCHAR(255),
 
+    -- Hash of resolved config, target URL and git HEAD (incremental runs)
+    config_hash VARCHAR(64),
+
     -- Report paths
     report_html_path TEXT,
     report_json_path TEXT,
@@ -85,8 +89,10 @@ CREATE INDEX idx_scans_application_id ON scans(application_id);
 CREATE INDEX idx_scans_status ON scans(status);
 CREATE INDEX idx_scans_scan_type ON scans(scan_type);
 CREATE INDEX idx_scans_started_at ON scans(started_at DESC);
+CREATE INDEX idx_scans_started_at_id ON scans(started_at DESC, id DESC);
 CREATE INDEX idx_scans_completed_at ON scans(completed_at DESC);
 CREATE INDEX idx_scans_trigger ON scans(trigger);
+CREATE INDEX idx_scans_config_hash ON scans(application_id, config_hash);
 
 -- ============================================
 -- Vulnerabilities Table
@@ -152,10 +158,21 @@ CREATE INDEX idx_vulnerabilities_scan_id ON vulnerabilities(scan_id);
 CREATE INDEX idx_vulnerabilities_application_id ON vulnerabilities(application_id);
 CREATE INDEX idx_vulnerabilities_severity ON vulnerabilities(severity);
 CREATE INDEX idx_vulnerabilities_status ON vulnerabilities(status);
+CREATE INDEX idx_vulnerabilities_severity_status ON vulnerabilities(severity, status);
 CREATE INDEX idx_vulnerabilities_type ON vulnerabilities(type);
 CREATE INDEX idx_vulnerabilities_cwe_id ON vulnerabilities(cwe_id);
 CREATE INDEX idx_vulnerabilities_first_detected ON vulnerabilities(first_detected DESC);
 
+-- Running vulnerability counts, maintained by triggers on vulnerabilities
+-- so summaries don't have to scan the whole table
+CREATE TABLE IF NOT EXISTS vulnerability_counters (
+    application_id UUID NOT NULL REFERENCES applications(id) ON DELETE CASCADE,
+    severity VARCHAR(20) NOT NULL,
+    status VARCHAR(30) NOT NULL,
+    n BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (application_id, severity, status)
+);
+
 -- ============================================
 -- Reports Table
 -- ============================================
@@ -167,6 +184,7 @@ CREATE TABLE IF NOT EXISTS reports (
     format VARCHAR(20) NOT NULL CHECK (format IN ('html', 'json', 'pdf', 'xml', 'markdown')),
     file_path TEXT NOT NULL,
     file_size BIGINT, -- bytes
+    file_sha256 VARCHAR(64), -- hex digest, sent as the download ETag
     storage_location VARCHAR(50) DEFAULT 'local' CHECK (storage_location IN ('local', 's3', 'minio')),
     storage_bucket VARCHAR(255),
     storage_key TEXT,
@@ -195,6 +213,7 @@ CREATE INDEX idx_reports_scan_id ON reports(scan_id);
 CREATE INDEX idx_reports_application_id ON reports(application_id);
 CREATE INDEX idx_reports_format ON reports(format);
 CREATE INDEX idx_reports_generated_at ON reports(generated_at DESC);
+CREATE INDEX idx_reports_generated_at_id ON reports(generated_at DESC, id DESC);
 
 -- ============================================
 -- Notifications Table
@@ -395,6 +414,82 @@ $$ language 'plpgsql';
 CREATE TRIGGER update_scans_vulnerability_counts BEFORE INSERT OR UPDATE ON scans
     FOR EACH ROW EXECUTE FUNCTION update_vulnerability_counts();
 
+-- Functions to keep vulnerability_counters in step with vulnerabilities.
+-- Statement-level with transition tables, so a bulk insert touches each
+-- counter row once rather than once per vulnerability
+CREATE OR REPLACE FUNCTION add_vulnerability_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO vulnerability_counters (application_id, severity, status, n)
+    SELECT application_id, severity, COALESCE(status, 'new'), COUNT(*)
+    FROM new_rows
+    GROUP BY 1, 2, 3
+    ON CONFLICT (application_id, severity, status)
+    DO UPDATE SET n = vulnerability_counters.n + EXCLUDED.n;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE OR REPLACE FUNCTION subtract_vulnerability_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE vulnerability_counters c
+    SET n = c.n - o.n
+    FROM (
+        SELECT application_id, severity, COALESCE(status, 'new') AS status, COUNT(*) AS n
+        FROM old_rows
+        GROUP BY 1, 2, 3
+    ) o
+    WHERE c.application_id = o.application_id
+      AND c.severity = o.severity
+      AND c.status = o.status;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE OR REPLACE FUNCTION move_vulnerability_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE vulnerability_counters c
+    SET n = c.n - o.n
+    FROM (
+        SELECT application_id, severity, COALESCE(status, 'new') AS status, COUNT(*) AS n
+        FROM old_rows
+        GROUP BY 1, 2, 3
+    ) o
+    WHERE c.application_id = o.application_id
+      AND c.severity = o.severity
+      AND c.status = o.status;
+
+    INSERT INTO vulnerability_counters (application_id, severity, status, n)
+    SELECT application_id, severity, COALESCE(status, 'new'), COUNT(*)
+    FROM new_rows
+    GROUP BY 1, 2, 3
+    ON CONFLICT (application_id, severity, status)
+    DO UPDATE SET n = vulnerability_counters.n + EXCLUDED.n;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE TRIGGER vulnerabilities_counters_insert AFTER INSERT ON vulnerabilities
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION add_vulnerability_counts();
+
+CREATE TRIGGER vulnerabilities_counters_delete AFTER DELETE ON vulnerabilities
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION subtract_vulnerability_counts();
+
+CREATE TRIGGER vulnerabilities_counters_update AFTER UPDATE ON vulnerabilities
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION move_vulnerability_counts();
+
+-- Seed counters from vulnerabilities recorded before the triggers existed
+INSERT INTO vulnerability_counters (application_id, severity, status, n)
+SELECT application_id, severity, COALESCE(status, 'new'), COUNT(*)
+FROM vulnerabilities
+GROUP BY 1, 2, 3
+ON CONFLICT (application_id, severity, status) DO NOTHING;
+
 -- ============================================
 -- Views for Common Queries
 -- ============================================
@@ -420,6 +515,47 @@ LEFT JOIN scans s ON a.id = s.application_id AND s.status = 'completed'
 LEFT JOIN vulnerabilities v ON a.id = v.application_id AND v.status NOT IN ('fixed', 'false_positive')
 GROUP BY a.id, a.name, a.url, a.owner, a.team, a.criticality, a.is_active;
 
+-- Materialized View: Application Portfolio Statistics
+-- Refreshed (CONCURRENTLY) when a scan completes, fails or is deleted (by the
+-- API and by scripts/store-results.py) and when an application is deleted, so
+-- the statistics endpoint is a point lookup instead of an aggregate over history
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_application_portfolio AS
+SELECT
+    a.id as application_id,
+    a.name as application_name,
+    COUNT(s.id) as total_scans,
+    MAX(s.started_at) as last_scan_date,
+    COALESCE(ROUND(AVG(s.critical_count), 2), 0) as avg_critical,
+    COALESCE(ROUND(AVG(s.high_count), 2), 0) as avg_high,
+    COALESCE(ROUND(AVG(s.medium_count), 2), 0) as avg_medium,
+    COALESCE(ROUND(AVG(s.low_count), 2), 0) as avg_low
+FROM applications a
+LEFT JOIN scans s ON a.id = s.application_id AND s.status = 'completed'
+GROUP BY a.id, a.name;
+
+-- Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_application_portfolio_application_id
+    ON mv_application_portfolio(application_id);
+
+-- Materialized View: Latest Report per Application and Format
+-- Refreshed (CONCURRENTLY) by the API when reports are created or deleted,
+-- including through scan and application deletes
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_latest_reports AS
+SELECT DISTINCT ON (r.application_id, r.format)
+    r.*,
+    s.scan_type,
+    a.name as application_name
+FROM reports r
+LEFT JOIN scans s ON r.scan_id = s.id
+JOIN applications a ON r.application_id = a.id
+ORDER BY r.application_id, r.format, r.generated_at DESC;
+
+-- Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_latest_reports_application_format
+    ON mv_latest_reports(application_id, format);
+CREATE INDEX IF NOT EXISTS idx_mv_latest_reports_format
+    ON mv_latest_reports(format, generated_at DESC);
+
 -- View: Recent Scans
 CREATE OR REPLACE VIEW vw_recent_scans AS
 SELECT
@@ -4,18 +4,189 @@ Sends email notifications for scan results
 """
 
 import os
+import re
+import base64
+import asyncio
 import logging
+import functools
+import ssl
+import socket
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
-from typing import Dict, List, Optional, Any
+import stat
+import threading
+from email import policy
+from email.message import EmailMessage
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from types import MappingProxyType
+import aiosmtplib
+from jinja2 import (
+    BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader, Template,
+    TemplateNotFound, select_autoescape
+)
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait on the SMTP server before giving up on a command
+SMTP_TIMEOUT = 30
+
+# Loose shape check for recipient addresses (same as the config validator)
+_EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+# Bytes of an attachment read per step; a multiple of 57 so every chunk
+# encodes to whole 76-character base64 lines
+ATTACHMENT_CHUNK_SIZE = 57 * 1024
+
+# Directory compiled templates are cached in across restarts; when unset,
+# Jinja's own per-user directory under the system temp directory is used
+JINJA_CACHE_DIR = os.getenv('JINJA_CACHE_DIR')
+
+# Templates every notifier renders, compiled up front
+TEMPLATE_NAMES = (
+    'scan_notification.html', 'scan_notification.txt',
+    'scan_failure.html',
+    'threshold_alert.html', 'threshold_alert.txt'
+)
+
+# Plain text body of the failure notification, filled with str.format_map
+_FAILURE_TEXT = """AMTD SECURITY SCAN - FAILURE NOTIFICATION
+==========================================
+
+SCAN FAILED: {application}
+
+The security scan failed to complete.
+
+SCAN INFORMATION
+================
+
+Application: {application}
+Scan ID: {scan_id}
+Scan Type: {scan_type}
+Target URL: {target_url}
+
+ERROR DETAILS
+=============
+
+{error_message}
+
+RECOMMENDED ACTIONS
+===================
+
+1. Check the Jenkins build logs for more details
+2. Verify that the target application is accessible
+3. Ensure all required services are running
+4. Review scanner configuration and permissions
+
+---
+This is an automated notification from AMTD Security Scanner.
+Please do not reply to this email."""
+
+# Severities that set the overall severity when present, most severe first
+_SEVERITY_ORDER = ('critical', 'high', 'medium', 'low')
+
+# Subject line tag for each overall severity
+_SEVERITY_PREFIX = MappingProxyType({
+    'critical': '[CRITICAL]',
+    'high': '[HIGH]',
+    'medium': '[MEDIUM]',
+    'low': '[LOW]',
+    'info': '[INFO]'
+})
+
+# Hex color for each severity, used by the HTML templates
+_SEVERITY_COLORS = MappingProxyType({
+    'critical': '#dc3545',
+    'high': '#fd7e14',
+    'medium': '#ffc107',
+    'low': '#17a2b8',
+    'info': '#6c757d'
+})
+_DEFAULT_COLOR = '#6c757d'
+
+
+def _bytecode_cache() -> Optional[BytecodeCache]:
+    """
+    Get the on-disk cache for compiled templates
+
+    Cached bytecode is executed when loaded, so the directory must be
+    private to this user: owned by it and mode 0700.
+
+    Returns:
+        Bytecode cache, or None if no safe directory is available (the
+        environment then keeps compiled templates in memory only)
+    """
+    if not JINJA_CACHE_DIR:
+        try:
+            # Jinja creates and checks a per-user directory itself
+            return FileSystemBytecodeCache()
+        except (OSError, RuntimeError) as e:
+            logger.warning("Template cache directory unavailable, compiling in memory: %s", e)
+            return None
+
+    try:
+        os.makedirs(JINJA_CACHE_DIR, mode=0o700, exist_ok=True)
+        # lstat, so a symlink planted in place of the directory is rejected
+        st = os.lstat(JINJA_CACHE_DIR)
+    except OSError as e:
+        logger.warning("Template cache directory unavailable, compiling in memory: %s", e)
+        return None
+
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) != 0o700:
+        logger.warning(
+            "Template cache directory %s is not a private directory owned by this user, compiling in memory",
+            JINJA_CACHE_DIR
+        )
+        return None
+
+    return FileSystemBytecodeCache(JINJA_CACHE_DIR)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_env(template_dir: str) -> Environment:
+    """
+    Get the template environment for a directory
+
+    Notifiers using the same directory share one environment, and with it
+    the compiled templates. Templates are not re-checked on disk, so
+    changes take effect when the process restarts. Compiled bytecode is
+    also cached on disk (keyed on the template source), so a restart
+    skips compiling unchanged templates.
+
+    Args:
+        template_dir: Directory containing email templates
+
+    Returns:
+        Jinja environment
+    """
+    env = Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(['html', 'xml']),
+        auto_reload=False,
+        cache_size=400,
+        bytecode_cache=_bytecode_cache()
+    )
+
+    # Register custom filters
+    env.filters['severity_color'] = EmailNotifier._severity_color
+
+    return env
+
+
+class _ResolvedSMTP(smtplib.SMTP):
+    """
+    SMTP client that connects to an already resolved address
+
+    It is still given the configured hostname, which STARTTLS uses to
+    verify the server certificate.
+    """
+
+    def __init__(self, sockaddr: Tuple[str, int], **kwargs):
+        self._sockaddr = sockaddr
+        super().__init__(**kwargs)
+
+    def _get_socket(self, host, port, timeout):
+        return socket.create_connection(self._sockaddr, timeout, self.source_address)
+
 
 class EmailNotifier:
     """Send email notifications for security scan results"""
@@ -28,7 +199,8 @@ class EmailNotifier:
         smtp_password: Optional[str] = None,
         smtp_use_tls: bool = True,
         from_address: Optional[str] = None,
-        template_dir: Optional[str] = None
+        template_dir: Optional[str] = None,
+        max_rcpts_per_txn: int = 50
     ):
         """
         Initialize Email Notifier
@@ -41,6 +213,7 @@ class EmailNotifier:
             smtp_use_tls: Use TLS encryption
             from_address: Sender email address
             template_dir: Directory containing email templates
+            max_rcpts_per_txn: Most recipients addressed in one SMTP transaction
         """
         # Load from environment if not provided
         self.smtp_host = smtp_host or os.getenv('SMTP_HOST', 'localhost')
@@ -49,6 +222,7 @@ class EmailNotifier:
         self.smtp_password = smtp_password or os.getenv('SMTP_PASSWORD', '')
         self.smtp_use_tls = smtp_use_tls
         self.from_address = from_address or os.getenv('SMTP_FROM', 'amtd@example.com')
+        self.max_rcpts_per_txn = max_rcpts_per_txn
 
         # Setup template environment
         if template_dir is None:
@@ -56,15 +230,25 @@ class EmailNotifier:
             template_dir = base_dir / "templates" / "notifications"
 
         self.template_dir = Path(template_dir)
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.template_dir)),
-            autoescape=select_autoescape(['html', 'xml'])
-        )
+        self.env = _get_env(str(self.template_dir))
+
+        self._templates: Dict[str, Template] = {}
+        for template_name in TEMPLATE_NAMES:
+            try:
+                self._templates[template_name] = self.env.get_template(template_name)
+            except TemplateNotFound:
+                logger.warning("Email template not found: %s", template_name)
+
+        # SMTP connection kept open across notifications (see _get_smtp)
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
 
-        # Register custom filters
-        self.env.filters['severity_color'] = self._severity_color
+        # Server address, looked up on first connect and again only after
+        # a connection to it fails, and the TLS context every connection shares
+        self._sockaddr: Optional[Tuple[str, int]] = None
+        self._ssl_context = ssl.create_default_context()
 
-        logger.info(f"Email Notifier initialized with SMTP host: {self.smtp_host}:{self.smtp_port}")
+        logger.info("Email Notifier initialized with SMTP host: %s:%s", self.smtp_host, self.smtp_port)
 
     def send_scan_notification(
         self,
@@ -88,26 +272,13 @@ class EmailNotifier:
             True if sent successfully
         """
         try:
-            logger.info(f"Sending scan notification to {len(recipients)} recipients")
-
-            # Determine severity
-            severity = self._determine_severity(statistics)
-
-            # Prepare template data
-            template_data = {
-                'scan_info': scan_info,
-                'statistics': statistics,
-                'severity': severity,
-                'report_url': report_url,
-                'severity_color': self._severity_color(severity)
-            }
+            recipients = self._clean_recipients(recipients)
+            if not recipients:
+                return False
 
-            # Render email body
-            html_body = self._render_template('scan_notification.html', template_data)
-            text_body = self._render_template('scan_notification.txt', template_data)
+            logger.info("Sending scan notification to %d recipients", len(recipients))
 
-            # Create subject
-            subject = self._create_subject(scan_info, statistics, severity)
+            subject, html_body, text_body = self._scan_notification(scan_info, statistics, report_url)
 
             # Send email
             return self._send_email(
@@ -119,7 +290,7 @@ class EmailNotifier:
             )
 
         except Exception as e:
-            logger.error(f"Failed to send scan notification: {e}")
+            logger.error("Failed to send scan notification: %s", e)
             return False
 
     def send_failure_notification(
@@ -140,17 +311,13 @@ class EmailNotifier:
             True if sent successfully
         """
         try:
-            logger.info(f"Sending failure notification to {len(recipients)} recipients")
+            recipients = self._clean_recipients(recipients)
+            if not recipients:
+                return False
 
-            template_data = {
-                'scan_info': scan_info,
-                'error_message': error_message
-            }
+            logger.info("Sending failure notification to %d recipients", len(recipients))
 
-            html_body = self._render_template('scan_failure.html', template_data)
-            text_body = self._render_template('scan_failure.txt', template_data)
-
-            subject = f"[AMTD] Scan Failed - {scan_info.get('application', 'Unknown')}"
+            subject, html_body, text_body = self._failure_notification(scan_info, error_message)
 
             return self._send_email(
                 recipients=recipients,
@@ -160,7 +327,7 @@ class EmailNotifier:
             )
 
         except Exception as e:
-            logger.error(f"Failed to send failure notification: {e}")
+            logger.error("Failed to send failure notification: %s", e)
             return False
 
     def send_threshold_alert(
@@ -183,18 +350,13 @@ class EmailNotifier:
             True if sent successfully
         """
         try:
-            logger.info(f"Sending threshold alert to {len(recipients)} recipients")
-
-            template_data = {
-                'scan_info': scan_info,
-                'statistics': statistics,
-                'exceeded_thresholds': exceeded_thresholds
-            }
+            recipients = self._clean_recipients(recipients)
+            if not recipients:
+                return False
 
-            html_body = self._render_template('threshold_alert.html', template_data)
-            text_body = self._render_template('threshold_alert.txt', template_data)
+            logger.info("Sending threshold alert to %d recipients", len(recipients))
 
-            subject = f"[AMTD] ALERT: Thresholds Exceeded - {scan_info.get('application', 'Unknown')}"
+            subject, html_body, text_body = self._threshold_alert(scan_info, statistics, exceeded_thresholds)
 
             return self._send_email(
                 recipients=recipients,
@@ -204,9 +366,313 @@ class EmailNotifier:
             )
 
         except Exception as e:
-            logger.error(f"Failed to send threshold alert: {e}")
+            logger.error("Failed to send threshold alert: %s", e)
+            return False
+
+    async def send_scan_notification_async(
+        self,
+        recipients: List[str],
+        scan_info: Dict[str, Any],
+        statistics: Dict[str, int],
+        report_url: Optional[str] = None,
+        attachments: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Send scan completion notification without blocking the event loop
+
+        Args:
+            recipients: List of email addresses
+            scan_info: Scan information dictionary
+            statistics: Vulnerability statistics
+            report_url: URL to full report
+            attachments: List of file paths to attach
+
+        Returns:
+            True if sent successfully
+        """
+        try:
+            recipients = self._clean_recipients(recipients)
+            if not recipients:
+                return False
+
+            logger.info("Sending scan notification to %d recipients", len(recipients))
+
+            subject, html_body, text_body = self._scan_notification(scan_info, statistics, report_url)
+
+            return await self._send_email_async(
+                recipients=recipients,
+                subject=subject,
+                html_body=html_body,
+                text_body=text_body,
+                attachments=attachments
+            )
+
+        except Exception as e:
+            logger.error("Failed to send scan notification: %s", e)
+            return False
+
+    async def send_failure_notification_async(
+        self,
+        recipients: List[str],
+        scan_info: Dict[str, Any],
+        error_message: str
+    ) -> bool:
+        """
+        Send scan failure notification without blocking the event loop
+
+        Args:
+            recipients: List of email addresses
+            scan_info: Scan information
+            error_message: Error message
+
+        Returns:
+            True if sent successfully
+        """
+        try:
+            recipients = self._clean_recipients(recipients)
+            if not recipients:
+                return False
+
+            logger.info("Sending failure notification to %d recipients", len(recipients))
+
+            subject, html_body, text_body = self._failure_notification(scan_info, error_message)
+
+            return await self._send_email_async(
+                recipients=recipients,
+                subject=subject,
+                html_body=html_body,
+                text_body=text_body
+            )
+
+        except Exception as e:
+            logger.error("Failed to send failure notification: %s", e)
             return False
 
+    async def send_threshold_alert_async(
+        self,
+        recipients: List[str],
+        scan_info: Dict[str, Any],
+        statistics: Dict[str, int],
+        exceeded_thresholds: Dict[str, Dict[str, int]]
+    ) -> bool:
+        """
+        Send threshold exceeded alert without blocking the event loop
+
+        Args:
+            recipients: List of email addresses
+            scan_info: Scan information
+            statistics: Vulnerability statistics
+            exceeded_thresholds: Dictionary of exceeded thresholds
+
+        Returns:
+            True if sent successfully
+        """
+        try:
+            recipients = self._clean_recipients(recipients)
+            if not recipients:
+                return False
+
+            logger.info("Sending threshold alert to %d recipients", len(recipients))
+
+            subject, html_body, text_body = self._threshold_alert(scan_info, statistics, exceeded_thresholds)
+
+            return await self._send_email_async(
+                recipients=recipients,
+                subject=subject,
+                html_body=html_body,
+                text_body=text_body
+            )
+
+        except Exception as e:
+            logger.error("Failed to send threshold alert: %s", e)
+            return False
+
+    async def send_scan_notifications_async(
+        self,
+        recipient_groups: List[List[str]],
+        scan_info: Dict[str, Any],
+        statistics: Dict[str, int],
+        report_url: Optional[str] = None,
+        attachments: Optional[List[str]] = None
+    ) -> List[bool]:
+        """
+        Send a scan completion notification to several recipient groups at once
+
+        Each group gets its own connection, so the handshakes overlap
+        instead of running one after another.
+
+        Args:
+            recipient_groups: Lists of email addresses, one message per list
+            scan_info: Scan information dictionary
+            statistics: Vulnerability statistics
+            report_url: URL to full report
+            attachments: List of file paths to attach
+
+        Returns:
+            Whether each group's notification was sent, in group order
+        """
+        return list(await asyncio.gather(*(
+            self.send_scan_notification_async(recipients, scan_info, statistics, report_url, attachments)
+            for recipients in recipient_groups
+        )))
+
+    @staticmethod
+    def _clean_recipients(recipients: List[str]) -> List[str]:
+        """
+        Strip and dedupe recipient addresses, dropping malformed ones
+
+        Args:
+            recipients: List of email addresses
+
+        Returns:
+            Valid addresses in their original order, each once
+        """
+        valid = []
+        for address in dict.fromkeys(map(str.strip, recipients)):
+            if _EMAIL_RE.fullmatch(address):
+                valid.append(address)
+            else:
+                logger.warning("Skipping invalid recipient address: %r", address)
+
+        if not valid:
+            logger.warning("No valid recipients, notification not sent")
+        return valid
+
+    def _scan_notification(
+        self,
+        scan_info: Dict[str, Any],
+        statistics: Dict[str, int],
+        report_url: Optional[str]
+    ) -> Tuple[str, str, str]:
+        """
+        Render a scan completion notification
+
+        Args:
+            scan_info: Scan information dictionary
+            statistics: Vulnerability statistics
+            report_url: URL to full report
+
+        Returns:
+            Tuple of (subject, HTML body, text body)
+        """
+        # Determine severity
+        severity, total, prefix, color = self._summarize(statistics)
+
+        # Prepare template data
+        template_data = {
+            'scan_info': scan_info,
+            'statistics': statistics,
+            'severity': severity,
+            'report_url': report_url,
+            'severity_color': color
+        }
+
+        # Render email body
+        html_body = self._render_template('scan_notification.html', template_data)
+        text_body = self._render_template('scan_notification.txt', template_data)
+
+        # Create subject
+        subject = self._create_subject(scan_info, total, prefix)
+
+        return subject, html_body, text_body
+
+    def _failure_notification(self, scan_info: Dict[str, Any], error_message: str) -> Tuple[str, str, str]:
+        """
+        Render a scan failure notification
+
+        Args:
+            scan_info: Scan information
+            error_message: Error message
+
+        Returns:
+            Tuple of (subject, HTML body, text body)
+        """
+        template_data = {
+            'scan_info': scan_info,
+            'error_message': error_message
+        }
+
+        html_body = self._render_template('scan_failure.html', template_data)
+        # The text body is a fixed layout, so it skips the template engine
+        text_body = _FAILURE_TEXT.format_map({
+            'application': scan_info.get('application', ''),
+            'scan_id': scan_info.get('scan_id', ''),
+            'scan_type': str(scan_info.get('scan_type', '')).upper(),
+            'target_url': scan_info.get('target_url', ''),
+            'error_message': error_message
+        })
+
+        subject = f"[AMTD] Scan Failed - {scan_info.get('application', 'Unknown')}"
+
+        return subject, html_body, text_body
+
+    def _threshold_alert(
+        self,
+        scan_info: Dict[str, Any],
+        statistics: Dict[str, int],
+        exceeded_thresholds: Dict[str, Dict[str, int]]
+    ) -> Tuple[str, str, str]:
+        """
+        Render a threshold exceeded alert
+
+        Args:
+            scan_info: Scan information
+            statistics: Vulnerability statistics
+            exceeded_thresholds: Dictionary of exceeded thresholds
+
+        Returns:
+            Tuple of (subject, HTML body, text body)
+        """
+        template_data = {
+            'scan_info': scan_info,
+            'statistics': statistics,
+            'exceeded_thresholds': exceeded_thresholds
+        }
+
+        html_body = self._render_template('threshold_alert.html', template_data)
+        text_body = self._render_template('threshold_alert.txt', template_data)
+
+        subject = f"[AMTD] ALERT: Thresholds Exceeded - {scan_info.get('application', 'Unknown')}"
+
+        return subject, html_body, text_body
+
+    def _build_message(
+        self,
+        subject: str,
+        html_body: str,
+        text_body: str,
+        attachments: Optional[List[str]] = None
+    ) -> EmailMessage:
+        """
+        Build the email message
+
+        Args:
+            subject: Email subject
+            html_body: HTML email body
+            text_body: Plain text email body
+            attachments: List of file paths to attach
+
+        Returns:
+            Email message
+        """
+        msg = EmailMessage(policy=policy.SMTP)
+        msg['Subject'] = subject
+        msg['From'] = self.from_address
+        # Recipients are only given to the server (as with Bcc), so
+        # they don't see each other's addresses
+        msg['To'] = self.from_address
+
+        # Text and HTML alternatives
+        msg.set_content(text_body)
+        msg.add_alternative(html_body, subtype='html')
+
+        # Attach files
+        if attachments:
+            for file_path in attachments:
+                self._attach_file(msg, file_path)
+
+        return msg
+
     def _send_email(
         self,
         recipients: List[str],
@@ -229,47 +695,109 @@ class EmailNotifier:
             True if sent successfully
         """
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = self.from_address
-            msg['To'] = ', '.join(recipients)
+            msg = self._build_message(subject, html_body, text_body, attachments)
+            self._dispatch(self._serialize(msg), recipients)
 
-            # Attach text and HTML parts
-            text_part = MIMEText(text_body, 'plain')
-            html_part = MIMEText(html_body, 'html')
+            logger.info("Email sent successfully to %d recipients", len(recipients))
+            return True
 
-            msg.attach(text_part)
-            msg.attach(html_part)
+        except Exception as e:
+            logger.error("Failed to send email: %s", e)
+            return False
 
-            # Attach files
-            if attachments:
-                for file_path in attachments:
-                    self._attach_file(msg, file_path)
+    @staticmethod
+    def _serialize(msg: EmailMessage) -> bytes:
+        """
+        Serialize a message for the DATA command
 
-            # Connect to SMTP server
-            if self.smtp_use_tls:
-                server = smtplib.SMTP(self.smtp_host, self.smtp_port)
-                server.starttls()
-            else:
-                server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+        Done once per message, so every recipient chunk sends the same
+        bytes instead of flattening the message again.
 
-            # Login if credentials provided
-            if self.smtp_user and self.smtp_password:
-                server.login(self.smtp_user, self.smtp_password)
+        Args:
+            msg: Email message built with the SMTP policy
 
-            # Send email
-            server.send_message(msg)
-            server.quit()
+        Returns:
+            Message bytes with CRLF line endings
+        """
+        return msg.as_bytes()
+
+    def _dispatch(self, raw: bytes, recipients: List[str]):
+        """
+        Send a serialized message over the shared connection
 
-            logger.info(f"Email sent successfully to {len(recipients)} recipients")
+        Each chunk of up to max_rcpts_per_txn recipients gets its own
+        transaction.
+
+        Args:
+            raw: Message bytes from _serialize
+            recipients: List of recipient email addresses
+
+        Raises:
+            smtplib.SMTPException: If the server rejects the message
+            OSError: If the connection fails
+        """
+        with self._smtp_lock:
+            server = self._get_smtp()
+            try:
+                for start in range(0, len(recipients), self.max_rcpts_per_txn):
+                    chunk = recipients[start:start + self.max_rcpts_per_txn]
+                    server.sendmail(self.from_address, chunk, raw)
+            except Exception:
+                # Don't reuse a connection left in an unknown state
+                self._discard_smtp()
+                raise
+
+    async def _send_email_async(
+        self,
+        recipients: List[str],
+        subject: str,
+        html_body: str,
+        text_body: str,
+        attachments: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Send email via SMTP on the running event loop
+
+        Uses a connection of its own, so concurrent sends don't wait for
+        each other or for the shared synchronous connection.
+
+        Args:
+            recipients: List of recipient email addresses
+            subject: Email subject
+            html_body: HTML email body
+            text_body: Plain text email body
+            attachments: List of file paths to attach
+
+        Returns:
+            True if sent successfully
+        """
+        try:
+            raw = self._serialize(self._build_message(subject, html_body, text_body, attachments))
+
+            server = aiosmtplib.SMTP(
+                hostname=self.smtp_host,
+                port=self.smtp_port,
+                start_tls=self.smtp_use_tls,
+                tls_context=self._ssl_context,
+                timeout=SMTP_TIMEOUT
+            )
+            async with server:
+                # Login if credentials provided
+                if self.smtp_user and self.smtp_password:
+                    await server.login(self.smtp_user, self.smtp_password)
+
+                for start in range(0, len(recipients), self.max_rcpts_per_txn):
+                    chunk = recipients[start:start + self.max_rcpts_per_txn]
+                    await server.sendmail(self.from_address, chunk, raw)
+
+            logger.info("Email sent successfully to %d recipients", len(recipients))
             return True
 
         except Exception as e:
-            logger.error(f"Failed to send email: {e}")
+            logger.error("Failed to send email: %s", e)
             return False
 
-    def _attach_file(self, msg: MIMEMultipart, file_path: str):
+    def _attach_file(self, msg: EmailMessage, file_path: str):
         """
         Attach file to email message
 
@@ -280,24 +808,32 @@ class EmailNotifier:
         try:
             path = Path(file_path)
             if not path.exists():
-                logger.warning(f"Attachment not found: {file_path}")
+                logger.warning("Attachment not found: %s", file_path)
                 return
 
+            # Encode as the file is read, so only one chunk of raw bytes
+            # is held at a time
+            encoded = []
             with open(path, 'rb') as f:
-                part = MIMEBase('application', 'octet-stream')
-                part.set_payload(f.read())
-
-            encoders.encode_base64(part)
-            part.add_header(
-                'Content-Disposition',
-                f'attachment; filename={path.name}'
-            )
-
+                while chunk := f.read(ATTACHMENT_CHUNK_SIZE):
+                    encoded.append(base64.encodebytes(chunk).decode('ascii'))
+
+            # Built by hand rather than with add_attachment, which would
+            # need the whole file as bytes
+            part = EmailMessage(policy=msg.policy)
+            part['Content-Type'] = 'application/octet-stream'
+            part['Content-Transfer-Encoding'] = 'base64'
+            part.add_header('Content-Disposition', 'attachment', filename=path.name)
+            part.set_payload(''.join(encoded))
+
+            # Wrap the body alternatives in multipart/mixed on the first attachment
+            if msg.get_content_subtype() != 'mixed':
+                msg.make_mixed()
             msg.attach(part)
-            logger.debug(f"Attached file: {path.name}")
+            logger.debug("Attached file: %s", path.name)
 
         except Exception as e:
-            logger.error(f"Failed to attach file {file_path}: {e}")
+            logger.error("Failed to attach file %s: %s", file_path, e)
 
     def _render_template(self, template_name: str, data: Dict[str, Any]) -> str:
         """
@@ -311,66 +847,51 @@ class EmailNotifier:
             Rendered template content
         """
         try:
-            template = self.env.get_template(template_name)
-            return template.render(**data)
+            template = self._templates.get(template_name) or self.env.get_template(template_name)
+            return template.render(data)
         except Exception as e:
-            logger.error(f"Failed to render template {template_name}: {e}")
+            logger.error("Failed to render template %s: %s", template_name, e)
             # Return basic fallback content
             if template_name.endswith('.html'):
                 return f"<html><body><h1>AMTD Notification</h1><p>Error rendering template: {e}</p></body></html>"
             else:
                 return f"AMTD Notification\n\nError rendering template: {e}"
 
-    def _create_subject(
-        self,
-        scan_info: Dict[str, Any],
-        statistics: Dict[str, int],
-        severity: str
-    ) -> str:
+    def _create_subject(self, scan_info: Dict[str, Any], total: int, severity_prefix: str) -> str:
         """
         Create email subject line
 
         Args:
             scan_info: Scan information
-            statistics: Vulnerability statistics
-            severity: Overall severity
+            total: Total number of issues
+            severity_prefix: Subject tag for the overall severity
 
         Returns:
             Email subject
         """
         app = scan_info.get('application', 'Unknown')
-        total = statistics.get('total', 0)
-
-        severity_prefix = {
-            'critical': '[CRITICAL]',
-            'high': '[HIGH]',
-            'medium': '[MEDIUM]',
-            'low': '[LOW]',
-            'info': '[INFO]'
-        }.get(severity, '')
 
         return f"[AMTD] {severity_prefix} Scan Complete - {app} ({total} issues)"
 
-    def _determine_severity(self, statistics: Dict[str, int]) -> str:
+    @staticmethod
+    def _summarize(statistics: Dict[str, int]) -> Tuple[str, int, str, str]:
         """
-        Determine overall severity from statistics
+        Summarize statistics for the subject line and templates
 
         Args:
             statistics: Vulnerability statistics
 
         Returns:
-            Severity level
-        """
-        if statistics.get('critical', 0) > 0:
-            return 'critical'
-        elif statistics.get('high', 0) > 0:
-            return 'high'
-        elif statistics.get('medium', 0) > 0:
-            return 'medium'
-        elif statistics.get('low', 0) > 0:
-            return 'low'
+            Tuple of (overall severity, total issues, subject prefix, color)
+        """
+        get = statistics.get
+        for severity in _SEVERITY_ORDER:
+            if get(severity, 0) > 0:
+                break
         else:
-            return 'info'
+            severity = 'info'
+
+        return severity, get('total', 0), _SEVERITY_PREFIX[severity], _SEVERITY_COLORS[severity]
 
     @staticmethod
     def _severity_color(severity: str) -> str:
@@ -383,38 +904,117 @@ class EmailNotifier:
         Returns:
             Hex color code
         """
-        colors = {
-            'critical': '#dc3545',
-            'high': '#fd7e14',
-            'medium': '#ffc107',
-            'low': '#17a2b8',
-            'info': '#6c757d'
-        }
-        return colors.get(severity.lower(), '#6c757d')
+        return _SEVERITY_COLORS.get(severity.lower(), _DEFAULT_COLOR)
 
-    def test_connection(self) -> bool:
+    def _resolve(self) -> Tuple[str, int]:
         """
-        Test SMTP connection
+        Look up the SMTP server address
 
         Returns:
-            True if connection successful
+            Socket address of the server
+        """
+        info = socket.getaddrinfo(self.smtp_host, self.smtp_port, type=socket.SOCK_STREAM)
+        self._sockaddr = info[0][4][:2]
+        return self._sockaddr
+
+    def _connect(self, timeout: float = SMTP_TIMEOUT) -> smtplib.SMTP:
         """
+        Open an SMTP connection, upgraded to TLS and logged in as configured
+
+        Args:
+            timeout: Socket timeout in seconds
+
+        Returns:
+            Connected SMTP client
+        """
+        cached = self._sockaddr is not None
+        try:
+            server = _ResolvedSMTP(
+                self._sockaddr if cached else self._resolve(),
+                host=self.smtp_host, port=self.smtp_port, timeout=timeout
+            )
+        except OSError:
+            if not cached:
+                raise
+            # The server may have moved since the last lookup
+            server = _ResolvedSMTP(self._resolve(), host=self.smtp_host, port=self.smtp_port, timeout=timeout)
+
         try:
             if self.smtp_use_tls:
-                server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=10)
-                server.starttls()
-            else:
-                server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=10)
+                server.starttls(context=self._ssl_context)
 
+            # Login if credentials provided
             if self.smtp_user and self.smtp_password:
                 server.login(self.smtp_user, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+
+        return server
+
+    def _get_smtp(self) -> smtplib.SMTP:
+        """
+        Get the shared SMTP connection, reconnecting if it was dropped
+
+        The connection, with its TLS session and login, is reused for every
+        message this notifier sends. A NOOP checks it is still alive, since
+        servers close idle connections. Callers must hold _smtp_lock.
+
+        Returns:
+            Connected SMTP client
+        """
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._discard_smtp()
+
+        self._smtp = self._connect()
+        return self._smtp
+
+    def _discard_smtp(self):
+        """Drop the shared SMTP connection without a QUIT. Callers must hold _smtp_lock"""
+        if self._smtp is not None:
+            self._smtp.close()
+            self._smtp = None
+
+    def close(self):
+        """Close the shared SMTP connection, if one is open"""
+        with self._smtp_lock:
+            if self._smtp is None:
+                return
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                self._smtp.close()
+            self._smtp = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def test_connection(self) -> bool:
+        """
+        Test SMTP connection
+
+        On success the connection is kept open for the next notification.
+
+        Returns:
+            True if connection successful
+        """
+        try:
+            with self._smtp_lock:
+                self._get_smtp()
 
-            server.quit()
             logger.info("SMTP connection test successful")
             return True
 
         except Exception as e:
-            logger.error(f"SMTP connection test failed: {e}")
+            logger.error("SMTP connection test failed: %s", e)
             return False
 
 
@@ -422,32 +1022,31 @@ if __name__ == '__main__':
     # Example usage
     logging.basicConfig(level=logging.INFO)
 
-    notifier = EmailNotifier()
-
-    # Test connection
-    if notifier.test_connection():
-        print("SMTP connection successful")
-
-        # Send test notification
-        scan_info = {
-            'application': 'test-app',
-            'scan_id': 'scan-123',
-            'scan_type': 'full',
-            'target_url': 'http://example.com'
-        }
+    with EmailNotifier() as notifier:
+        # Test connection
+        if notifier.test_connection():
+            print("SMTP connection successful")
+
+            # Send test notification
+            scan_info = {
+                'application': 'test-app',
+                'scan_id': 'scan-123',
+                'scan_type': 'full',
+                'target_url': 'http://example.com'
+            }
 
-        statistics = {
-            'critical': 2,
-            'high': 5,
-            'medium': 10,
-            'low': 15,
-            'info': 20,
-            'total': 52
-        }
+            statistics = {
+                'critical': 2,
+                'high': 5,
+                'medium': 10,
+                'low': 15,
+                'info': 20,
+                'total': 52
+            }
 
-        notifier.send_scan_notification(
-            recipients=['test@example.com'],
-            scan_info=scan_info,
-            statistics=statistics,
-            report_url='http://jenkins/reports/scan-123'
-        )
+            notifier.send_scan_notification(
+                recipients=['test@example.com'],
+                scan_info=scan_info,
+                statistics=statistics,
+                report_url='http://jenkins/reports/scan-123'
+            )
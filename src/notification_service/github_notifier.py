@@ -4,13 +4,21 @@ Creates GitHub issues for vulnerabilities and uploads SARIF reports
 """
 
 import os
+import asyncio
 import logging
+import aiohttp
 import requests
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterable, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Concurrent issue requests; GitHub applies secondary rate limits to bursts
+ISSUE_CONCURRENCY = 8
+
+# Attempts per request when GitHub asks us to back off
+MAX_RETRIES = 5
+
 
 class GitHubNotifier:
     """Create GitHub issues and upload SARIF reports for vulnerabilities"""
@@ -55,6 +63,8 @@ class GitHubNotifier:
         """
         Create GitHub issues for vulnerabilities
 
+        Synchronous wrapper around create_issues_for_vulnerabilities_async.
+
         Args:
             vulnerabilities: List of vulnerability dictionaries
             scan_info: Scan information
@@ -65,6 +75,43 @@ class GitHubNotifier:
         Returns:
             Dictionary with created/skipped issue counts
         """
+        return asyncio.run(self.create_issues_for_vulnerabilities_async(
+            vulnerabilities=vulnerabilities,
+            scan_info=scan_info,
+            severity_filter=severity_filter,
+            labels=labels,
+            dry_run=dry_run
+        ))
+
+    async def create_issues_for_vulnerabilities_async(
+        self,
+        vulnerabilities: List[Dict[str, Any]],
+        scan_info: Dict[str, Any],
+        severity_filter: Optional[List[str]] = None,
+        labels: Optional[List[str]] = None,
+        dry_run: bool = False,
+        concurrency: int = ISSUE_CONCURRENCY
+    ) -> Dict[str, Any]:
+        """
+        Create GitHub issues for vulnerabilities concurrently
+
+        Up to ``concurrency`` vulnerabilities are processed at once. Rate
+        limit responses are retried after the delay GitHub asks for.
+        Vulnerabilities sharing an issue title (one alert found at several
+        URLs) get a single issue; the rest are counted as skipped.
+
+        Args:
+            vulnerabilities: List of vulnerability dictionaries
+            scan_info: Scan information
+            severity_filter: Only create issues for these severities (e.g., ['critical', 'high'])
+            labels: Additional labels to add to issues
+            dry_run: If True, don't actually create issues
+            concurrency: Maximum number of vulnerabilities processed at once
+
+        Returns:
+            Dictionary with created/skipped issue counts and the numbers of
+            the issues that were created
+        """
         try:
             if not self.token or not self.repo_owner or not self.repo_name:
                 logger.error("GitHub configuration incomplete")
@@ -72,44 +119,66 @@ class GitHubNotifier:
 
             logger.info(f"Creating GitHub issues for {len(vulnerabilities)} vulnerabilities")
 
-            # Filter vulnerabilities by severity
+            # Filter vulnerabilities by severity before any request is made
             filtered_vulns = self._filter_vulnerabilities(vulnerabilities, severity_filter)
 
-            created_count = 0
-            skipped_count = 0
-            errors = []
-
+            # Duplicates are found by title, which concurrent workers can't
+            # see until the first issue exists, so dispatch one per title
+            by_title = {}
             for vuln in filtered_vulns:
-                try:
-                    # Check if issue already exists
-                    if self._issue_exists(vuln):
-                        logger.info(f"Issue already exists for: {vuln.get('name')}")
-                        skipped_count += 1
-                        continue
-
-                    if dry_run:
-                        logger.info(f"[DRY RUN] Would create issue for: {vuln.get('name')}")
-                        created_count += 1
-                        continue
-
-                    # Create issue
-                    issue = self._create_issue(vuln, scan_info, labels)
-                    if issue:
-                        logger.info(f"Created issue #{issue['number']}: {vuln.get('name')}")
-                        created_count += 1
-                    else:
-                        skipped_count += 1
-
-                except Exception as e:
-                    logger.error(f"Failed to create issue for {vuln.get('name')}: {e}")
-                    errors.append(str(e))
-                    skipped_count += 1
+                by_title.setdefault(self._issue_title(vuln), vuln)
+            unique_vulns = list(by_title.values())
+
+            semaphore = asyncio.Semaphore(concurrency)
+            connector = aiohttp.TCPConnector(limit_per_host=concurrency)
+            timeout = aiohttp.ClientTimeout(total=30)
+
+            async with aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=timeout
+            ) as session:
+
+                async def process(vuln: Dict[str, Any]) -> Tuple[str, Optional[str], Optional[Dict]]:
+                    async with semaphore:
+                        try:
+                            # Check if issue already exists
+                            if await self._issue_exists_async(session, vuln):
+                                logger.info(f"Issue already exists for: {vuln.get('name')}")
+                                return 'skipped', None, None
+
+                            if dry_run:
+                                logger.info(f"[DRY RUN] Would create issue for: {vuln.get('name')}")
+                                return 'created', None, None
+
+                            # Create issue
+                            issue = await self._create_issue_async(session, vuln, scan_info, labels)
+                            if issue:
+                                logger.info(f"Created issue #{issue['number']}: {vuln.get('name')}")
+                                return 'created', None, issue
+                            return 'skipped', None, None
+
+                        except Exception as e:
+                            logger.error(f"Failed to create issue for {vuln.get('name')}: {e}")
+                            return 'skipped', str(e), None
+
+                outcomes = await asyncio.gather(*(process(v) for v in unique_vulns))
+
+            created_count = sum(1 for status, _, _ in outcomes if status == 'created')
+            skipped_count = len(filtered_vulns) - created_count
+            errors = [error for _, error, _ in outcomes if error]
+            created_issues = [
+                {'vulnerability': vuln, 'number': issue['number']}
+                for vuln, (_, _, issue) in zip(unique_vulns, outcomes)
+                if issue
+            ]
 
             result = {
                 'created': created_count,
                 'skipped': skipped_count,
                 'total': len(filtered_vulns),
-                'errors': errors
+                'errors': errors,
+                'created_issues': created_issues
             }
 
             logger.info(f"GitHub issue creation complete: {created_count} created, {skipped_count} skipped")
@@ -119,6 +188,55 @@ class GitHubNotifier:
             logger.error(f"Failed to create GitHub issues: {e}")
             return {'error': str(e), 'created': 0, 'skipped': 0}
 
+    async def _request_with_backoff(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> Tuple[int, Any]:
+        """
+        Send a request, retrying when GitHub signals a rate limit
+
+        Args:
+            session: Open client session
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to session.request
+
+        Returns:
+            Tuple of (status code, decoded JSON body or text)
+        """
+        delay = 1.0
+        for attempt in range(MAX_RETRIES):
+            async with session.request(method, url, **kwargs) as response:
+                if response.content_type == 'application/json':
+                    body = await response.json()
+                else:
+                    body = await response.text()
+
+                rate_limited = response.status == 429 or (
+                    response.status == 403 and (
+                        'Retry-After' in response.headers or
+                        response.headers.get('X-RateLimit-Remaining') == '0'
+                    )
+                )
+                if not rate_limited or attempt == MAX_RETRIES - 1:
+                    return response.status, body
+
+                wait = delay
+                if 'Retry-After' in response.headers:
+                    wait = float(response.headers['Retry-After'])
+                elif response.headers.get('X-RateLimit-Reset'):
+                    reset_at = float(response.headers['X-RateLimit-Reset'])
+                    wait = max(reset_at - datetime.utcnow().timestamp(), delay)
+
+            logger.warning(f"GitHub rate limit hit, retrying in {wait:.0f}s")
+            await asyncio.sleep(wait)
+            delay *= 2
+
+        return response.status, body
+
     def upload_sarif_report(
         self,
         sarif_file_path: str,
@@ -258,14 +376,14 @@ class GitHubNotifier:
             logger.error(f"Failed to create check run: {e}")
             return None
 
-    def _create_issue(
+    def _build_issue_payload(
         self,
         vuln: Dict[str, Any],
         scan_info: Dict[str, Any],
         additional_labels: Optional[List[str]] = None
-    ) -> Optional[Dict]:
+    ) -> Dict[str, Any]:
         """
-        Create a GitHub issue for a vulnerability
+        Build the request payload for a vulnerability issue
 
         Args:
             vuln: Vulnerability data
@@ -273,50 +391,70 @@ class GitHubNotifier:
             additional_labels: Additional labels to add
 
         Returns:
-            Created issue data or None
+            Issue payload
         """
-        try:
-            url = f"{self.api_base}/repos/{self.repo_owner}/{self.repo_name}/issues"
+        # Build issue title
+        title = self._issue_title(vuln)
 
-            # Build issue title
-            severity = vuln.get('severity', 'unknown').upper()
-            title = f"[{severity}] {vuln.get('name', 'Unknown Vulnerability')}"
+        # Build issue body
+        body = self._build_issue_body(vuln, scan_info)
 
-            # Build issue body
-            body = self._build_issue_body(vuln, scan_info)
+        # Build labels
+        labels = ['security', f'severity:{vuln.get("severity", "unknown")}']
+        if additional_labels:
+            labels.extend(additional_labels)
 
-            # Build labels
-            labels = ['security', f'severity:{vuln.get("severity", "unknown")}']
-            if additional_labels:
-                labels.extend(additional_labels)
+        # Add CWE label if available
+        if vuln.get('cwe_id'):
+            labels.append(f"cwe:{vuln.get('cwe_id')}")
 
-            # Add CWE label if available
-            if vuln.get('cwe_id'):
-                labels.append(f"cwe:{vuln.get('cwe_id')}")
+        return {
+            'title': title,
+            'body': body,
+            'labels': labels
+        }
 
-            issue_data = {
-                'title': title,
-                'body': body,
-                'labels': labels
-            }
+    async def _create_issue_async(
+        self,
+        session: aiohttp.ClientSession,
+        vuln: Dict[str, Any],
+        scan_info: Dict[str, Any],
+        additional_labels: Optional[List[str]] = None
+    ) -> Optional[Dict]:
+        """
+        Create a GitHub issue for a vulnerability
 
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=issue_data,
-                timeout=30
-            )
+        Args:
+            session: Open client session
+            vuln: Vulnerability data
+            scan_info: Scan information
+            additional_labels: Additional labels to add
 
-            if response.status_code == 201:
-                return response.json()
+        Returns:
+            Created issue data or None
+        """
+        try:
+            url = f"{self.api_base}/repos/{self.repo_owner}/{self.repo_name}/issues"
+            issue_data = self._build_issue_payload(vuln, scan_info, additional_labels)
+
+            status, body = await self._request_with_backoff(session, 'POST', url, json=issue_data)
+
+            if status == 201:
+                return body
             else:
-                logger.error(f"Failed to create issue: {response.status_code} - {response.text}")
+                logger.error(f"Failed to create issue: {status} - {body}")
                 return None
 
         except Exception as e:
             logger.error(f"Failed to create issue: {e}")
             return None
 
+    @staticmethod
+    def _issue_title(vuln: Dict[str, Any]) -> str:
+        """Build the issue title used for creation and duplicate search"""
+        severity = vuln.get('severity', 'unknown').upper()
+        return f"[{severity}] {vuln.get('name', 'Unknown Vulnerability')}"
+
     def _build_issue_body(
         self,
         vuln: Dict[str, Any],
@@ -393,11 +531,16 @@ class GitHubNotifier:
 
         return body
 
-    def _issue_exists(self, vuln: Dict[str, Any]) -> bool:
+    async def _issue_exists_async(
+        self,
+        session: aiohttp.ClientSession,
+        vuln: Dict[str, Any]
+    ) -> bool:
         """
         Check if issue already exists for this vulnerability
 
         Args:
+            session: Open client session
             vuln: Vulnerability data
 
         Returns:
@@ -405,25 +548,17 @@ class GitHubNotifier:
         """
         try:
             # Search for existing issues with same title
-            vuln_name = vuln.get('name', '')
-            severity = vuln.get('severity', 'unknown').upper()
-            title = f"[{severity}] {vuln_name}"
+            title = self._issue_title(vuln)
 
             url = f"{self.api_base}/search/issues"
             params = {
                 'q': f'repo:{self.repo_owner}/{self.repo_name} is:issue "{title}" in:title'
             }
 
-            response = requests.get(
-                url,
-                headers=self.headers,
-                params=params,
-                timeout=10
-            )
+            status, body = await self._request_with_backoff(session, 'GET', url, params=params)
 
-            if response.status_code == 200:
-                data = response.json()
-                return data.get('total_count', 0) > 0
+            if status == 200:
+                return body.get('total_count', 0) > 0
 
             return False
 
@@ -434,15 +569,16 @@ class GitHubNotifier:
     def _filter_vulnerabilities(
         self,
         vulnerabilities: List[Dict],
-        severity_filter: Optional[List[str]]
+        severity_filter: Optional[Iterable[str]]
     ) -> List[Dict]:
         """Filter vulnerabilities by severity"""
         if not severity_filter:
             return vulnerabilities
 
+        severities = frozenset(s.lower() for s in severity_filter)
         return [
             v for v in vulnerabilities
-            if v.get('severity', '').lower() in [s.lower() for s in severity_filter]
+            if v.get('severity', '').lower() in severities
         ]
 
     def _get_latest_commit_sha(self, ref: Optional[str] = None) -> Optional[str]:
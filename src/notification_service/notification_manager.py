@@ -51,7 +51,8 @@ class NotificationManager:
                     smtp_password=email_config.get('smtp_password'),
                     smtp_use_tls=email_config.get('smtp_use_tls', True),
                     from_address=email_config.get('from_address'),
-                    template_dir=email_config.get('template_dir')
+                    template_dir=email_config.get('template_dir'),
+                    max_rcpts_per_txn=email_config.get('max_rcpts_per_txn', 50)
                 )
                 logger.info("Email notifier enabled")
             except Exception as e:
@@ -0,0 +1,11 @@
+"""
+Shared test setup: make the src/ packages and scripts/ helpers importable
+"""
+
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
@@ -0,0 +1,44 @@
+"""
+Tests for copy_rows, the COPY path insert_many takes for large batches
+"""
+
+import os
+
+import pytest
+
+from api.database import Database, _copy_field
+
+# Values the two insert paths have to agree on
+ROW = ('', None, '\\N', 'say "hi", then\nleave', 42, 1.5, True)
+COLUMNS = ('empty', 'missing', 'marker', 'quoted', 'count', 'ratio', 'flag')
+
+
+def test_copy_field_keeps_empty_strings_apart_from_null():
+    assert [_copy_field(value) for value in ROW] == [
+        '""', '\\N', '"\\N"', '"say ""hi"", then\nleave"', '"42"', '"1.5"', '"true"'
+    ]
+
+
+@pytest.mark.parametrize('value', [['x'], {'k': 1}])
+def test_copy_field_rejects_non_scalars(value):
+    with pytest.raises(TypeError):
+        _copy_field(value)
+
+
+@pytest.mark.skipif(not os.getenv('TEST_DATABASE_URL'), reason='TEST_DATABASE_URL not set')
+def test_copy_and_insert_store_rows_identically():
+    db = Database(os.getenv('TEST_DATABASE_URL'))
+
+    with db.get_cursor() as cursor:
+        cursor.execute(
+            "CREATE TEMP TABLE copy_check (path text, empty text, missing text, marker text,"
+            " quoted text, count integer, ratio double precision, flag boolean) ON COMMIT DROP"
+        )
+        db.insert_many('copy_check', ('path',) + COLUMNS, [('insert',) + ROW], cursor=cursor)
+        db.copy_rows('copy_check', ('path',) + COLUMNS, [('copy',) + ROW], cursor=cursor)
+
+        cursor.execute(f"SELECT path, {', '.join(COLUMNS)} FROM copy_check")
+        stored = {row.pop('path'): row for row in cursor.fetchall()}
+
+    assert stored['copy'] == stored['insert']
+    assert stored['copy']['empty'] == '' and stored['copy']['missing'] is None
@@ -0,0 +1,42 @@
+"""
+Tests for scripts/record-metrics.py
+"""
+
+import importlib.util
+import os
+from unittest import mock
+
+import pytest
+
+SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'record-metrics.py')
+
+spec = importlib.util.spec_from_file_location('record_metrics', SCRIPT)
+record_metrics = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(record_metrics)
+
+
+def test_main_passes_application_to_record_scan_metrics():
+    with mock.patch.object(record_metrics, 'record_scan_metrics', return_value=True) as record:
+        with pytest.raises(SystemExit) as exit_info:
+            record_metrics.main(['f.json', '-a', 'foo'])
+
+    assert exit_info.value.code == 0
+    record.assert_called_once_with('f.json', 'foo', None)
+
+
+def test_main_reaches_the_insert_path():
+    results = {'scan_info': {'duration': 12}, 'statistics': {'high': 2, 'total': 2}}
+    db = mock.Mock()
+    db.execute_one.return_value = {'application_id': 'app-1', 'scan_id': 'scan-1'}
+
+    with mock.patch.object(record_metrics, 'load_results', return_value=results), \
+            mock.patch.object(record_metrics, 'db', db):
+        with pytest.raises(SystemExit) as exit_info:
+            record_metrics.main(['f.json', '-a', 'foo'])
+
+    assert exit_info.value.code == 0
+    assert db.execute_one.call_args.args[1] == ('foo',)
+
+    table, columns, rows = db.insert_many.call_args.args
+    assert table == 'metrics' and columns == record_metrics.METRIC_COLUMNS
+    assert {row[:2] for row in rows} == {('scan-1', 'app-1')}